@@ -20,11 +20,13 @@ from typing import BinaryIO, Optional, TextIO, Tuple
 
 # -- import whatever you need here and remove
 # -- example imports you won't use
-import librosa
 import numpy as np
-from smart_open import open  # if you use the open function, make sure you include this line!
 
 from mirdata import download_utils,  core, annotations
+from mirdata.lazy import lazy_import, open  # if you use the open function, make sure you include this line!
+
+# -- heavy dependencies are imported the first time they are used
+librosa = lazy_import("librosa")
 
 # -- Add any relevant citations here
 BIBTEX = """
@@ -150,7 +152,7 @@ class Track(core.Track):
     # -- `audio` will behave like an attribute, but it will only be loaded
     # -- when someone accesses it and it won't be stored. By default, we make
     # -- any memory heavy information (like audio) properties
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -222,7 +224,7 @@ class MultiTrack(core.MultiTrack):
         """output type: description of output"""
         return load_annotation(self.annotation_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -2,7 +2,7 @@ import argparse
 import glob
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 DATASET_INDEX_PATH = "../mirdata/datasets/indexes/dataset_index.json"
 
@@ -39,7 +39,7 @@ def make_dataset_index(dataset_data_path):
     dataset_index.update({"tracks": index_tracks})
 
     with open(DATASET_INDEX_PATH, "w") as fhandle:
-        json.dump(dataset_index, fhandle, indent=2)
+        json.dump(add_file_sizes(dataset_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
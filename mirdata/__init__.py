@@ -1,15 +1,11 @@
+import copy
 import importlib
-import os
-import pkgutil
 
+from . import registry
 from .version import version as __version__
 
-DATASETS = [
-    d.name
-    for d in pkgutil.iter_modules(
-        [os.path.dirname(os.path.abspath(__file__)) + "/datasets"]
-    )
-]
+# read from the static registry, so no dataset module is imported
+DATASETS = list(registry.load_registry().keys())
 
 
 def list_datasets():
@@ -28,18 +24,31 @@ def list_dataset_versions(dataset_name):
     """
     if dataset_name not in DATASETS:
         raise ValueError("Invalid dataset {}".format(dataset_name))
-    module = importlib.import_module("mirdata.datasets.{}".format(dataset_name))
+    info = registry.load_registry()[dataset_name]
     return "Available versions for {}: {}. Default version: {}".format(
         dataset_name,
-        [
-            x
-            for x in list(module.INDEXES.keys())
-            if x not in ["default", "sample", "test"]
-        ],
-        module.INDEXES["default"],
+        [x for x in info["indexes"].keys() if x not in ["default", "sample", "test"]],
+        info["default_version"],
     )
 
 
+def get_dataset_info(dataset_name):
+    """Get a dataset's registry entry, without importing its loader
+
+    Args:
+        dataset_name (str): the dataset's name
+
+    Returns:
+        dict: the dataset's default version, its indexes (versions) with
+        filenames, urls and checksums, and its remotes with urls, checksums and
+        sizes in bytes (None when unknown)
+
+    """
+    if dataset_name not in DATASETS:
+        raise ValueError("Invalid dataset {}".format(dataset_name))
+    return copy.deepcopy(registry.load_registry()[dataset_name])
+
+
 def initialize(dataset_name, data_home=None, version="default"):
     """Load a mirdata dataset by name
 
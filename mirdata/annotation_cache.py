@@ -0,0 +1,491 @@
+"""Persistent on-disk cache of parsed annotations
+
+Parsing JAMS, CSV, MIDI or humdrum files into annotation objects is usually
+the most expensive part of loading a track's annotations, and every process
+parses them again. When the annotation cache is enabled, the annotation objects
+returned by loaders (``BeatData``, ``ChordData``, ``F0Data``, ``MultiF0Data``,
+``NoteData``, ``KeyData``, ``SectionData``, ``LyricData``, ``TempoData`` and
+``EventData``) are stored as ``.npz`` files, and later loads of the same file
+read them back without calling the loader::
+
+    <cache_dir>/ab/ab0123...ef.npz
+
+Entries are keyed by the md5 checksum of the annotation file, the loader
+function (its name, its code and the mirdata version), the source files of the
+loader's module, ``mirdata.annotations`` and ``mirdata.io``, and the loader's
+other arguments. Editing the file, the loader, or the helpers it calls in these
+modules therefore invalidates them. Changes to other libraries (e.g. jams or
+pretty_midi) don't: clear the cache after upgrading them. Cached objects were
+validated when they were first created, so they are not validated again. The
+cache can be shared by several processes.
+
+Only loaders decorated with ``io.coerce_to_string_io`` or
+``io.coerce_to_bytes_io`` and called with the path of a local file are cached.
+
+Example:
+    .. code-block:: python
+
+        from mirdata import annotation_cache
+
+        annotation_cache.enable("/data/mirdata_annotation_cache")
+        track = mirdata.initialize("beatles").track("0111")
+        track.beats  # parsed, and stored in the cache
+        # in any later process, the same beats are read from the cache
+
+The cache can also be enabled with the ``MIRDATA_ANNOTATION_CACHE``
+environment variable, e.g. for worker processes.
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import types
+import uuid
+
+import numpy as np
+
+from mirdata import annotations
+from mirdata import validate
+from mirdata.version import version as mirdata_version
+
+CACHE_ENV_VAR = "MIRDATA_ANNOTATION_CACHE"
+
+#: Modules whose source files are part of every key, besides the loader's
+#: module: the helpers and annotation classes used by most loaders
+KEY_MODULES = ["mirdata.annotations", "mirdata.io"]
+
+#: Annotation classes which are stored in the cache
+CACHED_CLASSES = {
+    cls.__name__: cls
+    for cls in [
+        annotations.BeatData,
+        annotations.ChordData,
+        annotations.EventData,
+        annotations.F0Data,
+        annotations.KeyData,
+        annotations.LyricData,
+        annotations.MultiF0Data,
+        annotations.NoteData,
+        annotations.SectionData,
+        annotations.TempoData,
+    ]
+}
+
+
+class AnnotationCache(object):
+    """A folder of parsed annotations, keyed by file checksum and loader
+
+    Args:
+        root (str): path to the cache's folder
+
+    Attributes:
+        root (str): path to the cache's folder
+        hits (int): number of annotations read from the cache
+        misses (int): number of annotations loaded by their loader and stored
+
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self._uncached_functions = set()
+        self._annotation_functions = set()
+        self._lock = threading.Lock()
+
+    def entry_path(self, key):
+        """Get the path of a cache entry
+
+        Args:
+            key (str): the entry's key
+
+        Returns:
+            str: path to the entry's npz file
+
+        """
+        return os.path.join(self.root, key[:2], key + ".npz")
+
+    def checksum(self, file_path):
+        """Get the md5 checksum of a file, see validate.file_checksum
+
+        Args:
+            file_path (str): path to a local file
+
+        Returns:
+            str: md5 checksum of the file
+
+        """
+        return validate.file_checksum(file_path)
+
+    def _may_return_annotation(self, func):
+        """Check if a loader may return one of CACHED_CLASSES, from its return
+        type hint and its previous results
+
+        Args:
+            func (function): the loader
+
+        Returns:
+            bool: False if the loader's results are never cached
+
+        """
+        if func in self._uncached_functions:
+            return False
+        return_type = getattr(func, "__annotations__", {}).get("return")
+        if return_type is None:
+            return True
+        return any(name in str(return_type) for name in CACHED_CLASSES)
+
+    def _returns_annotation(self, func):
+        """Check if a loader is known to return one of CACHED_CLASSES, from its
+        return type hint or its previous results
+
+        Args:
+            func (function): the loader
+
+        Returns:
+            bool: False if the loader has no return type hint and hasn't been
+            called yet
+
+        """
+        if func in self._annotation_functions:
+            return True
+        return "return" in getattr(func, "__annotations__", {})
+
+    def key(self, func, file_path, args, kwargs):
+        """Get the key of a loader's result
+
+        Args:
+            func (function): the loader
+            file_path (str): path to the file passed to the loader
+            args (tuple): the loader's other positional arguments
+            kwargs (dict): the loader's keyword arguments
+
+        Returns:
+            str or None: the entry's key, or None if the arguments can't be
+            part of a key
+
+        """
+        arguments = repr(args) + repr(sorted(kwargs.items()))
+        if " at 0x" in arguments:
+            # arguments without a stable repr would never hit the cache
+            return None
+
+        key = hashlib.sha1()
+        for part in [
+            self.checksum(file_path),
+            mirdata_version,
+            func.__module__,
+            func.__qualname__,
+            arguments,
+        ] + _module_checksums(func):
+            key.update(part.encode("utf-8"))
+            key.update(b"\0")
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            _update_with_code(key, code)
+        return key.hexdigest()
+
+    def load(self, func, file_path, args, kwargs, load):
+        """Get a loader's result from the cache, or load and store it
+
+        Args:
+            func (function): the loader
+            file_path (str): path to the file passed to the loader
+            args (tuple): the loader's other positional arguments
+            kwargs (dict): the loader's keyword arguments
+            load (function): function without arguments calling the loader
+
+        Returns:
+            Any: the loader's result
+
+        """
+        if not self._may_return_annotation(func):
+            return load()
+        if not self._returns_annotation(func):
+            # check the first result of a loader without a return type hint
+            # before hashing its file: it may not be an annotation loader
+            return self._load_first(func, file_path, args, kwargs, load)
+        try:
+            key = self.key(func, file_path, args, kwargs)
+        except OSError:
+            return load()
+        if key is None:
+            return load()
+
+        entry_path = self.entry_path(key)
+        if os.path.exists(entry_path):
+            try:
+                annotation = read_annotation(entry_path)
+            except (OSError, ValueError, KeyError) as exc:
+                logging.warning(
+                    "Ignoring unreadable annotation cache entry {}: {}".format(
+                        entry_path, exc
+                    )
+                )
+            else:
+                self.hits += 1
+                return annotation
+
+        annotation = load()
+        self._store(func, entry_path, annotation)
+        return annotation
+
+    def _load_first(self, func, file_path, args, kwargs, load):
+        """Call a loader without a return type hint, and store its result if
+        it is an annotation
+
+        Args:
+            func (function): the loader
+            file_path (str): path to the file passed to the loader
+            args (tuple): the loader's other positional arguments
+            kwargs (dict): the loader's keyword arguments
+            load (function): function without arguments calling the loader
+
+        Returns:
+            Any: the loader's result
+
+        """
+        annotation = load()
+        if type(annotation).__name__ not in CACHED_CLASSES:
+            self._store(func, None, annotation)
+            return annotation
+        with self._lock:
+            self._annotation_functions.add(func)
+        try:
+            key = self.key(func, file_path, args, kwargs)
+        except OSError:
+            return annotation
+        if key is not None:
+            self._store(func, self.entry_path(key), annotation)
+        return annotation
+
+    def _store(self, func, entry_path, annotation):
+        """Store a loader's result, or remember that the loader doesn't return
+        annotations
+
+        Args:
+            func (function): the loader
+            entry_path (str or None): path of the result's entry
+            annotation (Any): the loader's result
+
+        """
+        if annotation is not None and type(annotation).__name__ not in CACHED_CLASSES:
+            # e.g. audio loaders, whose files are not worth hashing
+            with self._lock:
+                self._uncached_functions.add(func)
+        if entry_path is not None and type(annotation).__name__ in CACHED_CLASSES:
+            self.misses += 1
+            try:
+                write_annotation(entry_path, annotation)
+            except (OSError, TypeError, ValueError) as exc:
+                logging.warning(
+                    "Could not store annotation in the cache: {}".format(exc)
+                )
+
+    def clear(self):
+        """Remove all entries from the cache"""
+        if not os.path.isdir(self.root):
+            return
+        for folder in os.listdir(self.root):
+            folder_path = os.path.join(self.root, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            for filename in os.listdir(folder_path):
+                if filename.endswith(".npz"):
+                    os.remove(os.path.join(folder_path, filename))
+
+
+def _module_checksums(func):
+    """Get the md5 checksums of the source files of a loader's module and of
+    KEY_MODULES
+
+    Args:
+        func (function): the loader
+
+    Returns:
+        list: the checksums, of the modules which have a source file
+
+    """
+    checksums = []
+    for name in dict.fromkeys([func.__module__] + KEY_MODULES):
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if path is not None and os.path.isfile(path):
+            checksums.append(validate.file_checksum(path))
+    return checksums
+
+
+def _update_with_code(key, code):
+    """Update a hash with a function's code, including nested functions
+
+    Args:
+        key (hashlib.sha1): the hash
+        code (types.CodeType): the function's code object
+
+    """
+    key.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_with_code(key, const)
+        else:
+            key.update(repr(const).encode("utf-8"))
+
+
+def _encode_field(name, value, arrays):
+    """Encode an annotation attribute into npz arrays
+
+    Args:
+        name (str): the attribute's name
+        value (Any): the attribute's value
+        arrays (dict): arrays to store, updated in place
+
+    Raises:
+        TypeError: if the value can't be stored
+
+    Returns:
+        str: how the value was encoded
+
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        arrays[name] = np.array(json.dumps(value))
+        return "json"
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            arrays[name] = np.array(json.dumps(value.tolist()))
+            return "object_array"
+        arrays[name] = value
+        return "array"
+    if isinstance(value, list):
+        if all(
+            isinstance(v, list) and all(isinstance(x, float) for x in v) for v in value
+        ):
+            # ragged list of lists of floats (e.g. MultiF0Data), stored flat
+            # with lengths. Other lists are stored as json, keeping their types
+            arrays[name] = np.array([x for v in value for x in v], dtype=float).reshape(
+                -1
+            )
+            arrays[name + "/lengths"] = np.array([len(v) for v in value], dtype=int)
+            return "ragged"
+        arrays[name] = np.array(json.dumps(value))
+        return "json"
+    raise TypeError(
+        "Cannot cache the attribute {} of type {}".format(name, type(value))
+    )
+
+
+def _decode_field(name, kind, data):
+    """Decode an annotation attribute encoded by _encode_field
+
+    Args:
+        name (str): the attribute's name
+        kind (str): how the value was encoded
+        data (np.lib.npyio.NpzFile): the stored arrays
+
+    Returns:
+        Any: the attribute's value
+
+    """
+    if kind == "json":
+        return json.loads(data[name].item())
+    if kind == "object_array":
+        return np.array(json.loads(data[name].item()), dtype=object)
+    if kind == "ragged":
+        values = data[name].tolist()
+        offsets = np.cumsum(np.concatenate([[0], data[name + "/lengths"]]))
+        return [values[a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+    return data[name]
+
+
+def write_annotation(entry_path, annotation):
+    """Store an annotation object in an npz file
+
+    The file is written to a temporary path and then moved into place, so
+    concurrent readers never see a partial entry.
+
+    Args:
+        entry_path (str): path to the npz file
+        annotation (annotations.Annotation): one of CACHED_CLASSES
+
+    """
+    arrays = {}
+    fields = {
+        name: _encode_field(name, value, arrays)
+        for name, value in annotation.__dict__.items()
+    }
+    arrays["__meta__"] = np.array(
+        json.dumps({"class": type(annotation).__name__, "fields": fields})
+    )
+
+    os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+    tmp_path = "{}.{}.tmp".format(entry_path, uuid.uuid4().hex)
+    try:
+        with open(tmp_path, "wb") as fhandle:
+            np.savez(fhandle, **arrays)
+        os.replace(tmp_path, entry_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def read_annotation(entry_path):
+    """Read an annotation object stored by write_annotation, without
+    validating it again
+
+    Args:
+        entry_path (str): path to the npz file
+
+    Returns:
+        annotations.Annotation: the annotation object
+
+    """
+    with np.load(entry_path, allow_pickle=False) as data:
+        meta = json.loads(data["__meta__"].item())
+        annotation = object.__new__(CACHED_CLASSES[meta["class"]])
+        annotation.__dict__.update(
+            {
+                name: _decode_field(name, kind, data)
+                for name, kind in meta["fields"].items()
+            }
+        )
+    return annotation
+
+
+_cache = None
+
+
+def enable(cache_dir):
+    """Enable the annotation cache
+
+    Args:
+        cache_dir (str): path to the cache's folder
+
+    Returns:
+        AnnotationCache: the enabled cache
+
+    """
+    global _cache
+    _cache = AnnotationCache(cache_dir)
+    return _cache
+
+
+def disable():
+    """Disable the annotation cache"""
+    global _cache
+    _cache = None
+
+
+def get_cache():
+    """Get the enabled annotation cache
+
+    Returns:
+        AnnotationCache or None: the cache, or None if it is disabled
+
+    """
+    return _cache
+
+
+if os.environ.get(CACHE_ENV_VAR):
+    enable(os.environ[CACHE_ENV_VAR])
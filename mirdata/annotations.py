@@ -5,9 +5,11 @@ import re
 from typing import List, Optional, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-import scipy
+from mirdata.lazy import lazy_import
+
+librosa = lazy_import("librosa")
+scipy = lazy_import("scipy")
 
 # Regex pattern needed to validate chords and keys
 KEY_MODE_PATTERN = r"^N|([A-G][b#]?)(:(major|minor|ionian|dorian|phrygian|lydian|mixolydian|aeolian|locrian))?$"
@@ -0,0 +1,487 @@
+"""Read dataset files directly from zip and tar archives
+
+A dataset's ``data_home`` can be a zip archive or an uncompressed tar archive
+instead of a folder. Paths inside the archive, such as the ones returned by
+``Track.get_path``, look like ``/data/beatles.zip/audio/track.wav``, and are
+opened by ``mirdata.lazy.open`` (and therefore by every loader wrapped with
+``io.coerce_to_string_io`` or ``io.coerce_to_bytes_io``) without unpacking the
+archive.
+
+Members are found through a member table, mapping each member's name to the
+byte offset and size of its data in the archive. The table is built the first
+time an archive is opened, by reading the zip central directory or the tar
+headers once, and is stored next to the archive (``<archive>.members.json``)
+so later sessions only read the bytes of the members they load. Members which
+are stored uncompressed, which includes every member of a tar archive, are read
+in place with random access. Compressed zip members are decompressed as they
+are read, so seeking backwards in them decompresses the member again from its
+start.
+
+Up to ``MAX_OPEN_ARCHIVES`` archives are kept open, and the least recently used
+one is closed when another archive is opened.
+
+Example:
+    .. code-block:: python
+
+        dataset = mirdata.initialize("beatles", data_home="/data/beatles.zip")
+        track = dataset.track("0111")
+        beats = track.beats  # read from /data/beatles.zip/annotations/...
+
+Audio paths passed to ``io.load_audio``, ``io.load_audio_segment`` or
+``io.read_audio_info`` are also read from the archive. Loaders which pass paths
+directly to another library (rather than a file object) can't read from
+archives.
+
+"""
+
+import bz2
+import collections
+import gzip
+import io
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+
+ARCHIVE_EXTENSIONS = (".zip", ".tar")
+MEMBER_TABLE_SUFFIX = ".members.json"
+
+STORED = "stored"
+DEFLATED = "deflated"
+# any other zip compression, read through zipfile
+ZIPFILE = "zipfile"
+
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+# number of archives kept open by get_archive
+MAX_OPEN_ARCHIVES = 16
+# bytes of compressed data read at a time from deflated members
+DEFLATE_CHUNK_SIZE = 64 * 1024
+
+_archives: "collections.OrderedDict[tuple, Archive]" = collections.OrderedDict()
+_archives_lock = threading.Lock()
+
+
+def split_path(path):
+    """Split a path to an archive member into the archive's path and the
+    member's name
+
+    Args:
+        path (str): path, e.g. "/data/beatles.zip/audio/track.wav"
+
+    Returns:
+        tuple or None: (archive path, member name), or None if the path is not
+        inside an archive
+
+    """
+    if not isinstance(path, str) or not any(
+        ext + os.sep in path for ext in ARCHIVE_EXTENSIONS
+    ):
+        return None
+
+    parts = path.split(os.sep)
+    for i in range(1, len(parts)):
+        if parts[i - 1].endswith(ARCHIVE_EXTENSIONS):
+            archive_path = os.sep.join(parts[:i])
+            if os.path.isfile(archive_path):
+                return archive_path, "/".join(p for p in parts[i:] if p)
+    return None
+
+
+def is_archive_member(path):
+    """Check if a path points inside an archive
+
+    Args:
+        path (str): path
+
+    Returns:
+        bool: True if the path is inside a zip or tar archive
+
+    """
+    return split_path(path) is not None
+
+
+def _normalize(name):
+    name = name.replace("\\", "/")
+    while name.startswith("./"):
+        name = name[2:]
+    return name.lstrip("/")
+
+
+def _zip_members(path):
+    # imported here: download_utils depends on mirdata.lazy, which uses this module
+    import zipfile
+
+    from mirdata.download_utils import _zip_member_filename
+
+    members = {}
+    with zipfile.ZipFile(path, "r") as zfile, open(path, "rb") as fhandle:
+        for info in zfile.infolist():
+            if info.is_dir():
+                continue
+            fhandle.seek(info.header_offset)
+            header = _ZIP_LOCAL_HEADER.unpack(fhandle.read(_ZIP_LOCAL_HEADER.size))
+            offset = info.header_offset + _ZIP_LOCAL_HEADER.size + header[10]
+            offset += header[11]
+            if info.compress_type == zipfile.ZIP_STORED:
+                method = STORED
+            elif info.compress_type == zipfile.ZIP_DEFLATED:
+                method = DEFLATED
+            else:
+                method = ZIPFILE
+            members[_normalize(_zip_member_filename(info))] = [
+                offset,
+                info.file_size,
+                info.compress_size,
+                method,
+                info.filename,
+            ]
+    return members
+
+
+def _tar_members(path):
+    import tarfile
+
+    members = {}
+    try:
+        tfile = tarfile.open(path, "r:")
+    except tarfile.ReadError:
+        raise ValueError(
+            "{} is not an uncompressed tar archive. Compressed tar archives "
+            "can't be read with random access, and must be extracted".format(path)
+        )
+    with tfile:
+        for info in tfile:
+            if info.isfile():
+                members[_normalize(info.name)] = [
+                    info.offset_data,
+                    info.size,
+                    info.size,
+                    STORED,
+                    info.name,
+                ]
+    return members
+
+
+def build_member_table(path):
+    """Build the member table of an archive, by reading its zip central
+    directory or tar headers
+
+    Args:
+        path (str): path to a zip or uncompressed tar archive
+
+    Returns:
+        dict: {member name: [data offset, size, compressed size, method,
+        name in the archive]}
+
+    """
+    if path.endswith(".zip"):
+        return _zip_members(path)
+    return _tar_members(path)
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_member_table(path):
+    """Load the member table of an archive, from the table stored next to it
+    if it is up to date, and otherwise by building (and storing) it
+
+    Args:
+        path (str): path to a zip or uncompressed tar archive
+
+    Returns:
+        dict: the member table, see build_member_table
+
+    """
+    signature = _signature(path)
+    table_path = path + MEMBER_TABLE_SUFFIX
+    try:
+        with open(table_path, "r", encoding="utf-8") as fhandle:
+            stored = json.load(fhandle)
+        if stored["signature"] == signature:
+            return stored["members"]
+    except (IOError, ValueError, KeyError, TypeError):
+        pass
+
+    members = build_member_table(path)
+    try:
+        with open(table_path + ".tmp", "w", encoding="utf-8") as fhandle:
+            json.dump({"signature": signature, "members": members}, fhandle)
+        os.replace(table_path + ".tmp", table_path)
+    except OSError as exc:
+        logging.warning("Could not save the member table of {}: {}".format(path, exc))
+    return members
+
+
+class _MemberReader(io.RawIOBase):
+    """Read-only, seekable view of the bytes [offset, offset + size) of a file"""
+
+    def __init__(self, path, offset, size):
+        super().__init__()
+        self._fhandle = open(path, "rb")
+        self._offset = offset
+        self._size = size
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += self._size
+        if pos < 0:
+            raise ValueError("negative seek position {}".format(pos))
+        self._pos = pos
+        return self._pos
+
+    def readinto(self, buffer):
+        n_bytes = max(0, min(len(buffer), self._size - self._pos))
+        if n_bytes == 0:
+            return 0
+        self._fhandle.seek(self._offset + self._pos)
+        n_read = self._fhandle.readinto(memoryview(buffer)[:n_bytes])
+        self._pos += n_read
+        return n_read
+
+    def close(self):
+        if not self.closed:
+            self._fhandle.close()
+        super().close()
+
+
+class _DeflatedMemberReader(_MemberReader):
+    """Read-only, seekable view of a deflated zip member, decompressed as it is
+    read. Seeking backwards decompresses the member again from its start.
+    """
+
+    def __init__(self, path, offset, size, compressed_size):
+        super().__init__(path, offset, size)
+        self._compressed_size = compressed_size
+        self._reset()
+
+    def _reset(self):
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._compressed_pos = 0
+        self._decompressed_pos = 0
+
+    def _decompress(self, max_length):
+        """Decompress up to max_length bytes after _decompressed_pos
+
+        Args:
+            max_length (int): maximum number of bytes, > 0
+
+        Returns:
+            bytes: the decompressed bytes, empty at the end of the member
+
+        """
+        while True:
+            data = self._decompressor.unconsumed_tail
+            if not data and self._compressed_pos < self._compressed_size:
+                self._fhandle.seek(self._offset + self._compressed_pos)
+                data = self._fhandle.read(
+                    min(
+                        DEFLATE_CHUNK_SIZE,
+                        self._compressed_size - self._compressed_pos,
+                    )
+                )
+                self._compressed_pos += len(data)
+            decompressed = self._decompressor.decompress(data, max_length)
+            if decompressed or not data:
+                self._decompressed_pos += len(decompressed)
+                return decompressed
+
+    def readinto(self, buffer):
+        if self._pos < self._decompressed_pos:
+            self._reset()
+        while self._decompressed_pos < self._pos:
+            skipped = self._decompress(
+                min(DEFLATE_CHUNK_SIZE, self._pos - self._decompressed_pos)
+            )
+            if not skipped:
+                return 0
+
+        n_bytes = max(0, min(len(buffer), self._size - self._pos))
+        if n_bytes == 0:
+            return 0
+        data = self._decompress(n_bytes)
+        memoryview(buffer)[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+class Archive(object):
+    """A zip or uncompressed tar archive, whose members can be opened by name
+
+    Args:
+        path (str): path to the archive
+
+    Attributes:
+        path (str): path to the archive
+        members (dict): the member table, see build_member_table
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.members = load_member_table(path)
+        self._zipfile = None
+        self._lock = threading.Lock()
+
+    def _member(self, name):
+        try:
+            return self.members[_normalize(name)]
+        except KeyError:
+            raise FileNotFoundError(
+                "No such file in archive {}: {}".format(self.path, name)
+            )
+
+    def size(self, name):
+        """Get the (uncompressed) size of a member
+
+        Args:
+            name (str): the member's name
+
+        Returns:
+            int: size in bytes
+
+        """
+        return self._member(name)[1]
+
+    def open_binary(self, name):
+        """Open a member for reading in binary mode
+
+        Args:
+            name (str): the member's name
+
+        Returns:
+            file-like: a seekable binary file object
+
+        """
+        offset, size, compressed_size, method, archive_name = self._member(name)
+        if method == STORED:
+            return io.BufferedReader(_MemberReader(self.path, offset, size))
+
+        if method == DEFLATED:
+            return io.BufferedReader(
+                _DeflatedMemberReader(self.path, offset, size, compressed_size)
+            )
+
+        import zipfile
+
+        with self._lock:
+            if self._zipfile is None:
+                self._zipfile = zipfile.ZipFile(self.path, "r")
+            return self._zipfile.open(archive_name)
+
+    def close(self):
+        """Close the archive's open zip file, if any. Members which are still
+        open can still be read.
+        """
+        with self._lock:
+            zfile, self._zipfile = self._zipfile, None
+        if zfile is not None:
+            zfile.close()
+
+    def open(self, name, mode="r", encoding=None, errors=None, newline=None, **kwargs):
+        """Open a member for reading. Like smart_open, members ending with .gz
+        or .bz2 are decompressed unless compression="disable" is passed.
+
+        Args:
+            name (str): the member's name
+            mode (str): "r" or "rb"
+
+        Returns:
+            file-like: file object
+
+        """
+        if any(c in mode for c in "wax+"):
+            raise ValueError("Archive members can only be opened for reading")
+
+        fhandle = self.open_binary(name)
+        if kwargs.get("compression") != "disable":
+            if name.endswith(".gz"):
+                fhandle = gzip.GzipFile(fileobj=fhandle, mode="rb")
+            elif name.endswith(".bz2"):
+                fhandle = bz2.BZ2File(fhandle, mode="rb")
+
+        if "b" in mode:
+            return fhandle
+        return io.TextIOWrapper(
+            fhandle, encoding=encoding, errors=errors, newline=newline
+        )
+
+
+def get_archive(path):
+    """Get the Archive at path, reusing it while the archive is unchanged.
+    The MAX_OPEN_ARCHIVES most recently used archives are kept open.
+
+    Args:
+        path (str): path to the archive
+
+    Returns:
+        Archive: the archive
+
+    """
+    key = (path, tuple(_signature(path)))
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is not None:
+            _archives.move_to_end(key)
+            return archive
+
+    archive = Archive(path)
+    evicted = []
+    with _archives_lock:
+        archive = _archives.setdefault(key, archive)
+        _archives.move_to_end(key)
+        while len(_archives) > MAX_OPEN_ARCHIVES:
+            evicted.append(_archives.popitem(last=False)[1])
+    for old_archive in evicted:
+        old_archive.close()
+    return archive
+
+
+def member_size(path):
+    """Get the size of a file inside an archive
+
+    Args:
+        path (str): path to the member, e.g. "/data/beatles.zip/audio/track.wav"
+
+    Raises:
+        FileNotFoundError: if the member is not in the archive
+
+    Returns:
+        int: size in bytes
+
+    """
+    archive_path, name = split_path(path)
+    return get_archive(archive_path).size(name)
+
+
+def open_member(path, mode="r", **kwargs):
+    """Open a file inside an archive
+
+    Args:
+        path (str): path to the member, e.g. "/data/beatles.zip/audio/track.wav"
+        mode (str): "r" or "rb"
+        **kwargs: passed to Archive.open
+
+    Returns:
+        file-like: file object
+
+    """
+    archive_path, name = split_path(path)
+    return get_archive(archive_path).open(name, mode, **kwargs)
@@ -0,0 +1,352 @@
+"""Compact, memory-mapped binary indexes
+
+A compact index stores the same information as a mirdata JSON index (track ids,
+relative paths, md5 checksums, optional sizes and multitrack membership) in a columnar binary
+file which is memory-mapped and decoded lazily. Looking up a single track only
+touches the rows it needs, so initializing very large datasets neither parses
+the full JSON file nor builds a Python dictionary per track.
+
+Compact indexes are created from JSON indexes with ``convert`` and are picked up
+automatically by ``core.Dataset`` when they live next to the JSON index (same
+filename with the ``.mirdx`` extension).
+
+File layout (all integers little endian)::
+
+    magic (8 bytes) | header length (uint64) | JSON header | padding | arrays
+
+The header stores the version, the (small) metadata table, any extra top level
+keys, and the byte offset, dtype and length of every array.
+
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+from collections.abc import ItemsView, Mapping
+
+import numpy as np
+
+MAGIC = b"MIRDX\x00\x01\x00"
+COMPACT_INDEX_EXTENSION = ".mirdx"
+GROUPS = ["tracks", "multitracks"]
+MEMBERS_KEY = "tracks"
+_ALIGNMENT = 8
+_HEADER_LEN = struct.Struct("<Q")
+
+
+def compact_path(index_path):
+    """Get the path of the compact index corresponding to a JSON index
+
+    Args:
+        index_path (str): path to a JSON index
+
+    Returns:
+        str: path to the compact index
+
+    """
+    return os.path.splitext(index_path)[0] + COMPACT_INDEX_EXTENSION
+
+
+class _StringPool(object):
+    """Deduplicated table of strings built while converting an index"""
+
+    def __init__(self):
+        self.lookup = {}
+        self.strings = []
+
+    def add(self, value):
+        if value is None:
+            return -1
+        if not isinstance(value, str):
+            raise ValueError(
+                "Compact indexes can only store strings, got {}".format(value)
+            )
+        if value not in self.lookup:
+            self.lookup[value] = len(self.strings)
+            self.strings.append(value)
+        return self.lookup[value]
+
+    def to_arrays(self):
+        encoded = [s.encode("utf-8") for s in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(e) for e in encoded], dtype=np.int64)
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return blob, offsets
+
+
+def _build_group(group_name, group, pool):
+    """Build the columnar arrays of a tracks or multitracks table"""
+    ids = []
+    entry_offsets = [0]
+    entries = []
+    sizes = []
+    member_offsets = [0]
+    members = []
+    for item_id, files in group.items():
+        ids.append(pool.add(item_id))
+        for key, value in files.items():
+            if key == MEMBERS_KEY and group_name == "multitracks":
+                members.extend(pool.add(m) for m in value)
+                continue
+            if not isinstance(value, (list, tuple)) or len(value) not in [2, 3]:
+                raise ValueError(
+                    "Index entry {}/{}/{} should be [path, checksum] or "
+                    "[path, checksum, size]".format(group_name, item_id, key)
+                )
+            entries.append([pool.add(key), pool.add(value[0]), pool.add(value[1])])
+            sizes.append(value[2] if len(value) == 3 and value[2] is not None else -1)
+        entry_offsets.append(len(entries))
+        member_offsets.append(len(members))
+
+    ids_array = np.array(ids, dtype=np.int32)
+    sorted_ids = sorted(range(len(ids)), key=lambda i: pool.strings[ids[i]])
+    arrays = {
+        "ids": ids_array,
+        "sorted": np.array(sorted_ids, dtype=np.int32),
+        "entry_offsets": np.array(entry_offsets, dtype=np.int32),
+        "entries": np.array(entries, dtype=np.int32).reshape(-1, 3),
+        "sizes": np.array(sizes, dtype=np.int64),
+    }
+    if group_name == "multitracks":
+        arrays["member_offsets"] = np.array(member_offsets, dtype=np.int32)
+        arrays["members"] = np.array(members, dtype=np.int32)
+    return arrays
+
+
+def write(index, output_path):
+    """Write an index dictionary to a compact index file
+
+    Args:
+        index (dict): a mirdata index, as loaded from a JSON index file
+        output_path (str): path to write the compact index to
+
+    Raises:
+        ValueError: if the index contains entries which are not
+            [path, checksum] or [path, checksum, size] lists
+
+    """
+    pool = _StringPool()
+    arrays = {}
+    groups = []
+    for group_name in GROUPS:
+        if index.get(group_name) is None:
+            continue
+        groups.append(group_name)
+        for name, array in _build_group(group_name, index[group_name], pool).items():
+            arrays["{}.{}".format(group_name, name)] = array
+    arrays["strings"], arrays["string_offsets"] = pool.to_arrays()
+
+    header = {
+        "version": index.get("version"),
+        "metadata": index.get("metadata"),
+        "groups": groups,
+        "extra": {
+            k: v
+            for k, v in index.items()
+            if k not in GROUPS and k not in ["version", "metadata"]
+        },
+        "arrays": {},
+    }
+
+    # array offsets are relative to the start of the data section
+    offset = 0
+    for name, array in arrays.items():
+        header["arrays"][name] = [offset, array.dtype.str, list(array.shape)]
+        offset += array.nbytes
+        offset += -offset % _ALIGNMENT
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = len(MAGIC) + _HEADER_LEN.size + len(header_bytes)
+    padding = -data_start % _ALIGNMENT
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as fhandle:
+        fhandle.write(MAGIC)
+        fhandle.write(_HEADER_LEN.pack(len(header_bytes) + padding))
+        fhandle.write(header_bytes)
+        fhandle.write(b" " * padding)
+        for array in arrays.values():
+            fhandle.write(array.tobytes())
+            fhandle.write(b"\x00" * (-array.nbytes % _ALIGNMENT))
+    os.replace(tmp_path, output_path)
+
+
+def convert(index_path, output_path=None):
+    """Convert a JSON index to a compact index
+
+    Args:
+        index_path (str): path to the JSON index
+        output_path (str or None): where to save the compact index. If None,
+            it is saved next to the JSON index with the ``.mirdx`` extension.
+
+    Returns:
+        str: path to the compact index
+
+    """
+    if output_path is None:
+        output_path = compact_path(index_path)
+    with open(index_path, encoding="utf-8") as fhandle:
+        index = json.load(fhandle)
+    write(index, output_path)
+    return output_path
+
+
+class CompactIndex(Mapping):
+    """Read-only, memory-mapped view of a compact index
+
+    Behaves like the dictionary loaded from a JSON index: ``index["tracks"]``
+    is a mapping from track id to ``{key: [path, checksum]}`` (or
+    ``[path, checksum, size]`` for files with a size in the index), and
+    ``index["multitracks"]`` additionally lists the multitrack's ``"tracks"``.
+    Rows are decoded on access.
+
+    Args:
+        path (str): path to a compact index file
+
+    Attributes:
+        path (str): path to the compact index file
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as fhandle:
+            if fhandle.read(len(MAGIC)) != MAGIC:
+                raise ValueError("{} is not a compact mirdata index".format(path))
+            (header_len,) = _HEADER_LEN.unpack(fhandle.read(_HEADER_LEN.size))
+            header = json.loads(fhandle.read(header_len).decode("utf-8"))
+            self._buffer = mmap.mmap(fhandle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data_start = len(MAGIC) + _HEADER_LEN.size + header_len
+        self._arrays = {}
+        for name, (offset, dtype, shape) in header["arrays"].items():
+            count = int(np.prod(shape))
+            if count == 0:
+                self._arrays[name] = np.zeros(shape, dtype=np.dtype(dtype))
+                continue
+            self._arrays[name] = np.frombuffer(
+                self._buffer,
+                dtype=np.dtype(dtype),
+                count=count,
+                offset=data_start + offset,
+            ).reshape(shape)
+        self._strings = self._arrays["strings"]
+        self._string_offsets = self._arrays["string_offsets"]
+
+        self._items = {"version": header["version"]}
+        if header["metadata"] is not None:
+            self._items["metadata"] = header["metadata"]
+        self._items.update(header["extra"])
+        for group_name in header["groups"]:
+            self._items[group_name] = _CompactGroup(self, group_name)
+
+    def _string(self, idx):
+        if idx < 0:
+            return None
+        start, end = self._string_offsets[idx], self._string_offsets[idx + 1]
+        return self._strings[start:end].tobytes().decode("utf-8")
+
+    def __getitem__(self, key):
+        return self._items[key]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return "CompactIndex({})".format(self.path)
+
+
+class _CompactGroup(Mapping):
+    """Lazily decoded tracks or multitracks table of a CompactIndex"""
+
+    def __init__(self, compact_index, group_name):
+        self._index = compact_index
+        self._ids = compact_index._arrays["{}.ids".format(group_name)]
+        self._sorted = compact_index._arrays["{}.sorted".format(group_name)]
+        self._entry_offsets = compact_index._arrays[
+            "{}.entry_offsets".format(group_name)
+        ]
+        self._entries = compact_index._arrays["{}.entries".format(group_name)]
+        # compact indexes written before sizes were supported have no sizes array
+        self._sizes = compact_index._arrays.get("{}.sizes".format(group_name))
+        self._member_offsets = compact_index._arrays.get(
+            "{}.member_offsets".format(group_name)
+        )
+        self._members = compact_index._arrays.get("{}.members".format(group_name))
+        self._sorted_ids = _SortedIds(self)
+
+    def _row(self, item_id):
+        if not isinstance(item_id, str):
+            return None
+        pos = bisect.bisect_left(self._sorted_ids, item_id)
+        if pos < len(self._sorted) and self._sorted_ids[pos] == item_id:
+            return int(self._sorted[pos])
+        return None
+
+    def _decode_row(self, row):
+        string = self._index._string
+        files = {}
+        start, end = self._entry_offsets[row], self._entry_offsets[row + 1]
+        for pos, (key, path, checksum) in enumerate(
+            self._entries[start:end], start=start
+        ):
+            files[string(key)] = [string(path), string(checksum)]
+            if self._sizes is not None and self._sizes[pos] >= 0:
+                files[string(key)].append(int(self._sizes[pos]))
+        if self._members is not None:
+            files[MEMBERS_KEY] = [
+                string(m)
+                for m in self._members[
+                    self._member_offsets[row] : self._member_offsets[row + 1]
+                ]
+            ]
+        return files
+
+    def __contains__(self, item_id):
+        return self._row(item_id) is not None
+
+    def __getitem__(self, item_id):
+        row = self._row(item_id)
+        if row is None:
+            raise KeyError(item_id)
+        return self._decode_row(row)
+
+    def __iter__(self):
+        string = self._index._string
+        for idx in self._ids:
+            yield string(idx)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def items(self):
+        return _CompactItems(self)
+
+
+class _CompactItems(ItemsView):
+    """Items view which decodes rows in order without id lookups"""
+
+    def __iter__(self):
+        group = self._mapping
+        string = group._index._string
+        for row, idx in enumerate(group._ids):
+            yield string(idx), group._decode_row(row)
+
+
+class _SortedIds(object):
+    """Sequence of ids in sorted order, decoded on demand for binary search"""
+
+    def __init__(self, group):
+        self._group = group
+
+    def __getitem__(self, pos):
+        group = self._group
+        return group._index._string(group._ids[group._sorted[pos]])
+
+    def __len__(self):
+        return len(self._group._sorted)
@@ -1,18 +1,32 @@
 """Core mirdata classes"""
 
+import collections
+import concurrent.futures
+import copy
+import functools
 import json
+import logging
 import os
 import random
+import threading
+import time
 import types
+from collections.abc import Mapping
 from typing import Any, List, Optional
 
 import numpy as np
-from smart_open import open
+import tqdm
 
+from mirdata import compact_index
 from mirdata import download_utils
+from mirdata import io
+from mirdata import store as content_store
 from mirdata import validate
+from mirdata.lazy import open
 
 MAX_STR_LEN = 100
+PRELOAD_BACKENDS = ("thread", "process")
+AUDIO_INFO_FILENAME = ".mirdata_audio_info.npz"
 DOCS_URL = "https://mirdata.readthedocs.io/en/stable/source/mirdata.html"
 DISCLAIMER = """
 ******************************************************************************************
@@ -67,12 +81,452 @@ def docstring_inherit(parent):
     return inherit
 
 
+##### Shared registry #####
+
+
+class ReadOnlyDict(dict):
+    """A dict which can't be modified, for the indexes and metadata shared by
+    Dataset instances
+
+    Reading works as with a dict, and copies (``dict(d)``, ``copy.copy`` or
+    ``copy.deepcopy``) are ordinary, modifiable dicts. Modifying it raises a
+    TypeError.
+
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "This dictionary is shared by every instance of the dataset and "
+            "can't be modified. Modify a copy, e.g. copy.deepcopy(...), instead."
+        )
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+def freeze(value):
+    """Make the dicts in a value read-only, recursively
+
+    Args:
+        value (Any): a value, e.g. a dataset's metadata
+
+    Returns:
+        Any: the value, with every dict (including the dicts in lists and
+        tuples) replaced by a ReadOnlyDict
+
+    """
+    if isinstance(value, dict) and not isinstance(value, ReadOnlyDict):
+        return ReadOnlyDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [freeze(item) for item in value]
+    if isinstance(value, tuple) and type(value) is tuple:
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class SharedRegistry(object):
+    """Bounded registry of parsed indexes and metadata, shared by Dataset instances
+
+    Initializing the same dataset several times in one process (e.g. with
+    ``mirdata.initialize``) reuses the index and metadata parsed by the first
+    instance instead of parsing them again. Entries are keyed by the index path,
+    the index file's modification time and (for metadata) the data_home, so
+    rewriting an index file automatically invalidates its entries. The least
+    recently used entries are dropped once ``maxsize`` entries are stored.
+
+    Entries are shared, not copied, so Dataset stores them as read-only dicts
+    (see ReadOnlyDict): a change made through one instance would otherwise
+    show up in every other instance.
+
+    Attributes:
+        maxsize (int): maximum number of stored entries. 0 disables sharing.
+
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, load):
+        """Get an entry, loading and storing it if it is not in the registry
+
+        Args:
+            key (tuple): (kind, index_path, mtime, data_home)
+            load (function): function without arguments returning the entry
+
+        Returns:
+            Any: the stored or newly loaded entry
+
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        # load outside the lock so slow parsing does not block other datasets
+        value = load()
+
+        with self._lock:
+            if self.maxsize <= 0:
+                return value
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, index_path=None, data_home=None):
+        """Remove entries from the registry
+
+        Args:
+            index_path (str or None): if given, only remove entries of this index
+            data_home (str or None): if given, only remove entries of this data_home
+
+        """
+        with self._lock:
+            for key in list(self._entries.keys()):
+                _, key_index_path, _, key_data_home = key
+                if index_path is not None and key_index_path != index_path:
+                    continue
+                if data_home is not None and key_data_home != data_home:
+                    continue
+                del self._entries[key]
+
+    def clear(self):
+        """Remove all entries from the registry"""
+        self.invalidate()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+shared_registry = SharedRegistry()
+
+
+##### Audio cache #####
+
+
+class AudioCache(object):
+    """Process-wide LRU cache of decoded audio, bounded by a byte budget
+
+    Audio properties decorated with ``audio_property`` are decoded on every
+    access unless this cache has a budget. With a budget, decoded audio is kept
+    across Track objects until the least recently used entries must be evicted
+    to stay within ``max_bytes``. Cached arrays are made read-only, since they
+    are shared by every access.
+
+    Attributes:
+        max_bytes (int): byte budget. 0 (the default) disables the cache.
+        nbytes (int): bytes currently stored
+        hits (int): number of accesses served from the cache
+        misses (int): number of accesses which decoded the audio
+        evictions (int): number of entries evicted to stay within the budget
+
+    Examples:
+        .. code-block:: python
+
+            mirdata.core.audio_cache.resize(4 * 1024**3)  # keep up to 4 GB of audio
+            for epoch in range(n_epochs):
+                for track in tracks.values():
+                    audio, sr = track.audio  # only decoded once, if it fits
+            print(mirdata.core.audio_cache.stats())
+
+    """
+
+    def __init__(self, max_bytes=0):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, load):
+        """Get decoded audio, loading and storing it if it is not in the cache
+
+        Args:
+            key (tuple): the audio's key, see audio_property
+            load (function): function without arguments decoding the audio
+
+        Returns:
+            Any: the stored or newly decoded audio
+
+        """
+        if self.max_bytes <= 0:
+            return load()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+
+        # decode outside the lock so tracks are decoded concurrently
+        value = load()
+        size = _audio_nbytes(value)
+
+        with self._lock:
+            self.misses += 1
+            if value is None or size > self.max_bytes:
+                return value
+            if key in self._entries:
+                return self._entries[key][0]
+            _make_read_only(value)
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            self._evict()
+        return value
+
+    def _evict(self):
+        # must be called with the lock held
+        while self.nbytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.nbytes -= size
+            self.evictions += 1
+
+    def resize(self, max_bytes):
+        """Change the byte budget, evicting entries if needed
+
+        Args:
+            max_bytes (int): new byte budget. 0 disables the cache.
+
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Remove all entries from the cache"""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Get the cache's counters
+
+        Returns:
+            dict: hits, misses, evictions, entries, nbytes and max_bytes
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _audio_nbytes(value):
+    """Get the number of bytes of the arrays in decoded audio
+
+    Args:
+        value (Any): decoded audio, usually a tuple (np.ndarray, sample rate)
+
+    Returns:
+        int: total size of the arrays in bytes
+
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_audio_nbytes(v) for v in value)
+    return 0
+
+
+def _make_read_only(value):
+    """Make the arrays in decoded audio read-only
+
+    Args:
+        value (Any): decoded audio, usually a tuple (np.ndarray, sample rate)
+
+    """
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _make_read_only(v)
+
+
+audio_cache = AudioCache()
+
+
+class audio_property(property):
+    """Audio property decorator
+
+    A read-only property whose value is stored in the process-wide
+    ``audio_cache``, keyed by the track's class, data_home, id, index paths and
+    the property name. It behaves like ``property`` while the cache is disabled.
+
+    """
+
+    def __init__(self, func):
+        super().__init__(func, doc=getattr(func, "__doc__"))
+        self._func = func
+
+    def __get__(self, obj: Any, cls: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        if audio_cache.max_bytes <= 0:
+            return self._func(obj)
+        return audio_cache.get(
+            _audio_key(obj, self._func.__name__), functools.partial(self._func, obj)
+        )
+
+
+def _audio_key(obj, name):
+    """Get the audio_cache key of an audio property
+
+    Args:
+        obj (Track or MultiTrack): the track
+        name (str): the property's name
+
+    Returns:
+        tuple: the key
+
+    """
+    # the index paths tell apart tracks with the same id in different versions
+    paths = obj.__dict__.get("_multitrack_paths", obj.__dict__.get("_track_paths"))
+    return (
+        type(obj).__module__,
+        type(obj).__qualname__,
+        name,
+        obj.__dict__.get("_data_home"),
+        obj.__dict__.get("mtrack_id", obj.__dict__.get("track_id")),
+        repr(sorted(paths.items())) if paths is not None else None,
+    )
+
+
 ##### Core Classes #####
 
 
+class TrackCollection(Mapping):
+    """Read-only mapping from track (or multitrack) ids to Track objects,
+    which are only created when they are accessed.
+
+    It behaves like the dictionary previously returned by
+    ``Dataset.load_tracks``, but creating it is O(1): no Track is instantiated
+    until it is looked up, and each one is created at most once.
+
+    Args:
+        ids (list): the ids in the collection, in order
+        factory (function): function creating the Track object of an id
+        lookup (container or None): container of ids supporting fast
+            membership tests, e.g. the index's tracks. If None, a set of ids
+            is built on the first membership test.
+
+    Examples:
+        .. code-block:: python
+
+            tracks = dataset.load_tracks()  # no Track is created yet
+            track = tracks["some_id"]  # only this Track is created
+            first_ten = tracks[:10]
+            vocals = tracks.filter(lambda track_id: "vocals" in track_id)
+
+    """
+
+    def __init__(self, ids, factory, lookup=None):
+        self._ids = ids
+        self._factory = factory
+        self._lookup = lookup
+        self._tracks = {}
+
+    def __contains__(self, track_id):
+        if self._lookup is None:
+            self._lookup = frozenset(self._ids)
+        return track_id in self._lookup
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return TrackCollection(self._ids[key], self._factory)
+        track = self._tracks.get(key)
+        if track is None:
+            if key not in self:
+                raise KeyError(key)
+            track = self._tracks[key] = self._factory(key)
+        return track
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return "TrackCollection({} items, {} loaded)".format(
+            len(self), len(self._tracks)
+        )
+
+    def select(self, ids):
+        """Get the collection of a subset of ids
+
+        Args:
+            ids (list): ids in this collection
+
+        Raises:
+            KeyError: if an id is not in this collection
+
+        Returns:
+            TrackCollection: a collection of these ids, in the given order
+
+        """
+        ids = list(ids)
+        unknown = [i for i in ids if i not in self]
+        if unknown:
+            raise KeyError("Ids {} are not in this collection".format(unknown))
+        return TrackCollection(ids, self._factory)
+
+    def filter(self, function):
+        """Get the collection of the ids for which function returns True
+
+        Args:
+            function (function): function of an id, returning a bool
+
+        Returns:
+            TrackCollection: a collection of the selected ids
+
+        """
+        return TrackCollection([i for i in self._ids if function(i)], self._factory)
+
+    def copy(self):
+        """Load every item, as a dictionary
+
+        Returns:
+            dict: {id: track}
+
+        """
+        return dict(self.items())
+
+
 class Dataset(object):
     """mirdata Dataset class
 
+    The parsed index and metadata are shared by every instance of the same
+    dataset version (see SharedRegistry), and are read-only: copy them to
+    modify them.
+
     Attributes:
         data_home (str): path where mirdata will look for the dataset
         version (str):
@@ -102,7 +556,10 @@ class Dataset(object):
         """Dataset init method
 
         Args:
-            data_home (str or None): path where mirdata will look for the dataset
+            data_home (str or None): path where mirdata will look for the dataset.
+                This can also be a zip or uncompressed tar archive of the
+                dataset, whose files are then read without unpacking it (see
+                mirdata.archive)
             version (str): dataset version
             name (str or None): the identifier of the dataset
             track_class (mirdata.core.Track or None): a Track class
@@ -138,12 +595,29 @@ class Dataset(object):
         self._license_info = license_info
         self.readme = "{}#module-mirdata.datasets.{}".format(DOCS_URL, self.name)
 
-        # this is a hack to be able to have dataset-specific docstrings
-        self.track = lambda track_id: self._track(track_id)
+        # this is a hack to be able to have dataset-specific docstrings.
+        # partial objects (unlike lambdas) can be pickled
+        self.track = functools.partial(self._track)
         self.track.__doc__ = self._track_class.__doc__  # set the docstring
-        self.multitrack = lambda mtrack_id: self._multitrack(mtrack_id)
+        self.multitrack = functools.partial(self._multitrack)
         self.multitrack.__doc__ = self._multitrack_class.__doc__  # set the docstring
 
+    def __reduce_ex__(self, protocol):
+        # loaders are pickled by reference to their class, data_home and
+        # version, without the parsed index or metadata, which are loaded
+        # again (once per process) when they are used
+        if type(self).__module__.startswith("mirdata.datasets."):
+            return (type(self), (self.data_home, self.version))
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self):
+        # don't pickle the values of cached properties, such as the index
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if not isinstance(getattr(type(self), key, None), cached_property)
+        }
+
     def __repr__(self):
         repr_string = "The {} dataset\n".format(self.name)
         repr_string += "-" * MAX_STR_LEN
@@ -164,9 +638,22 @@ class Dataset(object):
 
     @cached_property
     def _index(self):
+        # prefer a compact index next to the json index, unless it is out of date
+        compact_path = compact_index.compact_path(self.index_path)
+        if os.path.exists(compact_path) and (
+            not os.path.exists(self.index_path)
+            or os.path.getmtime(compact_path) >= os.path.getmtime(self.index_path)
+        ):
+            return shared_registry.get(
+                ("index", self.index_path, os.stat(compact_path).st_mtime_ns, None),
+                lambda: compact_index.CompactIndex(compact_path),
+            )
+
         try:
-            with open(self.index_path, encoding="utf-8") as fhandle:
-                index = json.load(fhandle)
+            index = shared_registry.get(
+                ("index", self.index_path, os.stat(self.index_path).st_mtime_ns, None),
+                self._load_json_index,
+            )
         except FileNotFoundError:
             if self._index_data.remote:
                 raise FileNotFoundError(
@@ -179,10 +666,33 @@ class Dataset(object):
 
         return index
 
+    def _load_json_index(self):
+        with open(self.index_path, encoding="utf-8") as fhandle:
+            return json.load(fhandle, object_hook=ReadOnlyDict)
+
     @cached_property
     def _metadata(self):
         return None
 
+    def _get_metadata(self):
+        """Get the dataset's metadata, sharing it with other instances of this
+        dataset version and data_home through the shared registry.
+
+        Returns:
+            dict or None: the dataset's metadata
+
+        """
+        if "_metadata" not in self.__dict__:
+            try:
+                mtime = os.stat(self.index_path).st_mtime_ns
+            except OSError:
+                mtime = None
+            self.__dict__["_metadata"] = shared_registry.get(
+                ("metadata", self.index_path, mtime, self.data_home),
+                lambda: freeze(type(self)._metadata.func(self)),
+            )
+        return self.__dict__["_metadata"]
+
     @property
     def default_path(self):
         """Get the default path for the dataset
@@ -210,7 +720,7 @@ class Dataset(object):
             raise AttributeError("This dataset does not have tracks")
         else:
             return self._track_class(
-                track_id, self.data_home, self.name, self._index, lambda: self._metadata
+                track_id, self.data_home, self.name, self._index, self._get_metadata
             )
 
     def _multitrack(self, mtrack_id):
@@ -234,34 +744,42 @@ class Dataset(object):
                 self.name,
                 self._index,
                 self._track_class,
-                lambda: self._metadata,
+                self._get_metadata,
             )
 
     def load_tracks(self):
-        """Load all tracks in the dataset
+        """Load all tracks in the dataset. Tracks are created lazily, when
+        they are accessed.
 
         Returns:
-            dict:
+            TrackCollection:
                 {`track_id`: track data}
 
         Raises:
-            NotImplementedError: If the dataset does not support Tracks
+            AttributeError: If the dataset does not support Tracks
 
         """
-        return {track_id: self.track(track_id) for track_id in self.track_ids}
+        if self._track_class is None:
+            raise AttributeError("This dataset does not have tracks")
+        return TrackCollection(self.track_ids, self.track, lookup=self._index["tracks"])
 
     def load_multitracks(self):
-        """Load all multitracks in the dataset
+        """Load all multitracks in the dataset. Multitracks are created
+        lazily, when they are accessed.
 
         Returns:
-            dict:
+            TrackCollection:
                 {`mtrack_id`: multitrack data}
 
         Raises:
-            NotImplementedError: If the dataset does not support Multitracks
+            AttributeError: If the dataset does not support Multitracks
 
         """
-        return {mtrack_id: self.multitrack(mtrack_id) for mtrack_id in self.mtrack_ids}
+        if self._multitrack_class is None:
+            raise AttributeError("This dataset does not have multitracks")
+        return TrackCollection(
+            self.mtrack_ids, self.multitrack, lookup=self._index["multitracks"]
+        )
 
     def choice_track(self):
         """Choose a random track
@@ -430,6 +948,11 @@ class Dataset(object):
         force_overwrite=False,
         cleanup=False,
         allow_invalid_checksum=False,
+        max_workers=1,
+        stream=False,
+        indexed_only=False,
+        track_ids=None,
+        store=None,
     ):
         """Download data to `save_dir` and optionally print a message.
 
@@ -445,12 +968,40 @@ class Dataset(object):
                 Allow invalid checksums of the downloaded data. Useful sometimes behind some
                 proxies that inspection the downloaded data. When having a different checksum
                 promts a warn instead of raising an exception
+            max_workers (int):
+                Maximum number of remotes downloaded concurrently, each with its
+                own progress bar. Archives are extracted as soon as their
+                download finishes, with up to max_workers zip members extracted
+                concurrently.
+            stream (bool):
+                If True, tar archives are extracted as they download, without
+                being written to disk. This halves the disk space and I/O
+                needed, but archives are downloaded again on every call.
+            indexed_only (bool):
+                If True, only the archive members referenced by this version's
+                index are extracted, e.g. to skip the tracks of other versions
+                which share the same archives.
+            track_ids (list or None):
+                If given, only the files of these track (or multitrack) ids and
+                the metadata files are extracted from the archives. Implies
+                indexed_only.
+            store (str, store.ContentStore or None):
+                If given, a content store (or the path to one) where files are
+                kept once by checksum. Indexed files already in the store are
+                linked into data_home instead of being extracted, and nothing
+                is downloaded if all of them are. Downloaded files are then
+                added to the store. Implies indexed_only.
 
         Raises:
-            ValueError: if invalid keys are passed to partial_download
+            ValueError: if invalid keys are passed to partial_download, or
+                track_ids are not in the index
             IOError: if a downloaded file's checksum is different from expected
 
         """
+        content_store, missing = self._link_from_store(store, track_ids)
+        if missing is not None and not missing:
+            return
+
         download_utils.downloader(
             self.data_home,
             remotes=self.remotes,
@@ -460,7 +1011,69 @@ class Dataset(object):
             force_overwrite=force_overwrite,
             cleanup=cleanup,
             allow_invalid_checksum=allow_invalid_checksum,
+            max_workers=max_workers,
+            stream=stream,
+            extract_paths=self._extract_paths(indexed_only, track_ids, missing),
+        )
+
+        if content_store is not None:
+            content_store.add_files(missing, self.data_home)
+
+    def _download_index(self):
+        """Download the index if it is remote and not downloaded yet"""
+        if self._index_data.remote and not os.path.exists(self.index_path):
+            download_utils.downloader(
+                self.data_home, index=self._index_data, partial_download=["index"]
+            )
+
+    def _extract_paths(self, indexed_only, track_ids, missing=None):
+        """Get the paths to extract from the downloaded archives, downloading
+        the index first if it is remote and needed
+
+        Args:
+            indexed_only (bool): if True, only extract the indexed files
+            track_ids (list or None): if given, only extract these tracks' files
+            missing (dict or None): if given, only extract these files, which
+                are not in the content store
+
+        Returns:
+            set or None: paths relative to data_home, or None to extract all
+
+        """
+        if missing is not None:
+            return set(missing)
+        if not indexed_only and track_ids is None:
+            return None
+        self._download_index()
+        return download_utils.index_file_paths(self._index, track_ids)
+
+    def _link_from_store(self, store, track_ids):
+        """Link the indexed files which are in a content store into data_home
+
+        Args:
+            store (str, store.ContentStore or None): the content store
+            track_ids (list or None): if given, only link these tracks' files
+
+        Returns:
+            * store.ContentStore or None - the content store
+            * dict or None - the files which are not in the store, and must be
+              downloaded, or None if there is no store
+
+        """
+        if store is None:
+            return None, None
+        if not isinstance(store, content_store.ContentStore):
+            store = content_store.ContentStore(store)
+
+        self._download_index()
+        files = download_utils.index_files(self._index, track_ids)
+        missing = store.link_files(files, self.data_home)
+        logging.warning(
+            "{} of {} files linked from the content store {}".format(
+                len(files) - len(missing), len(files), store.root
+            )
         )
+        return store, missing
 
     @cached_property
     def track_ids(self):
@@ -486,22 +1099,255 @@ class Dataset(object):
             raise AttributeError("This dataset does not have multitracks")
         return list(self._index["multitracks"].keys())
 
-    def validate(self, verbose=True):
+    def validate(
+        self,
+        verbose=True,
+        workers=1,
+        force=False,
+        mode="full",
+        sample_fraction=0.1,
+        store=None,
+    ):
         """Validate if the stored dataset is a valid version
 
+        After a successful full validation of a local folder, the checksums
+        are written to a manifest file, ``.mirdata_manifest.json``, in
+        ``data_home``, with each file's size, mtime and inode. Later calls only
+        hash files whose size, mtime or inode changed. Validations which find
+        missing or invalid files don't write or update the manifest. When
+        ``data_home`` is an archive, every file is hashed.
+
         Args:
             verbose (bool): If False, don't print output
+            workers (int): number of files hashed concurrently. Hashing runs in
+                threads, so values above 1 help most on many-core machines and
+                network filesystems.
+            force (bool): If True, ignore the manifest and hash every file
+            mode (str): "full" (default) hashes every file. "quick" never reads
+                file contents: it checks that files exist and, when the index
+                stores sizes, that they have the right size. "sample" hashes a
+                random ``sample_fraction`` of the files and checks the size of
+                the others. "quick" and "sample" do not use the manifest, and
+                need a local ``data_home``.
+            sample_fraction (float): fraction of the files hashed in "sample" mode
+            store (str, store.ContentStore or None): if given, files which are
+                links to verified, unchanged blobs of this content store are
+                not hashed
 
         Returns:
             * list - files in the index but are missing locally
             * list - files which have an invalid checksum
 
         """
+        manifest = None
+        if (
+            mode == "full"
+            and validate.is_local(self.data_home)
+            and not os.path.isfile(self.data_home)
+        ):
+            manifest = {} if force else validate.load_manifest(self.data_home)
+            if store is not None and not force:
+                if not isinstance(store, content_store.ContentStore):
+                    store = content_store.ContentStore(store)
+                files = download_utils.index_files(self._index)
+                manifest.update(store.trusted_manifest(files, self.data_home))
+
         missing_files, invalid_checksums = validate.validator(
-            self._index, self.data_home, verbose=verbose
+            self._index,
+            self.data_home,
+            verbose=verbose,
+            workers=workers,
+            manifest=manifest,
+            mode=mode,
+            sample_fraction=sample_fraction,
         )
+
+        valid = not any(missing_files.values()) and not any(invalid_checksums.values())
+        if valid and manifest is not None and os.path.isdir(self.data_home):
+            validate.save_manifest(self.data_home, manifest)
         return missing_files, invalid_checksums
 
+    def preload(
+        self,
+        track_ids=None,
+        properties=None,
+        workers=1,
+        backend="thread",
+        verbose=True,
+    ):
+        """Load track properties for many tracks concurrently, e.g. to warm
+        a training run
+
+        Failures are collected per track and property instead of stopping
+        the preload.
+
+        Args:
+            track_ids (list or None): the tracks to preload. If None, all tracks
+            properties (list or None): names of the Track properties to load.
+                If None, all the public cached properties of the Track class.
+                The values of cached properties are kept on the returned
+                tracks. Other properties are only computed, e.g. to fill the
+                audio_cache with audio properties.
+            workers (int): number of tracks loaded concurrently
+            backend (str): "thread" or "process". Processes avoid the GIL for
+                CPU-bound parsers, but the loaded values are pickled back to
+                this process.
+            verbose (bool): If False, don't show progress
+
+        Raises:
+            AttributeError: If the dataset does not support Tracks
+            ValueError: If a property or the backend is not valid
+
+        Returns:
+            * TrackCollection - the tracks, with their cached properties loaded
+            * dict - failures, {track_id: {property: exception}}
+            * dict - total time in seconds spent loading each property
+
+        """
+        if self._track_class is None:
+            raise AttributeError("This dataset does not have tracks")
+        if backend not in PRELOAD_BACKENDS:
+            raise ValueError(
+                "backend should be one of {}, got {}".format(PRELOAD_BACKENDS, backend)
+            )
+
+        if properties is None:
+            properties = [
+                name
+                for name in dir(self._track_class)
+                if not name.startswith("_")
+                and isinstance(getattr(self._track_class, name), cached_property)
+            ]
+        for name in properties:
+            if not isinstance(
+                getattr(self._track_class, name, None), (property, cached_property)
+            ):
+                raise ValueError(
+                    "{} is not a property of {}".format(
+                        name, self._track_class.__name__
+                    )
+                )
+
+        tracks = self.load_tracks()
+        if track_ids is not None:
+            tracks = tracks.select(track_ids)
+
+        track_list = list(tracks.values())
+        load = functools.partial(_preload_track, properties=properties)
+        if workers > 1 and len(track_list) > 1:
+            if backend == "thread":
+                executor_class = concurrent.futures.ThreadPoolExecutor
+            else:
+                executor_class = concurrent.futures.ProcessPoolExecutor
+            with executor_class(max_workers=workers) as executor:
+                results = list(
+                    tqdm.tqdm(
+                        executor.map(load, track_list),
+                        total=len(track_list),
+                        disable=not verbose,
+                    )
+                )
+        else:
+            results = [
+                load(track) for track in tqdm.tqdm(track_list, disable=not verbose)
+            ]
+
+        failures = {}
+        timings = {name: 0.0 for name in properties}
+        for track, (values, errors, durations) in zip(track_list, results):
+            # store the values loaded in another process as cached properties
+            track.__dict__.update(values)
+            if errors:
+                failures[track.track_id] = errors
+            for name, duration in durations.items():
+                timings[name] += duration
+
+        return tracks, failures, timings
+
+    def audio_info(self, key="audio", workers=1, force=False, verbose=True):
+        """Get the length, sample rate and channels of the tracks' audio files,
+        reading only their headers
+
+        The table is cached in ``data_home`` (as ``.mirdata_audio_info.npz``),
+        with each file's size and mtime. Later calls only read the headers of
+        files which changed. Files which can't be read (e.g. missing files or
+        formats libsndfile doesn't support) are left out of the table, with a
+        warning.
+
+        Args:
+            key (str): Index key of the audio files, e.g. "audio"
+            workers (int): number of headers read concurrently
+            force (bool): If True, ignore the cache and read every header
+            verbose (bool): If False, don't show progress
+
+        Raises:
+            AttributeError: If the dataset does not have tracks
+            ValueError: If no track has an audio file at ``key``
+
+        Returns:
+            np.ndarray: structured array with a row per track and the fields
+            ``track_id``, ``frames``, ``sr``, ``channels`` and ``format``.
+            The duration in seconds is ``frames / sr``.
+
+        """
+        paths = {}
+        for track_id in self.track_ids:
+            entry = self._index["tracks"][track_id].get(key)
+            if entry is not None and entry[0] is not None:
+                paths[track_id] = entry[0]
+        if self.track_ids and not paths:
+            raise ValueError("No track has an audio file at the key {}".format(key))
+
+        local = validate.is_local(self.data_home) and os.path.isdir(self.data_home)
+        cache = {} if force or not local else _load_audio_info(self.data_home)
+        read = functools.partial(
+            _read_audio_info, self.data_home, cache=cache, local=local
+        )
+        path_list = list(paths.values())
+        if workers > 1 and len(path_list) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    tqdm.tqdm(
+                        executor.map(read, path_list),
+                        total=len(path_list),
+                        disable=not verbose,
+                    )
+                )
+        else:
+            results = [read(path) for path in tqdm.tqdm(path_list, disable=not verbose)]
+
+        rows = []
+        failures = []
+        for (track_id, path), (signature, info) in zip(paths.items(), results):
+            if info is None:
+                failures.append(track_id)
+                continue
+            rows.append(
+                (track_id, info["frames"], info["sr"], info["channels"], info["format"])
+            )
+            if signature is not None:
+                cache[path] = (signature, info)
+        if failures:
+            logging.warning(
+                "Could not read the audio info of {} tracks, e.g. {}".format(
+                    len(failures), failures[:5]
+                )
+            )
+        if local:
+            _save_audio_info(self.data_home, cache)
+
+        max_id_length = max([len(row[0]) for row in rows], default=1)
+        return np.array(
+            rows,
+            dtype=[
+                ("track_id", "U{}".format(max_id_length)),
+                ("frames", "i8"),
+                ("sr", "i4"),
+                ("channels", "i2"),
+                ("format", "U8"),
+            ],
+        )
+
 
 class Track(object):
     """Track base class
@@ -538,6 +1384,14 @@ class Track(object):
         self._data_home = data_home
         self._track_paths = index["tracks"][track_id]
 
+    def __reduce_ex__(self, protocol):
+        # tracks created by a Dataset are pickled as (dataset, track_id): the
+        # dataset is pickled by reference, so the index is not
+        dataset = getattr(self._metadata, "__self__", None)
+        if isinstance(dataset, Dataset) and type(self) is dataset._track_class:
+            return (_dataset_track, (dataset, self.track_id))
+        return super().__reduce_ex__(protocol)
+
     @cached_property
     def _track_metadata(self):
         metadata = self._metadata()
@@ -595,6 +1449,70 @@ class Track(object):
         else:
             return os.path.join(self._data_home, self._track_paths[key][0])
 
+    def load_audio_segment(
+        self, key, offset=0.0, duration=None, sr=None, mono=False, dtype="float32"
+    ):
+        """Load a segment of an audio file of the track, decoding only the
+        requested frames when the format supports seeking
+
+        The segment has the file's channels and sample rate, unless ``mono`` or
+        ``sr`` are given. A dataset's ``load_audio`` functions also take
+        ``offset`` and ``duration``, to load segments in that dataset's format.
+
+        Args:
+            key (string): Index key of the audio file, e.g. "audio"
+            offset (float): start of the segment, in seconds
+            duration (float or None): duration of the segment, in seconds.
+                If None, the audio is loaded until the end of the file
+            sr (float or None): sample rate to resample to. If None, the
+                file's sample rate is kept
+            mono (bool): if True, mix the channels down to mono
+            dtype (str): dtype of the signal, e.g. "int16" to use half the
+                memory of the default "float32". See io.load_audio
+
+        Returns:
+            * np.ndarray - the audio signal, with shape (n_samples,) if mono
+              or the file has one channel, else (n_channels, n_samples)
+            * float - the sample rate of the audio signal
+
+            or None if the path in the index is None
+
+        """
+        path = self.get_path(key)
+        if path is None:
+            return None
+        return io.load_audio_segment(
+            path, offset=offset, duration=duration, sr=sr, mono=mono, dtype=dtype
+        )
+
+    def load_audio_memmap(self, key, offset=0.0, duration=None, dtype="float32"):
+        """Map the samples of an audio file of the track into memory, without
+        decoding or copying them
+
+        Uncompressed WAV files are returned as a read-only ``np.memmap``, in
+        the file's sample format, so random crops only read the pages they
+        touch. Other formats are decoded into ``dtype``. See io.load_audio_memmap
+
+        Args:
+            key (string): Index key of the audio file, e.g. "audio"
+            offset (float): start of the segment, in seconds
+            duration (float or None): duration of the segment, in seconds.
+                If None, the audio is mapped until the end of the file
+            dtype (str): dtype of the audio when the file is decoded
+
+        Returns:
+            * np.ndarray - the audio signal, with shape (n_samples,) if the
+              file has one channel, else (n_channels, n_samples)
+            * float - the sample rate of the audio signal
+
+            or None if the path in the index is None
+
+        """
+        path = self.get_path(key)
+        if path is None:
+            return None
+        return io.load_audio_memmap(path, offset=offset, duration=duration, dtype=dtype)
+
 
 class MultiTrack(Track):
     """MultiTrack class.
@@ -641,6 +1559,12 @@ class MultiTrack(Track):
         self._index = index
         self.track_ids = self._index["multitracks"][self.mtrack_id]["tracks"]
 
+    def __reduce_ex__(self, protocol):
+        dataset = getattr(self._metadata, "__self__", None)
+        if isinstance(dataset, Dataset) and type(self) is dataset._multitrack_class:
+            return (_dataset_multitrack, (dataset, self.mtrack_id))
+        return object.__reduce_ex__(self, protocol)
+
     @property
     def tracks(self):
         return {
@@ -780,6 +1704,141 @@ class MultiTrack(Track):
         return self.get_target(tracks)
 
 
+def _dataset_track(dataset, track_id):
+    """Get a track from a dataset, when unpickling a Track"""
+    return dataset.track(track_id)
+
+
+def _dataset_multitrack(dataset, mtrack_id):
+    """Get a multitrack from a dataset, when unpickling a MultiTrack"""
+    return dataset.multitrack(mtrack_id)
+
+
+def _preload_track(track, properties):
+    """Load properties of a track, for Dataset.preload
+
+    Args:
+        track (Track): the track
+        properties (list): names of the properties to load
+
+    Returns:
+        * dict - values of the loaded cached properties
+        * dict - exceptions raised by the properties which failed
+        * dict - time in seconds spent loading each property
+
+    """
+    values = {}
+    errors = {}
+    durations = {}
+    for name in properties:
+        start = time.perf_counter()
+        try:
+            value = getattr(track, name)
+        except Exception as exc:
+            errors[name] = exc
+        else:
+            if isinstance(getattr(type(track), name), cached_property):
+                values[name] = value
+        durations[name] = time.perf_counter() - start
+    return values, errors, durations
+
+
+def _read_audio_info(data_home, path, cache, local):
+    """Read the audio info of a file, for Dataset.audio_info
+
+    Args:
+        data_home (str): path where the data lives
+        path (str): the file's path relative to data_home
+        cache (dict): cached audio info, as returned by _load_audio_info
+        local (bool): if data_home is a local folder
+
+    Returns:
+        * list or None - the file's [size, mtime_ns], or None if it is not local
+        * dict or None - the file's audio info, see io.read_audio_info, or None
+          if it can't be read
+
+    """
+    full_path = os.path.join(data_home, path)
+    try:
+        if not local:
+            with open(full_path, "rb") as fhandle:
+                return None, io.read_audio_info(fhandle)
+        stat = os.stat(full_path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        cached = cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return signature, cached[1]
+        return signature, io.read_audio_info(full_path)
+    except (OSError, RuntimeError):
+        return None, None
+
+
+def _load_audio_info(data_home):
+    """Load the audio info cached in data_home
+
+    Args:
+        data_home (str): path where the data lives
+
+    Returns:
+        dict: {file path relative to data_home: ([size, mtime_ns], audio info)},
+        empty if there is no (readable) cache
+
+    """
+    try:
+        with np.load(
+            os.path.join(data_home, AUDIO_INFO_FILENAME), allow_pickle=False
+        ) as data:
+            columns = {name: data[name].tolist() for name in data.files}
+    except (OSError, ValueError):
+        return {}
+    try:
+        return {
+            path: (
+                [size, mtime_ns],
+                {"frames": frames, "sr": sr, "channels": channels, "format": fmt},
+            )
+            for path, size, mtime_ns, frames, sr, channels, fmt in zip(
+                columns["path"],
+                columns["size"],
+                columns["mtime_ns"],
+                columns["frames"],
+                columns["sr"],
+                columns["channels"],
+                columns["format"],
+            )
+        }
+    except KeyError:
+        return {}
+
+
+def _save_audio_info(data_home, cache):
+    """Save the audio info cache in data_home
+
+    Args:
+        data_home (str): path where the data lives
+        cache (dict): cached audio info, as returned by _load_audio_info
+
+    """
+    paths = sorted(cache)
+    columns = {"path": np.array(paths, dtype=str).reshape(-1)}
+    columns["size"] = np.array([cache[p][0][0] for p in paths], dtype="i8")
+    columns["mtime_ns"] = np.array([cache[p][0][1] for p in paths], dtype="i8")
+    for name, dtype in [("frames", "i8"), ("sr", "i4"), ("channels", "i2")]:
+        columns[name] = np.array([cache[p][1][name] for p in paths], dtype=dtype)
+    columns["format"] = np.array(
+        [cache[p][1]["format"] for p in paths], dtype=str
+    ).reshape(-1)
+
+    cache_path = os.path.join(data_home, AUDIO_INFO_FILENAME)
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as fhandle:
+            np.savez(fhandle, **columns)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logging.warning("Could not save the audio info: {}".format(exc))
+
+
 class Index(object):
     """Class for storing information about dataset indexes.
     Args:
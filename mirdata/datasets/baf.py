@@ -113,14 +113,19 @@ BAF Loader
 
 import os
 from string import Template
-from typing import Tuple, Optional
+from typing import Tuple, Optional, TYPE_CHECKING
 
-import librosa
 import numpy as np
-import pandas as pd
 
 from mirdata import annotations
 from mirdata import core
+from mirdata import io
+from mirdata.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = lazy_import("pandas")
 
 BIBTEX = """@inproceedings{cortes2022BAF,
   author       = {Guillem Cortès and
@@ -285,7 +290,7 @@ class Track(core.Track):
     def datetime(self) -> str:
         return self._track_metadata.get("datetime")
 
-    @property
+    @core.audio_property
     def audio(self) -> Tuple[np.ndarray, float]:
         """The track's audio
 
@@ -301,19 +306,23 @@ class Track(core.Track):
         return load_matches(self._track_metadata)
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(fpath: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fpath: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a baf audio file.
 
     Args:
         fpath (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=8000, mono=True)
+    return io.load_audio(fpath, sr=8000, mono=True, offset=offset, duration=duration)
 
 
 def load_matches(track_metadata: dict) -> Optional[EventDataExtended]:
@@ -351,7 +360,7 @@ def load_matches(track_metadata: dict) -> Optional[EventDataExtended]:
         )
 
 
-def csv_to_pandas(file_path: str) -> pd.DataFrame:
+def csv_to_pandas(file_path: str) -> "pd.DataFrame":
     try:
         df = pd.read_csv(file_path)
     except FileNotFoundError as not_found:
@@ -35,7 +35,6 @@
 import os
 import csv
 import logging
-import librosa
 import numpy as np
 from typing import BinaryIO, Optional, TextIO, Tuple
 
@@ -145,7 +144,7 @@ class Track(core.Track):
     def tempo(self) -> Optional[float]:
         return load_tempo(self.tempo_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -158,18 +157,23 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Ballroom audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
@@ -14,7 +14,6 @@ import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import download_utils
@@ -118,7 +117,7 @@ class Track(core.Track):
     def sections(self) -> Optional[annotations.SectionData]:
         return load_sections(self.sections_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -131,18 +130,23 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Beatles audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
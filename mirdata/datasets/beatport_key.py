@@ -30,10 +30,9 @@ import fnmatch
 import json
 
 from deprecated.sphinx import deprecated
-import librosa
-from smart_open import open
 
 from mirdata import core, download_utils, io
+from mirdata.lazy import open
 
 BIBTEX = """@phdthesis {3897,
     title = {Tonality Estimation in Electronic Dance Music: A Computational and Musically Informed Examination},
@@ -131,7 +130,7 @@ class Track(core.Track):
     def tempo(self):
         return load_tempo(self.metadata_path)
 
-    @property
+    @core.audio_property
     def audio(self):
         """The track's audio
 
@@ -143,19 +142,21 @@ class Track(core.Track):
         return load_audio(self.audio_path)
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(fpath):
+def load_audio(fpath, offset=0.0, duration=None):
     """Load a beatport_key audio file.
 
     Args:
         fpath (str): path to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=None, mono=True)
+    return io.load_audio(fpath, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
@@ -266,7 +267,17 @@ class Dataset(core.Dataset):
     def load_artist(self, *args, **kwargs):
         return load_artist(*args, **kwargs)
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=False):
+    def download(
+        self,
+        partial_download=None,
+        force_overwrite=False,
+        cleanup=False,
+        max_workers=1,
+        stream=False,
+        indexed_only=False,
+        track_ids=None,
+        store=None,
+    ):
         """Download the dataset
 
         Args:
@@ -277,12 +288,26 @@ class Dataset(core.Dataset):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            max_workers (int):
+                Maximum number of remotes downloaded concurrently.
+            stream (bool):
+                If True, tar archives are extracted as they download.
+            indexed_only (bool):
+                If True, only the files referenced by the index are extracted.
+            track_ids (list or None):
+                If given, only the files of these tracks are extracted.
+            store (str, store.ContentStore or None):
+                If given, files are linked from and added to this content store.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
             IOError: if a downloaded file's checksum is different from expected
 
         """
+        content_store, missing = self._link_from_store(store, track_ids)
+        if missing is not None and not missing:
+            return
+
         download_utils.downloader(
             self.data_home,
             remotes=self.remotes,
@@ -290,11 +315,16 @@ class Dataset(core.Dataset):
             partial_download=partial_download,
             force_overwrite=force_overwrite,
             cleanup=cleanup,
+            max_workers=max_workers,
+            stream=stream,
+            extract_paths=self._extract_paths(indexed_only, track_ids, missing),
         )
 
         self._find_replace(
             os.path.join(self.data_home, "meta"), ": nan", ": null", "*.json"
         )
+        if content_store is not None:
+            content_store.add_files(missing, self.data_home)
 
     def _find_replace(self, directory, find, replace, pattern):
         """Replace all the files with the format pattern "find" by "replace"
@@ -14,15 +14,14 @@ import re
 from typing import BinaryIO, TextIO, Optional, Tuple, Dict, List
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import download_utils
 
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
+from mirdata.lazy import open
 
 BIBTEX = """
 @inproceedings{burgoyne_billboard,
@@ -217,7 +216,7 @@ class Track(core.Track):
             os.path.join(self._data_home, self._track_paths["salami"][0])
         )
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -230,18 +229,23 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Billboard audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
@@ -51,15 +51,14 @@ import xml.etree.ElementTree as ET
 from typing import Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import download_utils
 
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
+from mirdata.lazy import open
 
 BIBTEX = """@dataset{nadine_kroher_2018_1322542,
   author       = {Nadine Kroher and
@@ -207,7 +206,7 @@ class Track(core.Track):
     def duration(self):
         return self._track_metadata.get("duration")
 
-    @property
+    @core.audio_property
     def audio(self) -> Tuple[np.ndarray, float]:
         """The track's audio
 
@@ -253,19 +252,23 @@ def load_spectrogram(fhandle: TextIO) -> np.ndarray:
     return spectrogram
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(fpath: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fpath: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a cante100 audio file.
 
     Args:
         fpath (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=22050, mono=False)
+    return io.load_audio(fpath, sr=22050, mono=False, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
@@ -23,23 +23,16 @@
 """
 
 import json
-import logging
 import os
-from typing import Optional, List
-
-from smart_open import open
-
+from typing import Optional, List, TYPE_CHECKING
 
 from mirdata import core
+from mirdata.lazy import lazy_import, open
 
-try:
+if TYPE_CHECKING:
     import music21
-except ImportError:
-    logging.error(
-        "In order to use cipi you must have music21 installed. "
-        "Please reinstall mirdata using `pip install 'mirdata[cipi]'"
-    )
-    raise ImportError
+else:
+    music21 = lazy_import("music21", extra="cipi")
 
 BIBTEX = """
 @article{Ramoneda2024,
@@ -168,7 +161,7 @@ class Track(core.Track):
 
 def load_score(
     fhandle: str, data_home: str = "tests/resources/mir_datasets/cipi"
-) -> music21.stream.Score:
+) -> "music21.stream.Score":
     """Load cipi score in music21 stream
 
     Args:
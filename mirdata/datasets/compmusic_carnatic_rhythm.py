@@ -48,21 +48,12 @@
 
 import os
 import csv
-import logging
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, io
-from smart_open import open
-
-try:
-    from openpyxl import load_workbook as get_xlxs
-except ImportError:
-    logging.error(
-        "In order to use CompMusic Carnatic Music Rhythm you must have openpyxl installed. "
-        "Please reinstall mirdata using `pip install 'mirdata[compmusic_carnatic_rhythm]'"
-    )
-    raise
+from mirdata.lazy import lazy_import, open
+
+openpyxl = lazy_import("openpyxl", extra="compmusic_carnatic_rhythm")
 
 BIBTEX = """
 @article{srinivasamurthy_2014,
@@ -205,7 +196,7 @@ class Track(core.Track):
     def num_of_samas(self):
         return self._track_metadata.get("num_of_samas")
 
-    @property
+    @core.audio_property
     def audio(self):
         """The track's audio
 
@@ -217,12 +208,14 @@ class Track(core.Track):
         return load_audio(self.audio_path)
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load an audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -231,7 +224,9 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(
+        audio_path, sr=44100, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -311,7 +306,7 @@ class Dataset(core.Dataset):
         metadata = {}
         try:
             with open(metadata_path, "rb") as fhandle:
-                reader = get_xlxs(fhandle)
+                reader = openpyxl.load_workbook(fhandle)
                 if self.version == "full_dataset_1.0":
                     reade = reader["Carnatic"]
                     rows = 0
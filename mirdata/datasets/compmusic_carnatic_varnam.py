@@ -40,14 +40,13 @@
 import os
 import csv
 import glob
-import librosa
 from typing import TextIO
 
 import numpy as np
 from xml.dom import minidom
-from smart_open import open
 
 from mirdata import annotations, core, download_utils, io
+from mirdata.lazy import open
 
 BIBTEX = """
 @dataset{koduri_g_k_2014_1257118,
@@ -157,7 +156,7 @@ class Track(core.Track):
     def tonic(self):
         return self._track_metadata
 
-    @property
+    @core.audio_property
     def audio(self):
         """The track's audio
 
@@ -169,12 +168,14 @@ class Track(core.Track):
         return load_audio(self.audio_path)
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load a Carnatic Varnam audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -183,7 +184,9 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(
+        audio_path, sr=44100, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -46,21 +46,12 @@
 
 import os
 import csv
-import logging
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, io
-from smart_open import open
-
-try:
-    from openpyxl import load_workbook as get_xlxs
-except ImportError:
-    logging.error(
-        "In order to use CompMusic Hindustani Music Rhythm you must have openpyxl installed. "
-        "Please reinstall mirdata using `pip install 'mirdata[compmusic_hindustani_rhythm]'"
-    )
-    raise
+from mirdata.lazy import lazy_import, open
+
+openpyxl = lazy_import("openpyxl", extra="compmusic_hindustani_rhythm")
 
 BIBTEX = """
 @inproceedings{Srinivasamurthy2016,
@@ -218,7 +209,7 @@ class Track(core.Track):
     def median_avarts_per_min(self):
         return self._track_metadata.get("median_avarts_per_min")
 
-    @property
+    @core.audio_property
     def audio(self):
         """The track's audio
 
@@ -230,12 +221,14 @@ class Track(core.Track):
         return load_audio(self.audio_path)
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load an audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -244,7 +237,9 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(
+        audio_path, sr=44100, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -316,7 +311,7 @@ class Dataset(core.Dataset):
         metadata = {}
         try:
             with open(metadata_path, "rb") as fhandle:
-                reader = get_xlxs(fhandle)
+                reader = openpyxl.load_workbook(fhandle)
                 reade = reader["HMDf"]
                 rows = 0
 
@@ -32,7 +32,6 @@
 import csv
 import json
 
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, download_utils, io
@@ -114,7 +113,7 @@ class Track(core.Track):
         self.tonic_path = self.get_path("tonic")
         self.tonic_finetuned_path = self.get_path("tonic-finetuned")
 
-    @property
+    @core.audio_property
     def audio(self):
         return load_audio(self.audio_path)
 
@@ -147,19 +146,24 @@ class Track(core.Track):
         return load_tonic(self.tonic_finetuned_path)
 
 
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """
     Load an audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         tuple: np.ndarray - the stereo audio signal, float - sample rate
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(
+        audio_path, sr=44100, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -53,11 +53,8 @@ import os
 import glob
 import json
 
-import librosa
-
-from smart_open import open
-
-from mirdata import core, download_utils
+from mirdata import core, download_utils, io
+from mirdata.lazy import open
 
 BIBTEX = """@article{Gulati2014,
     author = {Gulati, S. and Bellur, A. and Salamon, J. and Ranjani, H. G. and Ishwar, V. and Murthy, H. A. and Serra, X.},
@@ -140,7 +137,7 @@ class Track(core.Track):
 
         self.audio_path = self.get_path("audio")
 
-    @property
+    @core.audio_property
     def audio(self):
         """The track's audio
 
@@ -176,18 +173,22 @@ class Track(core.Track):
         return self._track_metadata.get("tradition")
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load a Indian Art Music Tonic audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
     """
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(
+        audio_path, sr=44100, mono=False, offset=offset, duration=duration
+    )
 
 
 @core.docstring_inherit(core.Dataset)
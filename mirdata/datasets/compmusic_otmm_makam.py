@@ -42,9 +42,9 @@ from typing import TextIO
 
 from deprecated.sphinx import deprecated
 import numpy as np
-from smart_open import open
 
 from mirdata import annotations, core, download_utils, io
+from mirdata.lazy import open
 
 BIBTEX = """
 @software{sertan_senturk_2016_58413,
@@ -45,11 +45,10 @@ import os
 import csv
 import json
 
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, download_utils, io
-from smart_open import open
+from mirdata.lazy import open
 
 BIBTEX = """
 @article{gulati_2016,
@@ -205,7 +204,7 @@ class Track(core.Track):
     def tradition(self):
         return self._track_metadata.get("tradition")
 
-    @property
+    @core.audio_property
     def audio(self):
         """The track's audio
 
@@ -217,12 +216,14 @@ class Track(core.Track):
         return load_audio(self.audio_path)
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load an audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -231,7 +232,9 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(
+        audio_path, sr=44100, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
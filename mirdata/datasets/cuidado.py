@@ -33,7 +33,6 @@
 """
 
 import csv
-import librosa
 import numpy as np
 from typing import Optional, TextIO, Tuple, List
 
@@ -126,7 +125,7 @@ class Track(core.Track):
     def tempo(self) -> Optional[float]:
         return load_tempo(self.tempo_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -138,11 +137,14 @@ class Track(core.Track):
         return load_audio(self.audio_path)
 
 
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load an audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -151,7 +153,9 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(
+        audio_path, sr=44100, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -101,11 +101,12 @@ import os
 from typing import Optional, BinaryIO
 
 from deprecated.sphinx import deprecated
-import h5py
 import numpy as np
-from smart_open import open
 
 from mirdata import download_utils, core, io
+from mirdata.lazy import lazy_import, open
+
+h5py = lazy_import("h5py")
 
 LICENSE_INFO = """
 Creative Commons Attribution Non Commercial Share Alike 4.0 International
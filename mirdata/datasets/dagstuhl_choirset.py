@@ -46,10 +46,12 @@ import csv
 from typing import BinaryIO, Optional, TextIO, Tuple, List
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import download_utils, core, annotations, io
+from mirdata.lazy import lazy_import
+
+librosa = lazy_import("librosa")
 
 BIBTEX = """
 @article{RosenzweigCWSGM20_DCS_TISMIR,
@@ -180,7 +182,7 @@ class Track(core.Track):
     def score(self) -> Optional[annotations.NoteData]:
         return load_score(self.score_path)
 
-    @property
+    @core.audio_property
     def audio_dyn(self) -> Optional[Tuple[np.ndarray, float]]:
         """The audio for the track's dynamic microphone (if available)
 
@@ -191,7 +193,7 @@ class Track(core.Track):
         """
         return load_audio(self.audio_dyn_path)
 
-    @property
+    @core.audio_property
     def audio_hsm(self) -> Optional[Tuple[np.ndarray, float]]:
         """The audio for the track's headset microphone (if available)
 
@@ -202,7 +204,7 @@ class Track(core.Track):
         """
         return load_audio(self.audio_hsm_path)
 
-    @property
+    @core.audio_property
     def audio_lrx(self) -> Optional[Tuple[np.ndarray, float]]:
         """The audio for the track's larynx microphone (if available)
 
@@ -305,7 +307,7 @@ class MultiTrack(core.MultiTrack):
 
         return multif0
 
-    @property
+    @core.audio_property
     def audio_stm(self) -> Optional[Tuple[np.ndarray, float]]:
         """The audio for the room mic (mono mixdown)
 
@@ -316,7 +318,7 @@ class MultiTrack(core.MultiTrack):
         """
         return load_audio(self.audio_stm_path)
 
-    @property
+    @core.audio_property
     def audio_str(self) -> Optional[Tuple[np.ndarray, float]]:
         """The audio for the room mic (right channel)
 
@@ -327,7 +329,7 @@ class MultiTrack(core.MultiTrack):
         """
         return load_audio(self.audio_str_path)
 
-    @property
+    @core.audio_property
     def audio_stl(self) -> Optional[Tuple[np.ndarray, float]]:
         """The audio for the room mic (left channel)
 
@@ -338,7 +340,7 @@ class MultiTrack(core.MultiTrack):
         """
         return load_audio(self.audio_stl_path)
 
-    @property
+    @core.audio_property
     def audio_rev(self) -> Optional[Tuple[np.ndarray, float]]:
         """The audio for the room mic with artifical reverb (mono mixdown)
 
@@ -349,7 +351,7 @@ class MultiTrack(core.MultiTrack):
         """
         return load_audio(self.audio_rev_path)
 
-    @property
+    @core.audio_property
     def audio_spl(self) -> Optional[Tuple[np.ndarray, float]]:
         """The audio for the piano accompaniment DI (left channel)
 
@@ -360,7 +362,7 @@ class MultiTrack(core.MultiTrack):
         """
         return load_audio(self.audio_spl_path)
 
-    @property
+    @core.audio_property
     def audio_spr(self) -> Optional[Tuple[np.ndarray, float]]:
         """The audio for the piano accompaniment DI (right channel)
 
@@ -373,18 +375,23 @@ class MultiTrack(core.MultiTrack):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Dagstuhl ChoirSet audio file.
 
     Args:
         audio_path (str): path pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=22050, mono=True)
+    return io.load_audio(fhandle, sr=22050, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
@@ -16,33 +16,27 @@
 
 import json
 import gzip
-import logging
 import os
 import pickle
-from typing import BinaryIO, Optional, TextIO, Tuple
+from typing import BinaryIO, Optional, TextIO, Tuple, TYPE_CHECKING
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import download_utils
 
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
+from mirdata.lazy import lazy_import, open
 
 # this is the package, needed to load the annotations.
 # DALI-dataset is only installed if the user explicitly declares
 # they want dali when pip installing.
-try:
+if TYPE_CHECKING:
     import DALI
-except ImportError as E:
-    logging.error(
-        "In order to use dali you must have dali-dataset installed. "
-        "Please reinstall mirdata using `pip install 'mirdata[dali]'"
-    )
-    raise
+else:
+    DALI = lazy_import("DALI", extra="dali")
 
 BIBTEX = """@inproceedings{Meseguer-Brocal_2018,
     Title = {DALI: a large Dataset of synchronized Audio, LyrIcs and notes, automatically created using teacher-student
@@ -201,10 +195,10 @@ class Track(core.Track):
         return load_annotations_granularity(self.annotation_path, "paragraphs")
 
     @core.cached_property
-    def annotation_object(self) -> DALI.Annotations:
+    def annotation_object(self) -> "DALI.Annotations":
         return load_annotations_class(self.annotation_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -217,18 +211,23 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Optional[Tuple[np.ndarray, float]]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Optional[Tuple[np.ndarray, float]]:
     """Load a DALI audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
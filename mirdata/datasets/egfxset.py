@@ -89,11 +89,10 @@ from typing import BinaryIO, Optional, Tuple
 from ast import literal_eval
 import re
 
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import annotations, core, download_utils, io
+from mirdata.lazy import open
 
 BIBTEX = """
 @techreport{pedroza2022egfxset,
@@ -272,7 +271,7 @@ class Track(core.Track):
     def setting(self):
         return self._track_metadata.get("Setting")
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """Solo guitar audio (mono)
 
@@ -285,18 +284,23 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load EGFxSet guitar audio
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @core.docstring_inherit(core.Dataset)
@@ -41,11 +41,10 @@ import json
 import os
 from typing import BinaryIO, Dict, Optional, TextIO, Tuple, List
 
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import download_utils, core, annotations, io
+from mirdata.lazy import open
 
 BIBTEX = """
 @inproceedings{
@@ -324,7 +323,7 @@ class Track(core.Track):
         else:
             return load_annotation(self.annotation_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -481,18 +480,23 @@ class MultiTrack(core.MultiTrack):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Filosax audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
@@ -50,13 +50,11 @@ import csv
 import os
 import numpy as np
 from math import floor
-from smart_open import open
-
-import librosa
 
 from mirdata import download_utils, core, io
 
 from typing import Optional, Tuple
+from mirdata.lazy import open
 
 BIBTEX = """
     @inproceedings{
@@ -198,7 +196,7 @@ class Track(core.Track):
     def mode_number(self):
         return self._track_metadata.get("mode_number")
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """audio
 
@@ -256,16 +254,20 @@ class Dataset(core.Dataset):
         return metadata_index
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(path: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    path: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load fma keys audio
 
     Args:
         path(str): Path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    return librosa.load(path, sr=None, mono=True)
+    return io.load_audio(path, sr=None, mono=True, offset=offset, duration=duration)
@@ -44,11 +44,10 @@ import os
 from typing import BinaryIO, TextIO, Tuple, Optional
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import download_utils, core, io
+from mirdata.lazy import open
 
 BIBTEX = """
 @inproceedings{ramires2020, 
@@ -165,7 +164,7 @@ class Track(core.Track):
     def license(self):
         return self._track_metadata.get("license")
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -182,18 +181,23 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load the track audio file.
 
     Args:
         fhandle (str): path to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=16000, mono=True)
+    return io.load_audio(fhandle, sr=16000, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
@@ -36,7 +36,6 @@ import json
 from typing import Dict, List, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import core, download_utils, io
@@ -131,7 +130,7 @@ class Track(core.Track):
     def tempo(self) -> Optional[str]:
         return load_tempo(self.metadata_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Tuple[np.ndarray, float]:
         """The track's audio
 
@@ -143,19 +142,23 @@ class Track(core.Track):
         return load_audio(self.audio_path)
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(fpath: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fpath: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a giantsteps_key audio file.
 
     Args:
         fpath (str): str pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=None, mono=True)
+    return io.load_audio(fpath, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
@@ -70,7 +70,6 @@ from typing import Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
 import json
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, download_utils, io
@@ -164,7 +163,7 @@ class Track(core.Track):
     def tempo_v2(self) -> Optional[annotations.TempoData]:
         return load_tempo(self.annotation_v2_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Tuple[np.ndarray, float]:
         """The track's audio
 
@@ -176,18 +175,23 @@ class Track(core.Track):
         return load_audio(self.audio_path)
 
 
-def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a giantsteps_tempo audio file.
 
     Args:
         fhandle (str or file-like): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
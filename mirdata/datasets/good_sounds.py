@@ -33,11 +33,10 @@ import os
 from typing import Optional, Tuple, BinaryIO
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import download_utils, core, io
+from mirdata.lazy import open
 
 BIBTEX = """@inproceedings{romani2015real,
   title={A Real-Time System for Measuring Sound Goodness in Instrumental Sounds},
@@ -180,7 +179,7 @@ class Track(core.Track):
         self.track_id = track_id
         self.audio_path = self.get_path("audio")
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -199,7 +198,7 @@ class Track(core.Track):
 
     @core.cached_property
     def take_info(self) -> dict:
-        take_info = self._metadata()["takes"][self.track_id]
+        take_info = dict(self._metadata()["takes"][self.track_id])
         take_info["filename"] = self.audio_path
         return take_info
 
@@ -245,18 +244,23 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a GOOD-SOUNDS audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @core.docstring_inherit(core.Dataset)
@@ -48,18 +48,21 @@
 
 import csv
 import os
-from typing import BinaryIO, Optional, Tuple
+from typing import BinaryIO, Optional, Tuple, TYPE_CHECKING
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-import pretty_midi
-from smart_open import open
 
 from mirdata import annotations
 from mirdata import core
 from mirdata import download_utils
 from mirdata import io
+from mirdata.lazy import lazy_import, open
+
+if TYPE_CHECKING:
+    import pretty_midi
+else:
+    pretty_midi = lazy_import("pretty_midi")
 
 BIBTEX = """@inproceedings{groove2019,
     Author = {Jon Gillick and Adam Roberts and Jesse Engel and Douglas Eck
@@ -275,7 +278,7 @@ class Track(core.Track):
     def audio_filename(self):
         return self._track_metadata.get("audio_filename")
 
-    @property
+    @core.audio_property
     def audio(self) -> Tuple[Optional[np.ndarray], Optional[float]]:
         """The track's audio
 
@@ -299,11 +302,16 @@ class Track(core.Track):
         return load_midi(self.midi_path)
 
 
-def load_audio(path: str) -> Tuple[Optional[np.ndarray], Optional[float]]:
+def load_audio(
+    path: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[Optional[np.ndarray], Optional[float]]:
     """Load a Groove MIDI audio file.
 
     Args:
         path: path to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -312,11 +320,11 @@ def load_audio(path: str) -> Tuple[Optional[np.ndarray], Optional[float]]:
     """
     if not path:
         return None, None
-    return librosa.load(path, sr=22050, mono=True)
+    return io.load_audio(path, sr=22050, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_bytes_io
-def load_midi(fhandle: BinaryIO) -> Optional[pretty_midi.PrettyMIDI]:
+def load_midi(fhandle: BinaryIO) -> "Optional[pretty_midi.PrettyMIDI]":
     """Load a Groove MIDI midi file.
 
     Args:
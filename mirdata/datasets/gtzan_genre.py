@@ -19,7 +19,6 @@
 from typing import BinaryIO, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import download_utils, core, io, annotations
@@ -107,7 +106,7 @@ class Track(core.Track):
     def tempo(self) -> Optional[float]:
         return load_tempo(self.tempo_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -161,18 +160,25 @@ def load_tempo(fhandle: TextIO) -> float:
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a GTZAN audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    audio, sr = librosa.load(fhandle, sr=22050, mono=True)
+    audio, sr = io.load_audio(
+        fhandle, sr=22050, mono=True, offset=offset, duration=duration
+    )
     return audio, sr
 
 
@@ -57,9 +57,7 @@ from typing import BinaryIO, Optional, TextIO, Tuple, Dict, List
 
 from deprecated.sphinx import deprecated
 import json
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import annotations, core, download_utils, io
 
@@ -259,7 +257,7 @@ class Track(core.Track):
                 all_note_data += note_data
         return all_note_data
 
-    @property
+    @core.audio_property
     def audio_mic(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -270,7 +268,7 @@ class Track(core.Track):
         """
         return load_audio(self.audio_mic_path)
 
-    @property
+    @core.audio_property
     def audio_mix(self) -> Optional[Tuple[np.ndarray, float]]:
         """Mixture audio (mono)
 
@@ -281,7 +279,7 @@ class Track(core.Track):
         """
         return load_audio(self.audio_mix_path)
 
-    @property
+    @core.audio_property
     def audio_hex(self) -> Optional[Tuple[np.ndarray, float]]:
         """Hexaphonic audio (6-channels) with one channel per string
 
@@ -292,7 +290,7 @@ class Track(core.Track):
         """
         return load_multitrack_audio(self.audio_hex_path)
 
-    @property
+    @core.audio_property
     def audio_hex_cln(self) -> Optional[Tuple[np.ndarray, float]]:
         """Hexaphonic audio (6-channels) with one channel per string
            after bleed removal
@@ -306,33 +304,43 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Guitarset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_bytes_io
-def load_multitrack_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_multitrack_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Guitarset multitrack audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
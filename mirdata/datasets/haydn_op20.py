@@ -12,23 +12,20 @@
 
 import logging
 import os
-from typing import Optional, TextIO, List
+from typing import Optional, TextIO, List, TYPE_CHECKING
 
 from deprecated.sphinx import deprecated
 import numpy as np
 
 from mirdata import core, io, download_utils
 
-try:
-    import music21
-except ImportError:
-    logging.error(
-        "In order to use haydn_op20 you must have music21 installed. "
-        "Please reinstall mirdata using `pip install 'mirdata[haydn_op20]'"
-    )
-    raise ImportError
-
 from mirdata.annotations import KeyData, ChordData
+from mirdata.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import music21
+else:
+    music21 = lazy_import("music21", extra="haydn_op20")
 
 BIBTEX = """
 @dataset{nestor_napoles_lopez_2017_1095630,
@@ -94,7 +91,7 @@ class Track(core.Track):
         self.title = os.path.splitext(self._track_paths["annotations"][0])[0]
 
     @core.cached_property
-    def score(self) -> music21.stream.Score:
+    def score(self) -> "music21.stream.Score":
         return load_score(self.humdrum_annotated_path)
 
     @core.cached_property
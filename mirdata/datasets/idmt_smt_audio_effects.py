@@ -34,14 +34,13 @@
 """
 
 import os
-import librosa
 import numpy as np
 import xml.etree.ElementTree as ET
 
 from deprecated.sphinx import deprecated
 from typing import BinaryIO, Tuple, Optional
 from mirdata import download_utils, core, io
-from smart_open import open
+from mirdata.lazy import open
 
 BIBTEX = """
 @dataset{stein_michael_2023_7544032,
@@ -164,7 +163,7 @@ class Track(core.Track):
     def fx_setting(self):
         return self._track_metadata["fx_setting"]
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -180,18 +179,22 @@ class Track(core.Track):
             )
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a IDMT-SMT-Audio Effect track.
 
     Args:
         fhandle (Union[str, BinaryIO]): Path to audio file or file-like object.
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True, offset=offset, duration=duration)
 
 
 @core.docstring_inherit(core.Dataset)
@@ -297,6 +300,11 @@ class Dataset(core.Dataset):
         force_overwrite=False,
         cleanup=False,
         allow_invalid_checksum=False,
+        max_workers=1,
+        stream=False,
+        indexed_only=False,
+        track_ids=None,
+        store=None,
     ):
         """Download the dataset
 
@@ -308,22 +316,54 @@ class Dataset(core.Dataset):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            allow_invalid_checksum (bool):
+                Allow invalid checksums of the downloaded data.
+            max_workers (int):
+                Maximum number of remotes downloaded concurrently, and of
+                archive members extracted concurrently.
+            stream (bool):
+                If True, tar archives are extracted as they download.
+            indexed_only (bool):
+                If True, only the files referenced by the index (and the XML
+                metadata files) are extracted from the nested archives.
+            track_ids (list or None):
+                If given, only the files of these tracks (and the XML metadata
+                files) are extracted from the nested archives.
+            store (str, store.ContentStore or None):
+                If given, files are linked from and added to this content store.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
             IOError: if a downloaded file's checksum is different from expected
 
         """
-        # Download the main zip file
-        download_path = download_utils.download_from_remote(
-            remote=self.remotes["full_dataset"],
-            save_dir=self.data_home,
+        content_store, missing = self._link_from_store(store, track_ids)
+        if missing is not None and not missing:
+            return
+
+        # Download and unzip the main archive, which only contains the nested
+        # archives
+        download_utils.downloader(
+            self.data_home,
+            remotes=self.remotes,
+            index=self._index_data,
+            partial_download=partial_download,
             force_overwrite=force_overwrite,
+            cleanup=cleanup,
             allow_invalid_checksum=allow_invalid_checksum,
+            max_workers=max_workers,
+            stream=stream,
         )
 
-        # Unzip the main archive
-        download_utils.unzip(zip_path=download_path, cleanup=cleanup)
+        extract_paths = self._extract_paths(indexed_only, track_ids, missing)
+
+        def _keep_member(member_name):
+            # the metadata is read from XML files which are not in the index
+            return member_name.endswith(".xml") or (
+                os.path.normpath(member_name) in extract_paths
+            )
+
+        member_filter = None if extract_paths is None else _keep_member
 
         # Unzip the nested archives
         nested_zip_path = os.path.join(
@@ -342,9 +382,16 @@ class Dataset(core.Dataset):
         for zip_file, target_subdir in zip_files_to_extract.items():
             zip_file_path = os.path.join(nested_zip_path, zip_file)
 
-            download_utils.unzip(zip_path=zip_file_path, cleanup=cleanup)
+            download_utils.unzip(
+                zip_path=zip_file_path,
+                cleanup=cleanup,
+                workers=max_workers,
+                member_filter=member_filter,
+            )
 
         # Move contents from the temporary directory to the target directory
         download_utils.move_directory_contents(
             source_dir=nested_zip_path, target_dir=self.data_home
         )
+        if content_store is not None:
+            content_store.add_files(missing, self.data_home)
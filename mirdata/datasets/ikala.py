@@ -19,11 +19,12 @@ import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import annotations, core, download_utils, io
+from mirdata.lazy import lazy_import, open
+
+librosa = lazy_import("librosa")
 
 BIBTEX = """@inproceedings{chan2015vocal,
     title={Vocal activity informed singing voice separation with the iKala dataset},
@@ -174,52 +175,73 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_vocal_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_vocal_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load ikala vocal audio
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    audio, sr = librosa.load(fhandle, sr=None, mono=False)
+    audio, sr = io.load_audio(
+        fhandle, sr=None, mono=False, offset=offset, duration=duration
+    )
     vocal_channel = audio[1, :]
     return vocal_channel, sr
 
 
 @io.coerce_to_bytes_io
-def load_instrumental_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_instrumental_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load ikala instrumental audio
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    audio, sr = librosa.load(fhandle, sr=None, mono=False)
+    audio, sr = io.load_audio(
+        fhandle, sr=None, mono=False, offset=offset, duration=duration
+    )
     instrumental_channel = audio[0, :]
     return instrumental_channel, sr
 
 
 @io.coerce_to_bytes_io
-def load_mix_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_mix_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an ikala mix.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    mixed_audio, sr = librosa.load(fhandle, sr=None, mono=True)
+    mixed_audio, sr = io.load_audio(
+        fhandle, sr=None, mono=True, offset=offset, duration=duration
+    )
     # multipy by 2 because librosa averages the left and right channel.
     return 2.0 * mixed_audio, sr
 
@@ -57,12 +57,11 @@
 import csv
 import json
 from typing import BinaryIO, Optional, TextIO, Tuple
-from smart_open import open
 
-import librosa
 import numpy as np
 
 from mirdata import download_utils, core, annotations, io
+from mirdata.lazy import open
 
 BIBTEX = """
 @article{jazz-trio-database
@@ -204,7 +203,7 @@ class Track(core.Track):
         self.beats_path = self.get_path("beats")
         self.instrument = self.track_id.split("_")[1]
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The source-separated audio for this instrument
 
@@ -330,7 +329,7 @@ class MultiTrack(core.MultiTrack):
         """
         return self._multitrack_metadata["album_name"]
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio, center channel
 
@@ -341,7 +340,7 @@ class MultiTrack(core.MultiTrack):
         """
         return load_audio(self.audio_path)
 
-    @property
+    @core.audio_property
     def audio_lchan(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio, left channel (not present for all tracks)
 
@@ -352,7 +351,7 @@ class MultiTrack(core.MultiTrack):
         """
         return load_audio(self.audio_lchan_path)
 
-    @property
+    @core.audio_property
     def audio_rchan(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio, right channel (not present for all tracks)
 
@@ -526,18 +525,23 @@ def timestamp_to_seconds(ts: str) -> int:
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a JTD audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
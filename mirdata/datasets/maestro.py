@@ -33,15 +33,18 @@
 import json
 import logging
 import os
-from typing import BinaryIO, Optional, Tuple
+from typing import BinaryIO, Optional, Tuple, TYPE_CHECKING
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-import pretty_midi
-from smart_open import open
 
 from mirdata import core, download_utils, io
+from mirdata.lazy import lazy_import, open
+
+if TYPE_CHECKING:
+    import pretty_midi
+else:
+    pretty_midi = lazy_import("pretty_midi")
 
 BIBTEX = """@inproceedings{
   hawthorne2018enabling,
@@ -143,7 +146,7 @@ class Track(core.Track):
         return self._track_metadata.get("duration")
 
     @core.cached_property
-    def midi(self) -> Optional[pretty_midi.PrettyMIDI]:
+    def midi(self) -> "Optional[pretty_midi.PrettyMIDI]":
         return io.load_midi(self.midi_path)
 
     @core.cached_property
@@ -154,7 +157,7 @@ class Track(core.Track):
         )
         return io.load_notes_from_midi(self.midi_path, self.midi)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -167,18 +170,23 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a MAESTRO audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @core.docstring_inherit(core.Dataset)
@@ -228,7 +236,17 @@ class Dataset(core.Dataset):
     def load_notes(self, *args, **kwargs):
         return io.load_notes_from_midi(*args, **kwargs)
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=False):
+    def download(
+        self,
+        partial_download=None,
+        force_overwrite=False,
+        cleanup=False,
+        max_workers=1,
+        stream=False,
+        indexed_only=False,
+        track_ids=None,
+        store=None,
+    ):
         """Download the dataset
 
         Args:
@@ -239,6 +257,16 @@ class Dataset(core.Dataset):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            max_workers (int):
+                Maximum number of remotes downloaded concurrently.
+            stream (bool):
+                If True, tar archives are extracted as they download.
+            indexed_only (bool):
+                If True, only the files referenced by the index are extracted.
+            track_ids (list or None):
+                If given, only the files of these tracks are extracted.
+            store (str, store.ContentStore or None):
+                If given, files are linked from and added to this content store.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
@@ -251,6 +279,10 @@ class Dataset(core.Dataset):
         elif "midi" in partial_download:
             partial_download = ["midi"]
 
+        content_store, missing = self._link_from_store(store, track_ids)
+        if missing is not None and not missing:
+            return
+
         download_utils.downloader(
             self.data_home,
             remotes=self.remotes,
@@ -258,4 +290,9 @@ class Dataset(core.Dataset):
             partial_download=partial_download,
             force_overwrite=force_overwrite,
             cleanup=cleanup,
+            max_workers=max_workers,
+            stream=stream,
+            extract_paths=self._extract_paths(indexed_only, track_ids, missing),
         )
+        if content_store is not None:
+            content_store.add_files(missing, self.data_home)
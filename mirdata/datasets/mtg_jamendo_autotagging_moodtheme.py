@@ -42,10 +42,9 @@ import os
 from typing import Optional, Tuple, BinaryIO
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from mirdata import download_utils, core
-from smart_open import open
+from mirdata import download_utils, core, io
+from mirdata.lazy import open
 
 BIBTEX = """@conference {bogdanov2019mtg,
     author = "Bogdanov, Dmitry and Won, Minz and Tovstogan, Philip and Porter, Alastair and Serra, Xavier",
@@ -117,7 +116,7 @@ class Track(core.Track):
         self.track_id = track_id
         self.audio_path = self.get_path("audio")
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -154,18 +153,23 @@ class Track(core.Track):
         return tags
 
 
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a MTG jamendo autotagging moodtheme audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False, offset=offset, duration=duration)
 
 
 @core.docstring_inherit(core.Dataset)
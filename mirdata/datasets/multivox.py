@@ -69,25 +69,21 @@
 
 import csv
 import os
-import logging
 from collections import Counter
 from typing import BinaryIO, Dict, List, Optional, Tuple
 
-import librosa
 import numpy as np
-from smart_open import open
-from moviepy import VideoFileClip
 
 from mirdata import core, download_utils, io
+from mirdata.lazy import lazy_import, open
+
+moviepy = lazy_import("moviepy", extra="multivox")
+
+
+def VideoFileClip(*args, **kwargs):
+    """moviepy.VideoFileClip, importing moviepy on first use"""
+    return moviepy.VideoFileClip(*args, **kwargs)
 
-try:
-    from moviepy import VideoFileClip
-except ImportError as E:
-    logging.error(
-        "In order to use Multivox, you must have MoviePy installed. "
-        "Please reinstall mirdata using `pip install 'mirdata[multivox]'"
-    )
-    raise
 
 BIBTEX = """
 @inproceedings{meza2025multivox,
@@ -395,17 +391,22 @@ class SingerPosition:
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a MULTIVOX audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False, offset=offset, duration=duration)
 
 
 def load_video(video_path: str) -> np.ndarray:
@@ -909,7 +910,7 @@ class Track(core.Track):
         strings = sorted([x for x in unique if x is not None])
         return strings + ([None] if none_present else [])
 
-    @property
+    @core.audio_property
     def audio_ortf_l(self) -> Tuple[np.ndarray, float]:
         """Load ORTF left channel audio
 
@@ -923,7 +924,7 @@ class Track(core.Track):
             )
         return load_audio(self.audio_ortf_l_path)
 
-    @property
+    @core.audio_property
     def audio_ortf_r(self) -> Tuple[np.ndarray, float]:
         """Load ORTF right channel audio
 
@@ -937,7 +938,7 @@ class Track(core.Track):
             )
         return load_audio(self.audio_ortf_r_path)
 
-    @property
+    @core.audio_property
     def audio_ortf_stereo(self) -> Tuple[np.ndarray, float]:
         """Load combined ORTF stereo audio (L and R channels)
 
@@ -955,7 +956,7 @@ class Track(core.Track):
 
         return stereo, float(l_sr)
 
-    @property
+    @core.audio_property
     def audio_360(self) -> Optional[Tuple[np.ndarray, float]]:
         """Load 360° camera audio (stereo audio from Insta360 X3 action camera)
 
@@ -40,12 +40,12 @@ import re
 from pathlib import Path
 from typing import BinaryIO, Optional, Tuple, Dict, List
 
-import librosa
 import numpy as np
-import pandas as pd
-from smart_open import open
 
 from mirdata import download_utils, core, io
+from mirdata.lazy import lazy_import, open
+
+pd = lazy_import("pandas")
 
 BIBTEX = """
 @inproceedings{DBLP:conf/ismir/HumphreyDM18,
@@ -237,7 +237,7 @@ class Track(core.Track):
         """
         return self._track_metadata.get("start_time")
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -265,13 +265,18 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an OpenMIC2018 audio file.
 
     Audio will be resampled to 44100 Hz and downmixed to mono.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the audio signal
@@ -279,7 +284,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
 
     """
     # -- load as 44100 mono
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True, offset=offset, duration=duration)
 
 
 # -- use this decorator so the docs are complete
@@ -17,11 +17,10 @@ import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import annotations, core, download_utils, io
+from mirdata.lazy import open
 
 BIBTEX = """@article{bosch2016evaluation,
     title={Evaluation and combination of pitch estimation methods for melody extraction in symphonic classical music},
@@ -143,7 +142,7 @@ class Track(core.Track):
     def melody(self) -> Optional[annotations.F0Data]:
         return load_melody(self.melody_path)
 
-    @property
+    @core.audio_property
     def audio_mono(self) -> Optional[Tuple[np.ndarray, float]]:
         """the track's audio (mono)
 
@@ -154,7 +153,7 @@ class Track(core.Track):
         """
         return load_audio_mono(self.audio_path_mono)
 
-    @property
+    @core.audio_property
     def audio_stereo(self) -> Optional[Tuple[np.ndarray, float]]:
         """the track's audio (stereo)
 
@@ -167,33 +166,43 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio_mono(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio_mono(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an Orchset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_bytes_io
-def load_audio_stereo(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio_stereo(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an Orchset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the stereo audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
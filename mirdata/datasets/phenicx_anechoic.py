@@ -48,10 +48,12 @@
 from typing import BinaryIO, Optional, TextIO, Tuple, cast
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, download_utils, io
+from mirdata.lazy import lazy_import
+
+librosa = lazy_import("librosa")
 
 BIBTEX = """
 @article{miron2016score,
@@ -148,7 +150,7 @@ class Track(core.Track):
         self.notes_path = self.get_path("notes")
         self.notes_original_path = self.get_path("notes_original")
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """the track's audio
 
@@ -331,18 +333,23 @@ class MultiTrack(core.MultiTrack):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Phenicx-Anechoic audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
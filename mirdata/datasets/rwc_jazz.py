@@ -47,7 +47,6 @@ from typing import Optional, Tuple
 
 from deprecated.sphinx import deprecated
 import numpy as np
-from smart_open import open
 
 from mirdata import annotations, core, download_utils
 
@@ -59,6 +58,7 @@ from mirdata.datasets.rwc_classical import (
     _duration_to_sec,
     LICENSE_INFO,
 )
+from mirdata.lazy import open
 
 BIBTEX = """@inproceedings{goto2002rwc,
   title={RWC Music Database: Popular, Classical and Jazz Music Databases.},
@@ -186,7 +186,7 @@ class Track(core.Track):
     def beats(self) -> Optional[annotations.BeatData]:
         return load_beats(self.beats_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
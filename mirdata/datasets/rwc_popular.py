@@ -19,7 +19,6 @@ from typing import Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
 import numpy as np
-from smart_open import open
 
 from mirdata import annotations, core, download_utils, io
 
@@ -31,6 +30,7 @@ from mirdata.datasets.rwc_classical import (
     _duration_to_sec,
     LICENSE_INFO,
 )
+from mirdata.lazy import open
 
 BIBTEX = """@inproceedings{goto2002rwc,
   title={RWC Music Database: Popular, Classical and Jazz Music Databases.},
@@ -212,7 +212,7 @@ class Track(core.Track):
     def vocal_instrument_activity(self) -> Optional[annotations.EventData]:
         return load_vocal_activity(self.voca_inst_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
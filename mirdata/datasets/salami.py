@@ -20,12 +20,11 @@ import os
 from typing import Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 import logging
-from smart_open import open
 
 from mirdata import annotations, core, download_utils, io
+from mirdata.lazy import open
 
 BIBTEX = """@inproceedings{smith2011salami,
     title={Design and creation of a large-scale database of structural annotations.},
@@ -218,7 +217,7 @@ class Track(core.Track):
         )
         return load_sections(self.sections_annotator2_lowercase_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Tuple[np.ndarray, float]:
         """The track's audio
 
@@ -230,19 +229,23 @@ class Track(core.Track):
         return load_audio(self.audio_path)
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(fpath: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fpath: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Salami audio file.
 
     Args:
         fpath (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=None, mono=True)
+    return io.load_audio(fpath, sr=None, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
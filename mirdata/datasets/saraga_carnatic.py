@@ -34,7 +34,6 @@ import csv
 import json
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, download_utils, io
@@ -182,7 +181,7 @@ class Track(core.Track):
     def phrases(self):
         return load_phrases(self.phrases_path)
 
-    @property
+    @core.audio_property
     def audio(self):
         """The track's audio
 
@@ -218,12 +217,14 @@ def load_metadata(fhandle):
     return json.load(fhandle)
 
 
-# no decorator here because of https://github.com/librosa/librosa/issues/1267
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load a Saraga Carnatic audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -232,7 +233,9 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(
+        audio_path, sr=44100, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
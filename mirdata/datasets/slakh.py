@@ -27,16 +27,19 @@
 """
 
 import os
-from typing import BinaryIO, Optional, Tuple
+from typing import BinaryIO, Optional, Tuple, TYPE_CHECKING
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-import pretty_midi
-from smart_open import open
-import yaml
 
 from mirdata import io, download_utils, core, annotations
+from mirdata.lazy import lazy_import, open
+
+if TYPE_CHECKING:
+    import pretty_midi
+else:
+    pretty_midi = lazy_import("pretty_midi")
+yaml = lazy_import("yaml")
 
 BIBTEX = """
 @inproceedings{manilow2019cutting,
@@ -201,7 +204,7 @@ class Track(core.Track):
         return group[0]
 
     @core.cached_property
-    def midi(self) -> Optional[pretty_midi.PrettyMIDI]:
+    def midi(self) -> "Optional[pretty_midi.PrettyMIDI]":
         return io.load_midi(self.midi_path)
 
     @core.cached_property
@@ -214,7 +217,7 @@ class Track(core.Track):
             self.midi_path, self.midi, skip_drums=True, pitch_bend=False
         )
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -309,7 +312,7 @@ class MultiTrack(core.MultiTrack):
         return self._multitrack_metadata.get("overall_gain")
 
     @core.cached_property
-    def midi(self) -> Optional[pretty_midi.PrettyMIDI]:
+    def midi(self) -> "Optional[pretty_midi.PrettyMIDI]":
         return io.load_midi(self.midi_path)
 
     @core.cached_property
@@ -324,7 +327,7 @@ class MultiTrack(core.MultiTrack):
             self.midi_path, self.midi, skip_drums=True, pitch_bend=False
         )
 
-    @property
+    @core.audio_property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The track's audio
 
@@ -379,18 +382,23 @@ class MultiTrack(core.MultiTrack):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a slakh audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False, offset=offset, duration=duration)
 
 
 @core.docstring_inherit(core.Dataset)
@@ -48,11 +48,10 @@ import os
 from typing import TextIO, Tuple, Optional
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from smart_open import open
 
 from mirdata import annotations, core, io
+from mirdata.lazy import open
 
 BIBTEX = """
 Music material:
@@ -156,7 +155,7 @@ class Track(core.Track):
     def tuning_frequency(self):
         return _load_tuning_frequency(self.notes_path)
 
-    @property
+    @core.audio_property
     def audio(self) -> Tuple[np.ndarray, float]:
         """The track's audio
 
@@ -188,18 +187,23 @@ class Track(core.Track):
         return load_notes(self.notes_path)
 
 
-def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a TONAS audio file.
 
     Args:
         fhandle (str): path to an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True, offset=offset, duration=duration)
 
 
 @io.coerce_to_string_io
@@ -1,22 +1,34 @@
 """Utilities for downloading from the web."""
 
 import chardet
+import concurrent.futures
 import glob
+import hashlib
 import logging
 import os
+import queue
 import shutil
 import tarfile
+import threading
+import urllib.error
 import urllib.request
 import zipfile
 import warnings
 
 from tqdm import tqdm
-from smart_open import open, parse_uri
-
+from mirdata.lazy import open, smart_open
 from mirdata.validate import md5
 
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
 
+# downloads are written to <filename>.part, and renamed once the checksum passes
+PART_SUFFIX = ".part"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+# terminal line of the progress bars of the current download worker, if any
+_progress_position = threading.local()
+
 
 class RemoteFileMetadata(object):
     """The metadata for a remote file
@@ -50,6 +62,9 @@ def downloader(
     force_overwrite=False,
     cleanup=False,
     allow_invalid_checksum=False,
+    max_workers=1,
+    stream=False,
+    extract_paths=None,
 ):
     """Download data to `save_dir` and optionally log a message.
 
@@ -75,6 +90,19 @@ def downloader(
         allow_invalid_checksum (bool):
             Allow having an invalid checksum, and whenever this happens prompt a
             warning instead of deleting the files.
+        max_workers (int):
+            Maximum number of remotes downloaded concurrently. Each archive is
+            extracted as soon as its download finishes, with up to max_workers
+            zip members extracted concurrently.
+        stream (bool):
+            If True, tar archives (including .tar.gz and .tar.bz2) are
+            extracted while they download and are never written to disk, see
+            stream_tar_file. Zip archives can't be read as a stream, and are
+            downloaded as usual.
+        extract_paths (set or None):
+            If given, only the archive members which end up at one of these
+            paths (relative to save_dir, see index_file_paths) are extracted.
+            If None, archives are extracted entirely.
 
     """
     if not os.path.exists(save_dir):
@@ -133,74 +161,322 @@ def downloader(
         else:
             logging.warning("Downloading {} to {}".format(objs_to_download, save_dir))
 
+        if max_workers > 1 and len(objs_to_download) > 1:
+            unpacked = _download_concurrently(
+                objs_to_download,
+                remotes,
+                save_dir,
+                force_overwrite,
+                cleanup,
+                allow_invalid_checksum,
+                max_workers,
+                stream,
+                extract_paths,
+            )
+            if not unpacked:
+                return
+        else:
+            for k in objs_to_download:
+                logging.warning("[{}] downloading {}".format(k, remotes[k].filename))
+                extension = os.path.splitext(remotes[k].filename)[-1]
+                member_filter = _member_filter(k, remotes[k], extract_paths)
+                if ".zip" in extension:
+                    download_zip_file(
+                        remotes[k],
+                        save_dir,
+                        force_overwrite,
+                        cleanup,
+                        allow_invalid_checksum,
+                        member_filter=member_filter,
+                        workers=max_workers,
+                    )
+                elif _is_tar(extension) and stream:
+                    stream_tar_file(
+                        remotes[k],
+                        save_dir,
+                        allow_invalid_checksum,
+                        member_filter=member_filter,
+                    )
+                elif _is_tar(extension):
+                    download_tar_file(
+                        remotes[k],
+                        save_dir,
+                        force_overwrite,
+                        cleanup,
+                        allow_invalid_checksum,
+                        member_filter=member_filter,
+                    )
+                else:
+                    download_path = download_from_remote(
+                        remotes[k], save_dir, force_overwrite, allow_invalid_checksum
+                    )
+                    if k == "index":
+                        _unzip_index(remotes[k], download_path)
+
+                if not _unpack_directories(
+                    remotes[k], save_dir, filtered=member_filter is not None
+                ):
+                    return
+
+    if info_message is not None:
+        logging.warning(info_message.format(save_dir))
+
+
+def _download_concurrently(
+    objs_to_download,
+    remotes,
+    save_dir,
+    force_overwrite,
+    cleanup,
+    allow_invalid_checksum,
+    max_workers,
+    stream,
+    extract_paths,
+):
+    """Download remotes in a thread pool, and extract each one in the calling
+    thread as soon as its download finishes, while the others keep downloading.
+
+    Returns:
+        bool: False if the unpack directories of a remote were not found
+
+    """
+    unpacked = True
+    # each running download draws its progress bar on its worker slot's line
+    slots: queue.Queue = queue.Queue()
+    for slot in range(max_workers):
+        slots.put(slot)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
         for k in objs_to_download:
             logging.warning("[{}] downloading {}".format(k, remotes[k].filename))
             extension = os.path.splitext(remotes[k].filename)[-1]
-            if ".zip" in extension:
-                download_zip_file(
+            if stream and _is_tar(extension):
+                future = executor.submit(
+                    _in_slot,
+                    slots,
+                    stream_tar_file,
                     remotes[k],
                     save_dir,
-                    force_overwrite,
-                    cleanup,
                     allow_invalid_checksum,
+                    member_filter=_member_filter(k, remotes[k], extract_paths),
                 )
-            elif ".gz" in extension or ".tar" in extension or ".bz2" in extension:
-                download_tar_file(
+            else:
+                future = executor.submit(
+                    _in_slot,
+                    slots,
+                    download_from_remote,
                     remotes[k],
                     save_dir,
                     force_overwrite,
-                    cleanup,
                     allow_invalid_checksum,
                 )
-            else:
-                download_path = download_from_remote(
-                    remotes[k], save_dir, force_overwrite, allow_invalid_checksum
+            futures[future] = k
+
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                k = futures[future]
+                download_path = future.result()
+                extension = os.path.splitext(remotes[k].filename)[-1]
+                member_filter = _member_filter(k, remotes[k], extract_paths)
+                if ".zip" in extension:
+                    unzip(
+                        download_path,
+                        cleanup=cleanup,
+                        workers=max_workers,
+                        member_filter=member_filter,
+                    )
+                elif _is_tar(extension) and not stream:
+                    untar(download_path, cleanup=cleanup, member_filter=member_filter)
+                elif k == "index":
+                    _unzip_index(remotes[k], download_path)
+
+                unpacked = (
+                    _unpack_directories(
+                        remotes[k], save_dir, filtered=member_filter is not None
+                    )
+                    and unpacked
                 )
+        except BaseException:
+            # don't start the downloads which are still queued
+            for future in futures:
+                future.cancel()
+            raise
 
-                # Special handling for index files that might be zipped
-                # Check if this is an index file and if the downloaded file is actually a zip
-                if k == "index" and download_path and os.path.exists(download_path):
-                    try:
-                        # Check if the downloaded file is a zip file by reading the magic bytes
-                        with open(download_path, "rb") as f:
-                            magic_bytes = f.read(2)
-                            if magic_bytes == b"PK":  # ZIP file magic number
-                                logging.info(
-                                    "Index file {} appears to be a ZIP archive, extracting...".format(
-                                        remotes[k].filename
-                                    )
-                                )
-                                unzip(
-                                    download_path, cleanup=False
-                                )  # Always cleanup zip for index files
-                    except Exception as e:
-                        logging.warning(
-                            "Could not check if index file is zipped: {}".format(e)
-                        )
+    return unpacked
 
-            if remotes[k].unpack_directories:
-                for src_dir in remotes[k].unpack_directories:
-                    # path to destination directory
-                    destination_dir = (
-                        os.path.join(save_dir, remotes[k].destination_dir)
-                        if remotes[k].destination_dir
-                        else save_dir
-                    )
-                    # path to directory to unpack
-                    source_dir = os.path.join(destination_dir, src_dir)
-
-                    if not os.path.exists(source_dir):
-                        logging.warning(
-                            "Data not downloaded, because it probably already exists on your computer. "
-                            + "Run .validate() to check, or rerun with force_overwrite=True to delete any "
-                            + "existing files and download from scratch"
+
+def _is_tar(extension):
+    """Check if a file extension is one of a (compressed) tar archive"""
+    return ".gz" in extension or ".tar" in extension or ".bz2" in extension
+
+
+def index_files(index, track_ids=None):
+    """Get the files referenced by a dataset index, with their checksums
+
+    Args:
+        index (dict): the dataset's index, as loaded from its json file
+        track_ids (list or None): if given, only the files of these track or
+            multitrack ids (and of the tracks of these multitracks) are
+            included, as well as the metadata files
+
+    Raises:
+        ValueError: if a track id is not in the index
+
+    Returns:
+        dict: {file path relative to the dataset's data_home: md5 checksum}
+
+    """
+    tracks = index.get("tracks") or {}
+    multitracks = index.get("multitracks") or {}
+
+    if track_ids is None:
+        selected = None
+    else:
+        unknown = [t for t in track_ids if t not in tracks and t not in multitracks]
+        if unknown:
+            raise ValueError("Track ids {} are not in the index".format(unknown))
+        selected = set(track_ids)
+        for mtrack_id in track_ids:
+            if mtrack_id in multitracks:
+                selected.update(multitracks[mtrack_id].get("tracks") or [])
+
+    entries = list((index.get("metadata") or {}).values())
+    for group in [tracks, multitracks]:
+        for item_id, files in group.items():
+            if selected is not None and item_id not in selected:
+                continue
+            entries.extend(v for k, v in files.items() if k != "tracks")
+
+    return {os.path.normpath(e[0]): e[1] for e in entries if e[0] is not None}
+
+
+def index_file_paths(index, track_ids=None):
+    """Get the paths of the files referenced by a dataset index, to extract
+    only these files from the downloaded archives.
+
+    Args:
+        index (dict): the dataset's index, as loaded from its json file
+        track_ids (list or None): see index_files
+
+    Raises:
+        ValueError: if a track id is not in the index
+
+    Returns:
+        set: file paths relative to the dataset's data_home
+
+    """
+    return set(index_files(index, track_ids))
+
+
+def _member_filter(key, remote, extract_paths):
+    """Build a filter of the archive members of a remote which are needed
+
+    A member's final path is its path in the archive, inside the remote's
+    destination_dir, and with any of its unpack_directories removed. Members
+    are kept if their final path is in extract_paths, or is a parent
+    directory of one.
+
+    Args:
+        key (str): the remote's key. The index is never filtered
+        remote (RemoteFileMetadata): the remote
+        extract_paths (set or None): paths to extract, see index_file_paths
+
+    Returns:
+        function or None: function of a member name returning True if the
+        member should be extracted, or None if every member is
+
+    """
+    if extract_paths is None or key == "index":
+        return None
+
+    wanted = set(extract_paths)
+    for path in extract_paths:
+        parent = os.path.dirname(path)
+        while parent and parent not in wanted:
+            wanted.add(parent)
+            parent = os.path.dirname(parent)
+
+    destination_dir = remote.destination_dir or ""
+    prefixes = [d.strip("/") + "/" for d in remote.unpack_directories or []]
+
+    def _keep(member_name):
+        name = member_name.rstrip("/")
+        candidates = [name] + [
+            name[len(p) :] for p in prefixes if (name + "/").startswith(p)
+        ]
+        return any(
+            os.path.normpath(os.path.join(destination_dir, c)) in wanted
+            for c in candidates
+        )
+
+    return _keep
+
+
+def _unzip_index(remote, download_path):
+    """Special handling for index files that might be zipped
+
+    Args:
+        remote (RemoteFileMetadata): the index's remote
+        download_path (str): path to the downloaded index
+
+    """
+    # Check if this is an index file and if the downloaded file is actually a zip
+    if download_path and os.path.exists(download_path):
+        try:
+            # Check if the downloaded file is a zip file by reading the magic bytes
+            with open(download_path, "rb") as f:
+                magic_bytes = f.read(2)
+                if magic_bytes == b"PK":  # ZIP file magic number
+                    logging.info(
+                        "Index file {} appears to be a ZIP archive, extracting...".format(
+                            remote.filename
                         )
-                        return
+                    )
+                    unzip(
+                        download_path, cleanup=False
+                    )  # Always cleanup zip for index files
+        except Exception as e:
+            logging.warning("Could not check if index file is zipped: {}".format(e))
 
-                    move_directory_contents(source_dir, destination_dir)
 
-    if info_message is not None:
-        logging.warning(info_message.format(save_dir))
+def _unpack_directories(remote, save_dir, filtered=False):
+    """Move the contents of a remote's unpack_directories to its destination
+
+    Args:
+        remote (RemoteFileMetadata): the remote
+        save_dir (str): The directory the data was downloaded to
+        filtered (bool): if True, only some members of the remote's archive
+            were extracted, so an unpack directory may not exist because
+            none of its files were needed
+
+    Returns:
+        bool: False if an unpack directory does not exist
+
+    """
+    if remote.unpack_directories:
+        for src_dir in remote.unpack_directories:
+            # path to destination directory
+            destination_dir = (
+                os.path.join(save_dir, remote.destination_dir)
+                if remote.destination_dir
+                else save_dir
+            )
+            # path to directory to unpack
+            source_dir = os.path.join(destination_dir, src_dir)
+
+            if not os.path.exists(source_dir) and filtered:
+                continue
+            if not os.path.exists(source_dir):
+                logging.warning(
+                    "Data not downloaded, because it probably already exists on your computer. "
+                    + "Run .validate() to check, or rerun with force_overwrite=True to delete any "
+                    + "existing files and download from scratch"
+                )
+                return False
+
+            move_directory_contents(source_dir, destination_dir)
+    return True
 
 
 class DownloadProgressBar(tqdm):
@@ -214,27 +490,193 @@ class DownloadProgressBar(tqdm):
         self.update(b * bsize - self.n)
 
 
-def download_from_remote(remote, save_dir, force_overwrite, allow_invalid_checksum):
-    """Download a remote dataset into path
-    Fetch a dataset pointed by remote's url, save into path using remote's
-    filename and ensure its integrity based on the MD5 Checksum of the
-    downloaded file.
+def _in_slot(slots, function, *args, **kwargs):
+    """Run a download in a worker thread, drawing its progress bar on the line
+    of a free worker slot
+
+    Args:
+        slots (queue.Queue): the free slots
+        function (function): the download function
+        *args: passed to function
+        **kwargs: passed to function
+
+    Returns:
+        the return value of function
+
+    """
+    slot = slots.get()
+    _progress_position.value = slot
+    try:
+        return function(*args, **kwargs)
+    finally:
+        _progress_position.value = None
+        slots.put(slot)
 
-    Adapted from scikit-learn's sklearn.datasets.base._fetch_remote.
+
+def _progress_bar(desc):
+    """Create the progress bar of a download. In a concurrent download, the bar
+    stays on its worker slot's line, and is removed when it is done.
 
     Args:
-        remote (RemoteFileMetadata): Named tuple containing remote dataset
-            meta information: url, filename and checksum
-        save_dir (str): Directory to save the file to. Usually `data_home`
-        force_overwrite  (bool):
-            If True, overwrite existing file with the downloaded file.
-            If False, does not overwrite, but checks that checksum is consistent.
+        desc (str): the bar's description, e.g. the file name
 
     Returns:
-        str: Full path of the created file.
+        DownloadProgressBar: the progress bar
+
+    """
+    position = getattr(_progress_position, "value", None)
+    return DownloadProgressBar(
+        unit="B",
+        unit_scale=True,
+        unit_divisor=1024,
+        miniters=1,
+        desc=desc,
+        position=position,
+        leave=position is None,
+    )
+
+
+def download_to_part_file(url, part_path, progress_bar=None, expected_checksum=None):
+    """Download a url to a partial file, resuming it if it already exists.
+
+    If part_path exists, only the missing bytes are requested with an HTTP
+    Range header. If the server does not support range requests, or answers
+    with another range, the file is downloaded from the start. If the server
+    answers that the range is not satisfiable (416) and the partial file is
+    already complete, according to the response's Content-Range or to
+    expected_checksum, it is not downloaded again.
+
+    The md5 checksum is computed on the bytes as they are written, so the
+    file is not read back from disk (except for the already downloaded part
+    of a resumed download).
+
+    Args:
+        url (str): the url to download
+        part_path (str): path of the partial file
+        progress_bar (DownloadProgressBar or None): progress bar to update
+        expected_checksum (str or None): md5 checksum of the complete file, if
+            known
+
+    Returns:
+        str: md5 checksum of the complete file
 
     """
-    file_uri = parse_uri(save_dir)
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    request = urllib.request.Request(url)
+    if offset > 0:
+        request.add_header("Range", "bytes={}-".format(offset))
+
+    try:
+        response = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as exc:
+        if offset > 0 and exc.code == 416:
+            if _is_complete(part_path, offset, exc.headers, expected_checksum):
+                # the download was interrupted after its last byte
+                if progress_bar is not None:
+                    progress_bar.total = offset
+                    progress_bar.update(offset)
+                return md5(part_path)
+            # the partial file is not a prefix of the remote file: start over
+            os.remove(part_path)
+            return download_to_part_file(
+                url, part_path, progress_bar, expected_checksum
+            )
+        raise
+
+    if (
+        offset > 0
+        and response.getcode() == 206
+        and not response.headers.get("Content-Range", "").startswith(
+            "bytes {}-".format(offset)
+        )
+    ):
+        # the server sent another range than the one requested: start over
+        response.close()
+        os.remove(part_path)
+        return download_to_part_file(url, part_path, progress_bar, expected_checksum)
+
+    with response:
+        resumed = offset > 0 and response.getcode() == 206
+        hash_md5 = hashlib.md5()
+        if resumed:
+            logging.info("Resuming download of {} at byte {}".format(url, offset))
+            with open(part_path, "rb", compression="disable") as fhandle:
+                for chunk in iter(lambda: fhandle.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    hash_md5.update(chunk)
+        else:
+            offset = 0
+
+        length = response.headers.get("Content-Length")
+        length = int(length) if length is not None else None
+        if progress_bar is not None:
+            if length is not None:
+                progress_bar.total = offset + length
+            progress_bar.update(offset)
+
+        received = 0
+        with open(
+            part_path, "ab" if resumed else "wb", compression="disable"
+        ) as fhandle:
+            for chunk in iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b""):
+                fhandle.write(chunk)
+                hash_md5.update(chunk)
+                received += len(chunk)
+                if progress_bar is not None:
+                    progress_bar.update(len(chunk))
+
+    if length is not None and received < length:
+        raise urllib.error.ContentTooShortError(
+            "The connection was closed after {} of {} bytes".format(received, length),
+            None,
+        )
+    return hash_md5.hexdigest()
+
+
+def _is_complete(part_path, size, headers, expected_checksum):
+    """Check if a partial download, for which the server answered 416 Range
+    Not Satisfiable, is actually complete
+
+    Args:
+        part_path (str): path of the partial file
+        size (int): size of the partial file
+        headers (email.message.Message or None): headers of the 416 response
+        expected_checksum (str or None): md5 checksum of the complete file
+
+    Returns:
+        bool: True if the partial file is the complete file
+
+    """
+    content_range = headers.get("Content-Range", "") if headers else ""
+    if content_range.startswith("bytes */"):
+        # e.g. "bytes */12345", the size of the remote file
+        try:
+            return int(content_range[len("bytes */") :]) == size
+        except ValueError:
+            pass
+    return expected_checksum is not None and md5(part_path) == expected_checksum
+
+
+def _check_checksum(download_path, checksum, expected, allow_invalid_checksum):
+    """Raise (or warn, if allow_invalid_checksum) if a checksum differs from expected"""
+    if checksum != expected:
+        if allow_invalid_checksum:
+            warnings.warn(
+                "{} has an MD5 checksum ({}) "
+                "differing from expected ({}), "
+                "file may be corrupted.".format(download_path, checksum, expected),
+                UserWarning,
+            )
+        else:
+            raise IOError(
+                "{} has an MD5 checksum ({}) "
+                "differing from expected ({}), "
+                "file may be corrupted.".format(download_path, checksum, expected)
+            )
+
+
+def _make_download_dir(remote, save_dir):
+    """Create and return the local directory a remote is downloaded to"""
+    file_uri = smart_open.parse_uri(save_dir)
     if file_uri.scheme != "file":
         raise NotImplementedError(
             "mirdata only supports downloading to a local filesystem. "
@@ -248,65 +690,91 @@ def download_from_remote(remote, save_dir, force_overwrite, allow_invalid_checks
 
     if not os.path.exists(download_dir):
         os.makedirs(download_dir)
+    return download_dir
+
+
+def download_from_remote(remote, save_dir, force_overwrite, allow_invalid_checksum):
+    """Download a remote dataset into path
+    Fetch a dataset pointed by remote's url, save into path using remote's
+    filename and ensure its integrity based on the MD5 Checksum of the
+    downloaded file.
 
+    The data is first written to ``<filename>.part``. An interrupted download
+    is resumed from where it stopped when the server supports HTTP Range
+    requests, and the file is only renamed to its final name once its
+    checksum is valid (or allow_invalid_checksum is True).
+
+    Adapted from scikit-learn's sklearn.datasets.base._fetch_remote.
+
+    Args:
+        remote (RemoteFileMetadata): Named tuple containing remote dataset
+            meta information: url, filename and checksum
+        save_dir (str): Directory to save the file to. Usually `data_home`
+        force_overwrite  (bool):
+            If True, overwrite existing file with the downloaded file, and
+            discard any partial download.
+            If False, does not overwrite, but checks that checksum is consistent.
+        allow_invalid_checksum (bool):
+            If True, keep files with an invalid checksum and warn instead of raising
+
+    Returns:
+        str: Full path of the created file.
+
+    """
+    download_dir = _make_download_dir(remote, save_dir)
     download_path = os.path.join(download_dir, remote.filename)
+    part_path = download_path + PART_SUFFIX
 
-    if not os.path.exists(download_path) or force_overwrite:
-        # if we got here, we want to overwrite any existing file
-        if os.path.exists(download_path):
-            os.remove(download_path)
-
-        # If file doesn't exist or we want to overwrite, download it
-        with DownloadProgressBar(
-            unit="B", unit_scale=True, unit_divisor=1024, miniters=1
-        ) as t:
-            try:
-                urllib.request.urlretrieve(
-                    remote.url,
-                    filename=download_path,
-                    reporthook=t.update_to,
-                    data=None,
-                )
-            except Exception as exc:
-                error_msg = """
-                            mirdata failed to download the dataset from {}!
-                            Please try again in a few minutes.
-                            If this error persists, please raise an issue at
-                            https://github.com/mir-dataset-loaders/mirdata,
-                            and tag it with 'broken-link'.
-                            """.format(remote.url)
-                logging.error(error_msg)
-                raise exc
-    else:
+    if os.path.exists(download_path) and not force_overwrite:
         logging.warning(
             "{} already exists and will not be downloaded. ".format(download_path)
             + "Rerun with force_overwrite=True to delete this file and force the download."
         )
-
-    checksum = md5(download_path)
-    if remote.checksum != checksum:
-        if allow_invalid_checksum:
-            warnings.warn(
-                "{} has an MD5 checksum ({}) "
-                "differing from expected ({}), "
-                "file may be corrupted.".format(
-                    download_path, checksum, remote.checksum
-                ),
-                UserWarning,
-            )
-        else:
-            raise IOError(
-                "{} has an MD5 checksum ({}) "
-                "differing from expected ({}), "
-                "file may be corrupted.".format(
-                    download_path, checksum, remote.checksum
-                )
+        _check_checksum(
+            download_path, md5(download_path), remote.checksum, allow_invalid_checksum
+        )
+        return download_path
+
+    # if we got here, we want to overwrite any existing file
+    if os.path.exists(download_path):
+        os.remove(download_path)
+    if force_overwrite and os.path.exists(part_path):
+        os.remove(part_path)
+
+    # download to a .part file, which is resumed if the transfer is interrupted
+    with _progress_bar(remote.filename) as t:
+        try:
+            checksum = download_to_part_file(
+                remote.url, part_path, t, expected_checksum=remote.checksum
             )
+        except Exception as exc:
+            error_msg = """
+                        mirdata failed to download the dataset from {}!
+                        Please try again in a few minutes.
+                        If this error persists, please raise an issue at
+                        https://github.com/mir-dataset-loaders/mirdata,
+                        and tag it with 'broken-link'.
+                        """.format(remote.url)
+            logging.error(error_msg)
+            raise exc
+
+    if checksum != remote.checksum and not allow_invalid_checksum:
+        # a corrupted download can't be resumed, the next attempt starts over
+        os.remove(part_path)
+    else:
+        os.replace(part_path, download_path)
+    _check_checksum(download_path, checksum, remote.checksum, allow_invalid_checksum)
     return download_path
 
 
 def download_zip_file(
-    zip_remote, save_dir, force_overwrite, cleanup, allow_invalid_checksum
+    zip_remote,
+    save_dir,
+    force_overwrite,
+    cleanup,
+    allow_invalid_checksum,
+    member_filter=None,
+    workers=1,
 ):
     """Download and unzip a zip file.
 
@@ -319,74 +787,145 @@ def download_zip_file(
             If True, overwrites existing files
         cleanup (bool):
             If True, remove zipfile after unziping
+        member_filter (function or None):
+            If given, only the members for which member_filter(name) is True
+            are extracted
+        workers (int):
+            Number of zip members extracted concurrently
 
     """
     zip_download_path = download_from_remote(
         zip_remote, save_dir, force_overwrite, allow_invalid_checksum
     )
-    unzip(zip_download_path, cleanup=cleanup)
-
+    unzip(
+        zip_download_path,
+        cleanup=cleanup,
+        workers=workers,
+        member_filter=member_filter,
+    )
 
-def extractall_unicode(zfile, out_dir):
-    """Extract all files inside a zip archive to a output directory.
 
-    In comparison to the zipfile, it checks for correct file name encoding
+def _zip_member_filename(member):
+    """Get a zip member's filename, repairing filenames which were not
+    encoded in utf-8 (e.g. in the irmas and good-sounds archives)
 
     Args:
-        zfile (obj): Zip file object created with zipfile.ZipFile
-        out_dir (str): Output folder
+        member (zipfile.ZipInfo): the zip member
+
+    Returns:
+        str: the member's filename
 
     """
     ZIP_FILENAME_UTF8_FLAG = 0x800
 
-    for m in zfile.infolist():
-        data = zfile.read(m)  # extract zipped data into memory
+    filename = member.filename
+
+    # if block to deal with irmas and good-sounds archives
+    # check if the zip archive does not have the encoding info set
+    # encode-decode filename only if it's different than the original name
+    if (member.flag_bits & ZIP_FILENAME_UTF8_FLAG == 0) and filename.encode(
+        "cp437"
+    ).decode(errors="ignore") != filename:
+        filename_bytes = filename.encode("cp437")
+        if filename_bytes.decode("utf-8", "replace") != filename_bytes.decode(
+            errors="ignore"
+        ):
+            guessed_encoding = chardet.detect(filename_bytes)["encoding"] or "utf8"
+            filename = filename_bytes.decode(guessed_encoding, "replace")
+        else:
+            filename = filename_bytes.decode("utf-8", "replace")
 
-        filename = m.filename
+    return filename
 
-        # if block to deal with irmas and good-sounds archives
-        # check if the zip archive does not have the encoding info set
-        # encode-decode filename only if it's different than the original name
-        if (m.flag_bits & ZIP_FILENAME_UTF8_FLAG == 0) and filename.encode(
-            "cp437"
-        ).decode(errors="ignore") != filename:
-            filename_bytes = filename.encode("cp437")
-            if filename_bytes.decode("utf-8", "replace") != filename_bytes.decode(
-                errors="ignore"
-            ):
-                guessed_encoding = chardet.detect(filename_bytes)["encoding"] or "utf8"
-                filename = filename_bytes.decode(guessed_encoding, "replace")
-            else:
-                filename = filename_bytes.decode("utf-8", "replace")
 
-        disk_file_name = os.path.join(out_dir, filename)
+def _extract_zip_member(zfile, member, out_dir):
+    """Stream a zip member to disk in chunks, without loading it in memory"""
+    disk_file_name = os.path.join(out_dir, _zip_member_filename(member))
+
+    dir_name = os.path.dirname(disk_file_name)
+    os.makedirs(dir_name, exist_ok=True)
+
+    if not os.path.isdir(disk_file_name):
+        with zfile.open(member) as source:
+            with open(disk_file_name, "wb", compression="disable") as fd:
+                shutil.copyfileobj(source, fd, EXTRACT_CHUNK_SIZE)
+
 
-        dir_name = os.path.dirname(disk_file_name)
-        if not os.path.exists(dir_name):
-            os.makedirs(dir_name)
+def extractall_unicode(zfile, out_dir, workers=1, member_filter=None):
+    """Extract all files inside a zip archive to a output directory.
 
-        if not os.path.isdir(disk_file_name):
-            with open(disk_file_name, "wb") as fd:
-                fd.write(data)
+    In comparison to the zipfile, it checks for correct file name encoding.
+    Members are streamed to disk in chunks, so memory use does not depend on
+    their size.
 
+    Args:
+        zfile (obj): Zip file object created with zipfile.ZipFile
+        out_dir (str): Output folder
+        workers (int): number of members extracted concurrently. Each thread
+            reads from its own ZipFile, so this requires zfile to be opened
+            from a path.
+        member_filter (function or None): if given, only the members for
+            which member_filter(filename) is True are extracted
 
-def unzip(zip_path, cleanup):
+    """
+    members = zfile.infolist()
+    if member_filter is not None:
+        members = [m for m in members if member_filter(_zip_member_filename(m))]
+    if workers <= 1 or zfile.filename is None or len(members) <= 1:
+        for m in members:
+            _extract_zip_member(zfile, m, out_dir)
+        return
+
+    local = threading.local()
+    opened = []
+    lock = threading.Lock()
+
+    def _extract(member):
+        if not hasattr(local, "zfile"):
+            local.zfile = zipfile.ZipFile(zfile.filename, "r")
+            with lock:
+                opened.append(local.zfile)
+        _extract_zip_member(local.zfile, member, out_dir)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            # list() re-raises the first extraction error
+            list(executor.map(_extract, members))
+    finally:
+        for thread_zfile in opened:
+            thread_zfile.close()
+
+
+def unzip(zip_path, cleanup, workers=1, member_filter=None):
     """Unzip a zip file inside it's current directory.
 
     Args:
         zip_path (str): Path to zip file
         cleanup (bool): If True, remove zipfile after unzipping
+        workers (int): number of members extracted concurrently
+        member_filter (function or None): if given, only the members for
+            which member_filter(filename) is True are extracted
 
     """
     zfile = zipfile.ZipFile(zip_path, "r")
-    extractall_unicode(zfile, os.path.dirname(zip_path))
+    extractall_unicode(
+        zfile,
+        os.path.dirname(zip_path),
+        workers=workers,
+        member_filter=member_filter,
+    )
     zfile.close()
     if cleanup:
         os.remove(zip_path)
 
 
 def download_tar_file(
-    tar_remote, save_dir, force_overwrite, cleanup, allow_invalid_checksum
+    tar_remote,
+    save_dir,
+    force_overwrite,
+    cleanup,
+    allow_invalid_checksum,
+    member_filter=None,
 ):
     """Download and untar a tar file.
 
@@ -395,29 +934,143 @@ def download_tar_file(
         save_dir (str): Path to save downloaded file
         force_overwrite (bool): If True, overwrites existing files
         cleanup (bool): If True, remove tarfile after untarring
+        member_filter (function or None): if given, only the members for
+            which member_filter(name) is True are extracted
 
     """
     tar_download_path = download_from_remote(
         tar_remote, save_dir, force_overwrite, allow_invalid_checksum
     )
-    untar(tar_download_path, cleanup=cleanup)
+    untar(tar_download_path, cleanup=cleanup, member_filter=member_filter)
 
 
-def untar(tar_path, cleanup):
+def _filter_tar_members(tfile, member_filter):
+    """Iterate over the members of a tar file, optionally filtered. This works
+    on streamed tar files too, since members are read one at a time."""
+    for member in tfile:
+        if member_filter is None or member_filter(member.name):
+            yield member
+
+
+def untar(tar_path, cleanup, member_filter=None):
     """Untar a tar file inside it's current directory.
 
     Args:
         tar_path (str): Path to tar file
         cleanup (bool): If True, remove tarfile after untarring
+        member_filter (function or None): if given, only the members for
+            which member_filter(name) is True are extracted
 
     """
     tfile = tarfile.open(tar_path, "r")
-    tfile.extractall(os.path.dirname(tar_path))
+    tfile.extractall(
+        os.path.dirname(tar_path), members=_filter_tar_members(tfile, member_filter)
+    )
     tfile.close()
     if cleanup:
         os.remove(tar_path)
 
 
+class _HashingReader(object):
+    """File-like wrapper which computes the md5 of the bytes read through it"""
+
+    def __init__(self, fileobj, progress_bar=None):
+        self.fileobj = fileobj
+        self.progress_bar = progress_bar
+        self.hash_md5 = hashlib.md5()
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = self.fileobj.read(size)
+        self.hash_md5.update(chunk)
+        self.bytes_read += len(chunk)
+        if self.progress_bar is not None:
+            self.progress_bar.update(len(chunk))
+        return chunk
+
+    def drain(self):
+        """Read (and hash) anything left after the end of the archive"""
+        for _ in iter(lambda: self.read(DOWNLOAD_CHUNK_SIZE), b""):
+            pass
+
+
+def _merge_directory(source_dir, target_dir):
+    """Move every file of source_dir to the same relative path in target_dir,
+    overwriting existing files, then delete source_dir"""
+    for root, _, files in os.walk(source_dir):
+        target_root = os.path.join(target_dir, os.path.relpath(root, source_dir))
+        os.makedirs(target_root, exist_ok=True)
+        for fname in files:
+            os.replace(os.path.join(root, fname), os.path.join(target_root, fname))
+    shutil.rmtree(source_dir)
+
+
+def stream_tar_file(tar_remote, save_dir, allow_invalid_checksum, member_filter=None):
+    """Download and untar a tar file (optionally gz or bz2 compressed) in a
+    single pass, without writing the archive to disk.
+
+    Members are extracted to a staging directory as the bytes arrive, while
+    the archive's md5 checksum is computed. The staging directory is moved
+    into place only if the checksum is valid, and deleted otherwise. Unlike
+    download_tar_file, the archive is always downloaded, since it is never
+    stored.
+
+    Args:
+        tar_remote (RemoteFileMetadata): Object containing download information
+        save_dir (str): Path to save the extracted files
+        allow_invalid_checksum (bool): If True, keep the extracted files and warn
+            if the checksum is invalid, instead of raising
+        member_filter (function or None): if given, only the members for
+            which member_filter(name) is True are extracted
+
+    Returns:
+        str: the directory the archive was extracted to
+
+    """
+    download_dir = _make_download_dir(tar_remote, save_dir)
+    staging_dir = os.path.join(download_dir, "." + tar_remote.filename + ".staging")
+    if os.path.exists(staging_dir):
+        shutil.rmtree(staging_dir)
+
+    with _progress_bar(tar_remote.filename) as t:
+        try:
+            with urllib.request.urlopen(tar_remote.url) as response:
+                length = response.headers.get("Content-Length")
+                if length is not None:
+                    t.total = int(length)
+                reader = _HashingReader(response, progress_bar=t)
+                # "r|*" reads the archive as a stream, detecting the compression
+                with tarfile.open(fileobj=reader, mode="r|*") as tfile:
+                    tfile.extractall(
+                        staging_dir,
+                        members=_filter_tar_members(tfile, member_filter),
+                    )
+                reader.drain()
+            if length is not None and reader.bytes_read < int(length):
+                raise urllib.error.ContentTooShortError(
+                    "The connection was closed after {} of {} bytes".format(
+                        reader.bytes_read, length
+                    ),
+                    None,
+                )
+        except BaseException:
+            logging.error(
+                "mirdata failed to download and extract {}".format(tar_remote.url)
+            )
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+    checksum = reader.hash_md5.hexdigest()
+    if checksum != tar_remote.checksum and not allow_invalid_checksum:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    elif os.path.exists(staging_dir):
+        _merge_directory(staging_dir, download_dir)
+    _check_checksum(
+        tar_remote.url, checksum, tar_remote.checksum, allow_invalid_checksum
+    )
+    return download_dir
+
+
 def move_directory_contents(source_dir, target_dir):
     """Move the contents of source_dir into target_dir, and delete source_dir
 
@@ -1,12 +1,62 @@
 import functools
 import io
-from typing import Any, BinaryIO, Callable, List, Optional, TextIO, Union
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 import numpy as np
-import pretty_midi
-from smart_open import open
 
-from mirdata import annotations
+from mirdata import annotation_cache, annotations, archive, resample_cache
+from mirdata.lazy import lazy_import, open
+
+if TYPE_CHECKING:
+    import librosa
+    import pretty_midi
+    import soundfile
+else:
+    librosa = lazy_import("librosa")
+    pretty_midi = lazy_import("pretty_midi")
+    soundfile = lazy_import("soundfile")
+
+#: dtypes which audio can be decoded into
+AUDIO_DTYPES = ["float32", "float64", "int32", "int16"]
+
+
+def _load_cached(
+    func: Callable[..., Any],
+    file_path: str,
+    args: tuple,
+    kwargs: dict,
+    load: Callable[[], Any],
+) -> Any:
+    """Call a loader through the annotation cache, if it is enabled and the
+    file is local
+
+    Args:
+        func (function): the loader
+        file_path (str): path to the file passed to the loader
+        args (tuple): the loader's other positional arguments
+        kwargs (dict): the loader's keyword arguments
+        load (function): function without arguments calling the loader
+
+    Returns:
+        Any: the loader's result
+
+    """
+    cache = annotation_cache.get_cache()
+    if cache is not None and os.path.isfile(file_path):
+        return cache.load(func, file_path, args, kwargs, load)
+    return load()
 
 
 def coerce_to_string_io(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -19,8 +69,12 @@ def coerce_to_string_io(func: Callable[..., Any]) -> Callable[..., Any]:
         if not file_path_or_obj:
             return None
         if isinstance(file_path_or_obj, str):
-            with open(file_path_or_obj, encoding="utf-8") as f:
-                return func(f, *args, **kwargs)
+
+            def load():
+                with open(file_path_or_obj, encoding="utf-8") as f:
+                    return func(f, *args, **kwargs)
+
+            return _load_cached(func, file_path_or_obj, args, kwargs, load)
         elif isinstance(file_path_or_obj, io.StringIO):
             return func(file_path_or_obj, *args, **kwargs)
         else:
@@ -43,8 +97,12 @@ def coerce_to_bytes_io(func: Callable[..., Any]) -> Callable[..., Any]:
         if not file_path_or_obj:
             return None
         if isinstance(file_path_or_obj, str):
-            with open(file_path_or_obj, "rb") as f:
-                return func(f, *args, **kwargs)
+
+            def load():
+                with open(file_path_or_obj, "rb") as f:
+                    return func(f, *args, **kwargs)
+
+            return _load_cached(func, file_path_or_obj, args, kwargs, load)
         elif isinstance(file_path_or_obj, io.BytesIO):
             return func(file_path_or_obj, *args, **kwargs)
         else:
@@ -57,8 +115,436 @@ def coerce_to_bytes_io(func: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
+def _check_segment(offset: float, duration: Optional[float]) -> None:
+    if offset < 0:
+        raise ValueError("offset should be non-negative, got {}".format(offset))
+    if duration is not None and duration < 0:
+        raise ValueError("duration should be non-negative, got {}".format(duration))
+
+
+def load_audio(
+    path_or_fhandle: Union[str, BinaryIO],
+    sr: Optional[float] = None,
+    mono: bool = False,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+    dtype: str = "float32",
+) -> Tuple[np.ndarray, float]:
+    """Load an audio file, decoding it directly with libsndfile.
+
+    This replaces ``librosa.load(path_or_fhandle, sr=sr, mono=mono,
+    offset=offset, duration=duration)``: it returns the same float32 signal
+    (note that audio is not mixed down to mono by default), but can also
+    decode into other dtypes (e.g. int16, which halves the memory used). Frames are decoded into a preallocated
+    (n_samples, n_channels) buffer, and multichannel audio is returned as a
+    transposed view of it instead of a reordered copy, so it is not
+    C-contiguous. Formats which libsndfile can't read are decoded with
+    librosa, and converted to ``dtype``.
+
+    When the resample cache is enabled (see mirdata.resample_cache), whole
+    local files which need resampling are read from the cache.
+
+    Paths inside a zip or tar archive (see mirdata.archive) are decoded from
+    the archive member.
+
+    Args:
+        path_or_fhandle (str or file-like): path or file-like object pointing to
+            an audio file
+        sr (float or None): sample rate to resample to. If None, the file's
+            sample rate is kept
+        mono (bool): if True, average the channels
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment to load, in seconds.
+            If None, the audio is loaded until the end of the file
+        dtype (str): "float32", "float64", "int32" or "int16". Floats are
+            in [-1, 1], integers span the full range of the type.
+
+    Raises:
+        ValueError: If dtype is not supported, or offset or duration is
+            negative
+
+    Returns:
+        * np.ndarray - the audio signal, with shape (n_samples,) if mono or
+          the file has one channel, else (n_channels, n_samples)
+        * float - the sample rate of the audio signal
+
+    """
+    if dtype not in AUDIO_DTYPES:
+        raise ValueError(
+            "dtype should be one of {}, got {}".format(AUDIO_DTYPES, dtype)
+        )
+    _check_segment(offset, duration)
+    if isinstance(path_or_fhandle, str) and archive.is_archive_member(path_or_fhandle):
+        # libsndfile can't open paths inside archives: decode from the member
+        with open(path_or_fhandle, "rb", compression="disable") as fhandle:
+            return load_audio(
+                fhandle,
+                sr=sr,
+                mono=mono,
+                offset=offset,
+                duration=duration,
+                dtype=dtype,
+            )
+
+    # integer audio is resampled as floats
+    decode_dtype = "float32" if sr is not None and dtype.startswith("int") else dtype
+
+    cache = resample_cache.get_cache()
+    cache_path = None
+    if cache is not None and sr is not None and not offset and duration is None:
+        cache_path = _local_path(path_or_fhandle)
+        # files at the target sample rate aren't resampled, or hashed
+        if cache_path is not None and _header_sr(cache_path) == sr:
+            cache_path = None
+        if cache_path is not None:
+            cached = cache.read(cache_path, sr, mono)
+            if cached is not None:
+                return _convert_audio(cached, "float32", dtype), sr
+
+    position = None
+    if not isinstance(path_or_fhandle, str):
+        position = path_or_fhandle.tell()
+    try:
+        audio, sr_native = _read_soundfile(
+            path_or_fhandle, offset, duration, decode_dtype
+        )
+    except soundfile.LibsndfileError:
+        if position is not None and not isinstance(path_or_fhandle, str):
+            path_or_fhandle.seek(position)
+        audio, sr_native = librosa.load(
+            path_or_fhandle, sr=None, mono=False, offset=offset, duration=duration
+        )
+        decode_dtype = "float32"
+
+    if mono and audio.ndim > 1:
+        audio = _to_mono(audio, decode_dtype)
+
+    if sr is not None and sr != sr_native:
+        audio = librosa.resample(
+            audio.astype(np.float32, copy=False), orig_sr=sr_native, target_sr=sr
+        )
+        decode_dtype = "float32"
+        if cache_path is not None:
+            cache.write(cache_path, sr, mono, audio)
+    else:
+        sr = sr_native
+
+    return _convert_audio(audio, decode_dtype, dtype), sr
+
+
+def _header_sr(path: str) -> Optional[float]:
+    """Read the sample rate of an audio file from its header
+
+    Args:
+        path (str): path to an audio file
+
+    Returns:
+        float or None: the sample rate, or None if libsndfile can't read the file
+
+    """
+    try:
+        return read_audio_info(path)["sr"]
+    except soundfile.LibsndfileError:
+        return None
+
+
+def _local_path(path_or_fhandle: Union[str, BinaryIO]) -> Optional[str]:
+    """Get the path of a local audio file from a path or an open file
+
+    Args:
+        path_or_fhandle (str or file-like): path or file-like object pointing to
+            an audio file
+
+    Returns:
+        str or None: the path, or None if it is not a local file
+
+    """
+    path = getattr(path_or_fhandle, "name", path_or_fhandle)
+    if isinstance(path, str) and os.path.isfile(path):
+        return path
+    return None
+
+
+def _read_soundfile(
+    path_or_fhandle: Union[str, BinaryIO],
+    offset: float,
+    duration: Optional[float],
+    dtype: str,
+) -> Tuple[np.ndarray, float]:
+    """Decode frames of an audio file with libsndfile into a preallocated buffer
+
+    Args:
+        path_or_fhandle (str or file-like): path or file-like object pointing to
+            an audio file
+        offset (float): start of the segment to load, in seconds
+        duration (float or None): duration of the segment, in seconds
+        dtype (str): dtype decoded by libsndfile
+
+    Returns:
+        * np.ndarray - the audio signal, (n_samples,) or (n_channels, n_samples)
+        * float - the file's sample rate
+
+    """
+    with soundfile.SoundFile(path_or_fhandle) as sf_desc:
+        sr_native = sf_desc.samplerate
+        start = 0
+        if offset:
+            start = sf_desc.seek(int(offset * sr_native))
+        n_frames = sf_desc.frames - start
+        if duration is not None:
+            n_frames = min(n_frames, int(duration * sr_native))
+        buffer = np.empty((max(n_frames, 0), sf_desc.channels), dtype=dtype)
+        # the number of frames in the header may be an estimate (e.g. mp3)
+        buffer = sf_desc.read(out=buffer)
+
+    if buffer.shape[1] == 1:
+        return buffer[:, 0], sr_native
+    return buffer.T, sr_native
+
+
+def _to_mono(audio: np.ndarray, dtype: str) -> np.ndarray:
+    """Average the channels of (n_channels, n_samples) audio
+
+    Args:
+        audio (np.ndarray): the audio signal
+        dtype (str): the signal's dtype
+
+    Returns:
+        np.ndarray: the (n_samples,) mono signal, of the same dtype
+
+    """
+    if dtype.startswith("float"):
+        return np.mean(audio, axis=0)
+    return np.mean(audio, axis=0, dtype=np.float64).round().astype(dtype)
+
+
+def _convert_audio(audio: np.ndarray, from_dtype: str, to_dtype: str) -> np.ndarray:
+    """Convert audio between float and integer dtypes, as libsndfile does
+
+    Args:
+        audio (np.ndarray): the audio signal
+        from_dtype (str): the signal's dtype
+        to_dtype (str): the requested dtype
+
+    Returns:
+        np.ndarray: the converted signal
+
+    """
+    if from_dtype == to_dtype:
+        return audio
+    if to_dtype.startswith("float"):
+        if from_dtype.startswith("int"):
+            return audio.astype(to_dtype) / -np.iinfo(from_dtype).min
+        return audio.astype(to_dtype)
+    info = np.iinfo(to_dtype)
+    scaled = np.clip(audio * -float(info.min), info.min, info.max)
+    return np.round(scaled).astype(to_dtype)
+
+
 @coerce_to_bytes_io
-def load_midi(fhandle: BinaryIO) -> pretty_midi.PrettyMIDI:
+def load_audio_segment(
+    fhandle: BinaryIO,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+    sr: Optional[float] = None,
+    mono: bool = False,
+    dtype: str = "float32",
+) -> Tuple[np.ndarray, float]:
+    """Load a segment of an audio file.
+
+    For formats read by soundfile (e.g. wav, flac, ogg, mp3), the file is
+    seeked to ``offset`` and only the frames of the segment are decoded. Other
+    formats are decoded from the start of the file up to the end of the segment.
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start of the segment, in seconds
+        duration (float or None): duration of the segment, in seconds.
+            If None, the audio is loaded until the end of the file
+        sr (float or None): sample rate to resample to. If None, the file's
+            sample rate is kept
+        mono (bool): if True, mix the channels down to mono
+        dtype (str): dtype of the signal, see load_audio
+
+    Returns:
+        * np.ndarray - the audio signal, with shape (n_samples,) if mono or
+          the file has one channel, else (n_channels, n_samples)
+        * float - the sample rate of the audio signal
+
+    """
+    return load_audio(
+        fhandle, sr=sr, mono=mono, offset=offset, duration=duration, dtype=dtype
+    )
+
+
+def read_audio_info(path_or_fhandle: Union[str, BinaryIO]) -> dict:
+    """Read the length, sample rate and channels of an audio file from its
+    header, without decoding it
+
+    Args:
+        path_or_fhandle (str or file-like): path or file-like object pointing to
+            an audio file
+
+    Raises:
+        soundfile.LibsndfileError: If libsndfile can't read the file
+
+    Returns:
+        dict: the file's ``frames``, ``sr``, ``channels`` and ``format`` (e.g.
+        "WAV", "FLAC", "MP3" or "OGG")
+
+    """
+    if isinstance(path_or_fhandle, str) and archive.is_archive_member(path_or_fhandle):
+        with open(path_or_fhandle, "rb", compression="disable") as fhandle:
+            return read_audio_info(fhandle)
+    info = soundfile.info(path_or_fhandle)
+    return {
+        "frames": info.frames,
+        "sr": info.samplerate,
+        "channels": info.channels,
+        "format": info.format,
+    }
+
+
+#: numpy dtypes of the WAV sample formats which can be memory-mapped, by
+#: (format tag, bits per sample)
+WAV_DTYPES: Dict[Tuple[int, int], np.dtype] = {
+    (1, 8): np.dtype("u1"),
+    (1, 16): np.dtype("<i2"),
+    (1, 32): np.dtype("<i4"),
+    (3, 32): np.dtype("<f4"),
+    (3, 64): np.dtype("<f8"),
+}
+
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def read_wav_header(path: str) -> Optional[dict]:
+    """Read the header of a RIFF WAV file, without reading its samples
+
+    Args:
+        path (str): path to a local file
+
+    Returns:
+        dict or None: the WAV file's ``sr``, ``channels``, ``frames``,
+        ``dtype`` (the numpy dtype of its samples) and ``data_offset`` (the
+        byte offset of its first sample), or None if the file is not a WAV
+        file whose samples can be memory-mapped, e.g. compressed or 24 bit
+        audio
+
+    """
+    file_size = os.path.getsize(path)
+    with io.open(path, "rb") as fhandle:
+        riff = fhandle.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            return None
+        fmt = None
+        while True:
+            chunk_header = fhandle.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id = chunk_header[:4]
+            chunk_size = int.from_bytes(chunk_header[4:], "little")
+            if chunk_id == b"fmt ":
+                fmt = fhandle.read(chunk_size)
+                if chunk_size % 2:
+                    fhandle.seek(1, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                data_offset = fhandle.tell()
+                break
+            else:
+                # chunks are padded to an even number of bytes
+                fhandle.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+    if fmt is None or len(fmt) < 16:
+        return None
+    format_tag = int.from_bytes(fmt[0:2], "little")
+    channels = int.from_bytes(fmt[2:4], "little")
+    sr = int.from_bytes(fmt[4:8], "little")
+    block_align = int.from_bytes(fmt[12:14], "little")
+    bits_per_sample = int.from_bytes(fmt[14:16], "little")
+    if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        # the format tag is the start of the SubFormat GUID
+        format_tag = int.from_bytes(fmt[24:26], "little")
+
+    dtype = WAV_DTYPES.get((format_tag, bits_per_sample))
+    if dtype is None or channels == 0 or block_align != channels * dtype.itemsize:
+        return None
+
+    # the data chunk's size may be missing (0 or 0xFFFFFFFF) in streamed files
+    data_size = file_size - data_offset
+    if 0 < chunk_size < 0xFFFFFFFF:
+        data_size = min(chunk_size, data_size)
+    return {
+        "sr": sr,
+        "channels": channels,
+        "frames": data_size // block_align,
+        "dtype": dtype,
+        "data_offset": data_offset,
+    }
+
+
+def load_audio_memmap(
+    path: str,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+    dtype: str = "float32",
+) -> Tuple[np.ndarray, float]:
+    """Map the samples of an uncompressed WAV file into memory, without
+    decoding or copying them
+
+    For 8, 16 or 32 bit PCM and 32 or 64 bit float WAV files, the samples are
+    returned as a read-only ``np.memmap`` over the file's data chunk, in the
+    file's sample format (e.g. int16 samples are not scaled to [-1, 1]).
+    Reading a crop only reads the pages it touches, and processes mapping the
+    same file share the page cache. Other files (compressed, 24 bit, remote
+    or inside an archive) are decoded into ``dtype`` with load_audio_segment.
+
+    Args:
+        path (str): path to an audio file
+        offset (float): start of the segment to map, in seconds
+        duration (float or None): duration of the segment to map, in seconds.
+            If None, the audio is mapped until the end of the file
+        dtype (str): dtype of the audio when the file is decoded
+
+    Raises:
+        ValueError: If offset or duration is negative
+
+    Returns:
+        * np.ndarray - the audio signal, with shape (n_samples,) if the file
+          has one channel, else (n_channels, n_samples)
+        * float - the sample rate of the audio signal
+
+    """
+    _check_segment(offset, duration)
+    header = None
+    if os.path.isfile(path):
+        header = read_wav_header(path)
+    if header is None:
+        return load_audio_segment(path, offset=offset, duration=duration, dtype=dtype)
+
+    sr = header["sr"]
+    start = min(int(offset * sr), header["frames"])
+    n_frames = header["frames"] - start
+    if duration is not None:
+        n_frames = min(n_frames, int(duration * sr))
+    if n_frames == 0:
+        audio = np.empty((0, header["channels"]), dtype=header["dtype"])
+    else:
+        audio = np.memmap(
+            path,
+            dtype=header["dtype"],
+            mode="r",
+            offset=header["data_offset"]
+            + start * header["channels"] * header["dtype"].itemsize,
+            shape=(n_frames, header["channels"]),
+        )
+    if header["channels"] == 1:
+        return audio[:, 0], sr
+    return audio.T, sr
+
+
+@coerce_to_bytes_io
+def load_midi(fhandle: BinaryIO) -> "pretty_midi.PrettyMIDI":
     """Load a midi file.
 
     Args:
@@ -73,7 +559,7 @@ def load_midi(fhandle: BinaryIO) -> pretty_midi.PrettyMIDI:
 
 def load_notes_from_midi(
     midi_path: Optional[Union[str, BinaryIO]] = None,
-    midi: Optional[pretty_midi.PrettyMIDI] = None,
+    midi: "Optional[pretty_midi.PrettyMIDI]" = None,
     skip_drums: bool = True,
 ) -> Optional[annotations.NoteData]:
     """Load note data from a midi file
@@ -90,6 +576,16 @@ def load_notes_from_midi(
     """
     if not midi and not midi_path:
         raise ValueError("At least one of midi_path or midi must be provided")
+    elif not midi and isinstance(midi_path, str):
+        return _load_cached(
+            load_notes_from_midi,
+            midi_path,
+            (),
+            {"skip_drums": skip_drums},
+            lambda: load_notes_from_midi(
+                midi=load_midi(midi_path), skip_drums=skip_drums
+            ),
+        )
     elif not midi:
         midi = load_midi(midi_path)
 
@@ -123,7 +619,7 @@ def load_notes_from_midi(
 
 def load_multif0_from_midi(
     midi_path: Optional[Union[str, BinaryIO]] = None,
-    midi: Optional[pretty_midi.PrettyMIDI] = None,
+    midi: "Optional[pretty_midi.PrettyMIDI]" = None,
     skip_drums: bool = True,
     pitch_bend: bool = False,
 ) -> Optional[annotations.MultiF0Data]:
@@ -146,6 +642,16 @@ def load_multif0_from_midi(
 
     if not midi and not midi_path:
         raise ValueError("At least one of midi_path or midi must be provided")
+    elif not midi and isinstance(midi_path, str):
+        return _load_cached(
+            load_multif0_from_midi,
+            midi_path,
+            (),
+            {"skip_drums": skip_drums, "pitch_bend": pitch_bend},
+            lambda: load_multif0_from_midi(
+                midi=load_midi(midi_path), skip_drums=skip_drums, pitch_bend=pitch_bend
+            ),
+        )
     elif not midi:
         midi = load_midi(midi_path)
 
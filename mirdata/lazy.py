@@ -0,0 +1,92 @@
+"""Lazy imports of heavy dependencies
+
+Dataset modules only need libraries such as librosa, pretty_midi or pandas when
+audio or annotations are actually loaded. Importing them lazily keeps
+``mirdata.initialize`` and listing track ids fast.
+
+Example:
+    .. code-block:: python
+
+        from mirdata.lazy import lazy_import, open
+
+        librosa = lazy_import("librosa")  # librosa is imported on first use
+
+"""
+
+import importlib
+import logging
+import types
+
+from mirdata import archive
+
+
+class LazyModule(types.ModuleType):
+    """Placeholder for a module which is imported on first attribute access
+
+    Args:
+        name (str): the module's name, e.g. "pretty_midi"
+        extra (str or None): the mirdata extra which installs this module, for
+            optional dependencies
+
+    """
+
+    def __init__(self, name, extra=None):
+        super().__init__(name)
+        self._lazy_extra = extra
+
+    def _load(self):
+        try:
+            module = importlib.import_module(self.__name__)
+        except ImportError:
+            if self._lazy_extra is not None:
+                logging.error(
+                    "In order to use this loader you must have {} installed. ".format(
+                        self.__name__
+                    )
+                    + "Please reinstall mirdata using `pip install 'mirdata[{}]'`".format(
+                        self._lazy_extra
+                    )
+                )
+            raise
+        # later attribute lookups hit the module's namespace directly
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, attr):
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        return "<lazy module '{}'>".format(self.__name__)
+
+
+def lazy_import(name, extra=None):
+    """Import a module the first time one of its attributes is used
+
+    Args:
+        name (str): the module's name, e.g. "pretty_midi"
+        extra (str or None): the mirdata extra which installs this module, for
+            optional dependencies
+
+    Returns:
+        LazyModule: a placeholder which behaves like the module once used
+
+    """
+    return LazyModule(name, extra=extra)
+
+
+smart_open = lazy_import("smart_open")
+
+
+def open(*args, **kwargs):
+    """Open a local or remote file with smart_open, importing it on first use.
+    Paths inside a zip or tar archive are read from the archive, see
+    mirdata.archive.
+
+    Takes the same arguments as ``smart_open.open``.
+
+    """
+    if args and archive.is_archive_member(args[0]):
+        return archive.open_member(*args, **kwargs)
+    return smart_open.open(*args, **kwargs)
@@ -0,0 +1,103 @@
+"""Static registry of mirdata datasets
+
+The registry lists every dataset loader with its indexes (versions), default
+version and remotes, so that datasets and versions can be listed without
+importing any loader. It is stored in ``mirdata/datasets/registry.json``, which
+is generated with ``scripts/make_dataset_registry.py`` whenever a loader's
+``INDEXES`` or ``REMOTES`` change.
+
+"""
+
+import functools
+import importlib
+import json
+import os
+import pkgutil
+
+DATASETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "datasets")
+REGISTRY_PATH = os.path.join(DATASETS_DIR, "registry.json")
+
+
+def _index_info(index):
+    return {
+        "filename": index.filename,
+        "url": index.remote.url if index.remote else None,
+        "checksum": index.remote.checksum if index.remote else None,
+        "partial_download": index.partial_download,
+    }
+
+
+def _remote_info(remote):
+    return {
+        "filename": remote.filename,
+        "url": remote.url,
+        "checksum": remote.checksum,
+        "destination_dir": remote.destination_dir,
+        "unpack_directories": remote.unpack_directories,
+        "size": None,
+    }
+
+
+def dataset_module_names():
+    """Get the names of all dataset loader modules, by scanning mirdata.datasets
+
+    Returns:
+        list: list of dataset names as strings
+
+    """
+    return [d.name for d in pkgutil.iter_modules([DATASETS_DIR])]
+
+
+def build_registry():
+    """Build the registry by importing every dataset loader
+
+    Returns:
+        dict: registry entries keyed by dataset name
+
+    """
+    registry = {}
+    for name in sorted(dataset_module_names()):
+        module = importlib.import_module("mirdata.datasets.{}".format(name))
+        indexes = {
+            key: value if isinstance(value, str) else _index_info(value)
+            for key, value in module.INDEXES.items()
+        }
+        remotes = getattr(module, "REMOTES", None)
+        registry[name] = {
+            "default_version": module.INDEXES["default"],
+            "indexes": indexes,
+            "remotes": (
+                {k: _remote_info(v) for k, v in remotes.items()}
+                if remotes is not None
+                else None
+            ),
+        }
+    return registry
+
+
+def write_registry(registry, path=REGISTRY_PATH):
+    """Write the registry to a json file
+
+    Args:
+        registry (dict): registry, as returned by build_registry
+        path (str): path to write the registry to
+
+    """
+    with open(path, "w", encoding="utf-8") as fhandle:
+        json.dump(registry, fhandle, indent=2)
+        fhandle.write("\n")
+
+
+@functools.lru_cache(maxsize=None)
+def load_registry(path=REGISTRY_PATH):
+    """Load the registry from a json file
+
+    Args:
+        path (str): path to the registry
+
+    Returns:
+        dict: registry entries keyed by dataset name
+
+    """
+    with open(path, encoding="utf-8") as fhandle:
+        return json.load(fhandle)
@@ -0,0 +1,214 @@
+"""Persistent on-disk cache of resampled audio
+
+Some loaders resample their audio to a fixed sample rate on every load (e.g.
+``saraga_carnatic`` and the ``compmusic`` datasets to 44100 Hz, ``cante100``
+to 22050 Hz, ``baf`` to 8000 Hz mono), and resampling usually costs more than
+decoding. When the resample cache is enabled, the audio resampled by
+``io.load_audio`` is stored as a float32 ``.npy`` file, and later loads of the
+same file at the same sample rate read it back instead of decoding and
+resampling it again::
+
+    <cache_dir>/ab/ab0123...ef.npy
+
+Entries are keyed by the md5 checksum of the audio file, the target sample
+rate, whether the audio is mixed down to mono and the librosa version used to
+resample, so editing the file invalidates them. Entries are written atomically,
+so the cache can be shared by several processes.
+
+Only whole files loaded from a local path are cached: segments (``offset`` or
+``duration``) are resampled on every load, and files whose header gives the
+target sample rate are neither looked up nor stored.
+
+Example:
+    .. code-block:: python
+
+        from mirdata import resample_cache
+
+        resample_cache.enable("/data/mirdata_resample_cache")
+        track = mirdata.initialize("saraga_carnatic").track("109_Sri_Raghuvara")
+        track.audio  # decoded, resampled and stored in the cache
+        # in any later process, the resampled audio is read from the cache
+
+The cache can also be enabled with the ``MIRDATA_RESAMPLE_CACHE`` environment
+variable, e.g. for worker processes.
+
+"""
+
+import hashlib
+import importlib.metadata
+import logging
+import os
+import uuid
+
+import numpy as np
+
+from mirdata.validate import file_checksum
+
+CACHE_ENV_VAR = "MIRDATA_RESAMPLE_CACHE"
+
+
+class ResampleCache(object):
+    """A folder of resampled audio, keyed by file checksum and sample rate
+
+    Args:
+        root (str): path to the cache's folder
+
+    Attributes:
+        root (str): path to the cache's folder
+        hits (int): number of signals read from the cache
+        misses (int): number of signals looked up and not found in the cache
+
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, key):
+        """Get the path of a cache entry
+
+        Args:
+            key (str): the entry's key
+
+        Returns:
+            str: path to the entry's npy file
+
+        """
+        return os.path.join(self.root, key[:2], key + ".npy")
+
+    def key(self, file_path, sr, mono):
+        """Get the key of a resampled audio file
+
+        Args:
+            file_path (str): path to the audio file
+            sr (float): the target sample rate
+            mono (bool): if the audio is mixed down to mono
+
+        Returns:
+            str: the entry's key
+
+        """
+        key = hashlib.sha1()
+        for part in [
+            file_checksum(file_path),
+            repr(float(sr)),
+            repr(bool(mono)),
+            importlib.metadata.version("librosa"),
+        ]:
+            key.update(part.encode("utf-8"))
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def read(self, file_path, sr, mono):
+        """Read resampled audio from the cache
+
+        Args:
+            file_path (str): path to the audio file
+            sr (float): the target sample rate
+            mono (bool): if the audio is mixed down to mono
+
+        Returns:
+            np.ndarray or None: the float32 resampled audio, or None if it is
+            not in the cache
+
+        """
+        try:
+            entry_path = self.entry_path(self.key(file_path, sr, mono))
+        except OSError:
+            self.misses += 1
+            return None
+        if not os.path.exists(entry_path):
+            self.misses += 1
+            return None
+        try:
+            audio = np.load(entry_path, allow_pickle=False)
+        except (OSError, ValueError) as exc:
+            logging.warning(
+                "Ignoring unreadable resample cache entry {}: {}".format(
+                    entry_path, exc
+                )
+            )
+            self.misses += 1
+            return None
+        self.hits += 1
+        return audio
+
+    def write(self, file_path, sr, mono, audio):
+        """Store resampled audio in the cache
+
+        The file is written to a temporary path and then moved into place, so
+        concurrent readers never see a partial entry.
+
+        Args:
+            file_path (str): path to the audio file
+            sr (float): the target sample rate
+            mono (bool): if the audio is mixed down to mono
+            audio (np.ndarray): the float32 resampled audio
+
+        """
+        try:
+            entry_path = self.entry_path(self.key(file_path, sr, mono))
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            tmp_path = "{}.{}.tmp".format(entry_path, uuid.uuid4().hex)
+            try:
+                with open(tmp_path, "wb") as fhandle:
+                    np.save(fhandle, np.ascontiguousarray(audio, dtype=np.float32))
+                os.replace(tmp_path, entry_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError as exc:
+            logging.warning(
+                "Could not store audio in the resample cache: {}".format(exc)
+            )
+
+    def clear(self):
+        """Remove all entries from the cache"""
+        if not os.path.isdir(self.root):
+            return
+        for folder in os.listdir(self.root):
+            folder_path = os.path.join(self.root, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            for filename in os.listdir(folder_path):
+                if filename.endswith(".npy"):
+                    os.remove(os.path.join(folder_path, filename))
+
+
+_cache = None
+
+
+def enable(cache_dir):
+    """Enable the resample cache
+
+    Args:
+        cache_dir (str): path to the cache's folder
+
+    Returns:
+        ResampleCache: the enabled cache
+
+    """
+    global _cache
+    _cache = ResampleCache(cache_dir)
+    return _cache
+
+
+def disable():
+    """Disable the resample cache"""
+    global _cache
+    _cache = None
+
+
+def get_cache():
+    """Get the enabled resample cache
+
+    Returns:
+        ResampleCache or None: the cache, or None if it is disabled
+
+    """
+    return _cache
+
+
+if os.environ.get(CACHE_ENV_VAR):
+    enable(os.environ[CACHE_ENV_VAR])
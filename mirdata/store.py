@@ -0,0 +1,254 @@
+"""Content-addressed storage of dataset files
+
+Versions of a dataset (and copies of a dataset in several ``data_home``) share
+many identical files. A content store keeps each file once, named by its md5
+checksum, and links it into every ``data_home`` which needs it::
+
+    <root>/ab/ab0123...ef   # a file whose md5 checksum is ab0123...ef
+
+Files are only added to the store once their checksum has been verified, and
+the store records the size, mtime and inode of each blob at that time (in the
+same manifest format as ``Dataset.validate``). A file in ``data_home`` which is
+still a link to an unchanged blob is therefore known to be valid without being
+hashed again.
+
+Example:
+    .. code-block:: python
+
+        store = "/data/mirdata_store"
+        mini = mirdata.initialize("gtzan_genre", version="mini", data_home="/data/mini")
+        mini.download(store=store)
+        full = mirdata.initialize("gtzan_genre", data_home="/data/full")
+        full.download(store=store)  # files already in the store are linked
+        full.validate(store=store)  # and are not hashed again
+
+"""
+
+import logging
+import os
+import shutil
+
+from mirdata import validate
+
+LINK_MODES = ["hardlink", "symlink"]
+
+
+class ContentStore(object):
+    """A folder of files named by their md5 checksum
+
+    Args:
+        root (str): path to the store's folder
+        link (str): "hardlink" (default) or "symlink". Hard links are used
+            whenever possible, and fall back to symbolic links when the store
+            and data_home are on different filesystems.
+
+    Attributes:
+        root (str): path to the store's folder
+        link (str): how files are linked into data_home
+
+    """
+
+    def __init__(self, root, link="hardlink"):
+        if link not in LINK_MODES:
+            raise ValueError(
+                "link should be one of {}, got {}".format(LINK_MODES, link)
+            )
+        self.root = root
+        self.link = link
+        self._manifest = None
+
+    @property
+    def manifest(self):
+        """dict: the signature and checksum of each blob, see
+        validate.load_manifest"""
+        if self._manifest is None:
+            self._manifest = validate.load_manifest(self.root)
+        return self._manifest
+
+    def save(self):
+        """Save the store's manifest"""
+        if self._manifest is not None:
+            validate.save_manifest(self.root, self._manifest)
+
+    def _key(self, checksum):
+        return "{}/{}".format(checksum[:2], checksum)
+
+    def blob_path(self, checksum):
+        """Get the path of the blob with a given checksum
+
+        Args:
+            checksum (str): md5 checksum
+
+        Returns:
+            str: path to the blob, which may not exist
+
+        """
+        return os.path.join(self.root, checksum[:2], checksum)
+
+    def has(self, checksum):
+        """Check if the store has a valid blob with a given checksum. Blobs
+        which were modified since they were added are checked again, and
+        removed if their checksum does not match.
+
+        Args:
+            checksum (str): md5 checksum
+
+        Returns:
+            bool: True if the blob exists and is valid
+
+        """
+        key = self._key(checksum)
+        exists, valid = validate.validate_with_manifest(
+            self.blob_path(checksum), checksum, self.manifest, key
+        )
+        if exists and not valid:
+            logging.warning("Removing corrupted blob {}".format(key))
+            os.remove(self.blob_path(checksum))
+            self.manifest.pop(key, None)
+        return exists and valid
+
+    def is_linked(self, local_path, checksum):
+        """Check if a file is a link to an unchanged, verified blob
+
+        Args:
+            local_path (str): path to a file
+            checksum (str): the file's expected md5 checksum
+
+        Returns:
+            bool: True if local_path is known to have this checksum
+
+        """
+        entry = self.manifest.get(self._key(checksum))
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(local_path)
+        except OSError:
+            return False
+        return entry[:3] == [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+    def add(self, local_path, checksum):
+        """Add a file to the store, if its checksum is valid. The file is
+        replaced by a link to the blob, so it is not stored twice.
+
+        Args:
+            local_path (str): path to the file
+            checksum (str): the file's expected md5 checksum
+
+        Returns:
+            bool: True if the file was added (or already in the store)
+
+        """
+        if self.is_linked(local_path, checksum):
+            return True
+        if validate.md5(local_path) != checksum:
+            return False
+        if self.has(checksum):
+            self.link_to(checksum, local_path)
+            return True
+
+        blob_path = self.blob_path(checksum)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        try:
+            if self.link == "hardlink":
+                os.link(local_path, blob_path)
+            else:
+                os.replace(local_path, blob_path)
+                self.link_to(checksum, local_path)
+        except OSError:
+            # e.g. another filesystem: keep a copy, and link data_home to it
+            shutil.copy2(local_path, blob_path + ".tmp")
+            os.replace(blob_path + ".tmp", blob_path)
+            self.link_to(checksum, local_path)
+        stat = os.stat(blob_path)
+        self.manifest[self._key(checksum)] = [
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ino,
+            checksum,
+        ]
+        return True
+
+    def link_to(self, checksum, local_path):
+        """Replace local_path by a link to a blob
+
+        Args:
+            checksum (str): the blob's md5 checksum
+            local_path (str): path of the link to create
+
+        """
+        blob_path = self.blob_path(checksum)
+        os.makedirs(os.path.dirname(os.path.abspath(local_path)), exist_ok=True)
+        tmp_path = local_path + ".mirdata_link"
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        if self.link == "hardlink":
+            try:
+                os.link(blob_path, tmp_path)
+            except OSError:
+                os.symlink(os.path.abspath(blob_path), tmp_path)
+        else:
+            os.symlink(os.path.abspath(blob_path), tmp_path)
+        os.replace(tmp_path, local_path)
+
+    def link_files(self, files, data_home):
+        """Link the files of a dataset which are in the store into data_home
+
+        Args:
+            files (dict): {path relative to data_home: md5 checksum}, see
+                download_utils.index_files
+            data_home (str): path where the dataset lives
+
+        Returns:
+            dict: the files which are not in the store
+
+        """
+        missing = {}
+        for path, checksum in files.items():
+            local_path = os.path.join(data_home, path)
+            if self.is_linked(local_path, checksum):
+                continue
+            if self.has(checksum):
+                self.link_to(checksum, local_path)
+            else:
+                missing[path] = checksum
+        self.save()
+        return missing
+
+    def add_files(self, files, data_home):
+        """Add the (valid) files of a dataset to the store
+
+        Args:
+            files (dict): {path relative to data_home: md5 checksum}
+            data_home (str): path where the dataset lives
+
+        Returns:
+            list: paths of the files which were not added, because they are
+            missing or have an invalid checksum
+
+        """
+        not_added = []
+        for path, checksum in files.items():
+            local_path = os.path.join(data_home, path)
+            if not os.path.exists(local_path) or not self.add(local_path, checksum):
+                not_added.append(path)
+        self.save()
+        return not_added
+
+    def trusted_manifest(self, files, data_home):
+        """Build validate manifest entries for the files which are links to
+        verified blobs, so Dataset.validate does not hash them again
+
+        Args:
+            files (dict): {path relative to data_home: md5 checksum}
+            data_home (str): path where the dataset lives
+
+        Returns:
+            dict: manifest entries, see validate.load_manifest
+
+        """
+        manifest = {}
+        for path, checksum in files.items():
+            if self.is_linked(os.path.join(data_home, path), checksum):
+                manifest[path] = self.manifest[self._key(checksum)]
+        return manifest
@@ -1,18 +1,37 @@
 """Utility functions for mirdata"""
 
+import concurrent.futures
 import hashlib
+import json
 import logging
+import math
 import os
+import random
+import threading
+from typing import Dict, Tuple
+
 import tqdm
 
-from smart_open import open
+from mirdata import archive
+from mirdata.lazy import open, smart_open
+
+# hashlib releases the GIL while hashing large chunks, so threads hash in parallel
+CHUNK_SIZE = 1024 * 1024
+
+# checksums of the files in data_home, reused while their stat signature is unchanged
+MANIFEST_FILENAME = ".mirdata_manifest.json"
+
+# full: hash every file. quick: only check existence and size. sample: hash a
+# random fraction of the files, and check the size of the others
+VALIDATION_MODES = ["full", "quick", "sample"]
 
 
-def md5(file_path):
+def md5(file_path, chunk_size=CHUNK_SIZE):
     """Get md5 hash of a file.
 
     Args:
         file_path (str): File path
+        chunk_size (int): number of bytes read at a time
 
     Returns:
         str: md5 hash of data in file_path
@@ -20,11 +39,39 @@ def md5(file_path):
     """
     hash_md5 = hashlib.md5()
     with open(file_path, "rb", compression="disable") as fhandle:
-        for chunk in iter(lambda: fhandle.read(4096), b""):
+        for chunk in iter(lambda: fhandle.read(chunk_size), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
 
+# md5 checksums of local files by path, with the stat signature they were computed for
+_checksums: Dict[str, Tuple[tuple, str]] = {}
+_checksums_lock = threading.Lock()
+
+
+def file_checksum(file_path):
+    """Get the md5 checksum of a file, which is only computed again when
+    the file's size, mtime or inode change
+
+    Args:
+        file_path (str): path to a local file
+
+    Returns:
+        str: md5 checksum of the file
+
+    """
+    stat = os.stat(file_path)
+    signature = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    with _checksums_lock:
+        cached = _checksums.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    checksum = md5(file_path)
+    with _checksums_lock:
+        _checksums[file_path] = (signature, checksum)
+    return checksum
+
+
 def log_message(message, verbose=True):
     """Helper function to log message
 
@@ -37,6 +84,167 @@ def log_message(message, verbose=True):
         logging.warning(message)
 
 
+def is_local(data_home):
+    """Check if data_home is a local folder (as opposed to e.g. an s3 bucket)
+
+    Args:
+        data_home (str): path where the data lives
+
+    Returns:
+        bool: True if data_home is on the local filesystem
+
+    """
+    return smart_open.parse_uri(data_home).scheme == "file"
+
+
+def load_manifest(data_home):
+    """Load the checksum manifest stored in data_home
+
+    Args:
+        data_home (str): path where the data lives
+
+    Returns:
+        dict: {file path relative to data_home: [size, mtime_ns, inode, md5]},
+        empty if there is no (readable) manifest
+
+    """
+    manifest_path = os.path.join(data_home, MANIFEST_FILENAME)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as fhandle:
+            return json.load(fhandle)["files"]
+    except (IOError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def save_manifest(data_home, manifest):
+    """Save the checksum manifest in data_home
+
+    Args:
+        data_home (str): path where the data lives
+        manifest (dict): manifest, as returned by load_manifest
+
+    """
+    manifest_path = os.path.join(data_home, MANIFEST_FILENAME)
+    tmp_path = manifest_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as fhandle:
+            json.dump({"files": manifest}, fhandle)
+        os.replace(tmp_path, manifest_path)
+    except OSError as exc:
+        logging.warning("Could not save the checksum manifest: {}".format(exc))
+
+
+def validate_with_manifest(local_path, checksum, manifest, key):
+    """Validate a file, reusing its md5 from the manifest if its size, mtime
+    and inode are unchanged. The manifest entry is updated in place.
+
+    Args:
+        local_path (str): file path
+        checksum (str): md5 checksum
+        manifest (dict): manifest, as returned by load_manifest
+        key (str): the file's path relative to data_home
+
+    Returns:
+        * bool - True if file exists
+        * bool - True if checksum matches
+
+    """
+    try:
+        stat = os.stat(local_path)
+    except OSError:
+        manifest.pop(key, None)
+        return False, False
+
+    signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+    entry = manifest.get(key)
+    if entry is not None and entry[:3] == signature:
+        file_md5 = entry[3]
+    else:
+        file_md5 = md5(local_path)
+        manifest[key] = signature + [file_md5]
+
+    return True, file_md5 == checksum
+
+
+def validate_size(local_path, size):
+    """Validate that a file exists and has the expected size, without reading it
+
+    Args:
+        local_path (str): file path
+        size (int or None): size in bytes. If None, only existence is checked
+
+    Returns:
+        * bool - True if file exists
+        * bool - True if size matches
+
+    """
+    try:
+        actual_size = os.stat(local_path).st_size
+    except OSError:
+        if not archive.is_archive_member(local_path):
+            return False, False
+        try:
+            actual_size = archive.member_size(local_path)
+        except FileNotFoundError:
+            return False, False
+    return True, size is None or actual_size == size
+
+
+def file_size(entry):
+    """Get the size stored in an index entry
+
+    Args:
+        entry (list): index entry, [path, checksum] or [path, checksum, size]
+
+    Returns:
+        int or None: the size in bytes, or None if the index has no size
+
+    """
+    return entry[2] if len(entry) > 2 else None
+
+
+def add_file_sizes(index, data_path):
+    """Add the size of each file to an index's entries, for index generators.
+    Entries whose file does not exist in data_path are left unchanged, and
+    logged in a warning.
+
+    Args:
+        index (dict): index with [path, checksum] entries
+        data_path (str): path where the dataset's files live
+
+    Returns:
+        dict: the index, with [path, checksum, size] entries
+
+    """
+    missing = []
+
+    def _add_size(entry):
+        if entry[0] is None:
+            return entry
+        path = os.path.join(data_path, entry[0])
+        if not os.path.exists(path):
+            missing.append(entry[0])
+            return entry
+        return [entry[0], entry[1], os.path.getsize(path)]
+
+    if index.get("metadata") is not None:
+        for key, entry in index["metadata"].items():
+            index["metadata"][key] = _add_size(entry)
+
+    for group in ["tracks", "multitracks"]:
+        for files in (index.get(group) or {}).values():
+            for key, entry in files.items():
+                if key != "tracks" or group != "multitracks":
+                    files[key] = _add_size(entry)
+
+    if missing:
+        logging.warning(
+            "{} indexed files are missing from {}, and have no size in the "
+            "index:\n{}".format(len(missing), data_path, "\n".join(missing))
+        )
+    return index
+
+
 def validate(local_path, checksum):
     """Validate that a file exists and has the correct checksum
 
@@ -65,22 +273,103 @@ def validate(local_path, checksum):
     return True, valid
 
 
-def validate_files(file_dict, data_home, verbose):
+def _validate_paths(paths, verbose, workers, manifest, mode, sample_fraction):
+    """Validate a list of (file_id, filepath, local_path, checksum, size), in order
+
+    Args:
+        paths (list): list of (file_id, filepath, local_path, checksum, size) tuples
+        verbose (bool): if True, show progress
+        workers (int): number of files validated concurrently
+        manifest (dict or None): checksum manifest, see load_manifest
+        mode (str): one of VALIDATION_MODES
+        sample_fraction (float): fraction of the files hashed in "sample" mode
+
+    Returns:
+        * dict - missing files
+        * dict - files with invalid checksums
+
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError(
+            "mode should be one of {}, got {}".format(VALIDATION_MODES, mode)
+        )
+    if mode == "full":
+        hashed = set(range(len(paths)))
+    elif mode == "quick":
+        hashed = set()
+    else:
+        n_hashed = math.ceil(sample_fraction * len(paths))
+        hashed = set(random.sample(range(len(paths)), n_hashed))
+
+    def _validate(i, path):
+        _, filepath, local_path, checksum, size = path
+        if i not in hashed:
+            return validate_size(local_path, size)
+        if manifest is None:
+            return validate(local_path, checksum)
+        return validate_with_manifest(local_path, checksum, manifest, filepath)
+
+    if workers > 1 and len(paths) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                tqdm.tqdm(
+                    executor.map(_validate, range(len(paths)), paths),
+                    total=len(paths),
+                    disable=not verbose,
+                )
+            )
+    else:
+        results = [
+            _validate(i, path)
+            for i, path in enumerate(tqdm.tqdm(paths, disable=not verbose))
+        ]
+
+    missing = {}
+    invalid = {}
+    for (file_id, _, local_path, _, _), (exists, valid) in zip(paths, results):
+        if not exists:
+            if file_id not in missing.keys():
+                missing[file_id] = []
+            missing[file_id].append(local_path)
+        elif not valid:
+            if file_id not in invalid.keys():
+                invalid[file_id] = []
+            invalid[file_id].append(local_path)
+
+    return missing, invalid
+
+
+def validate_files(
+    file_dict,
+    data_home,
+    verbose,
+    workers=1,
+    manifest=None,
+    mode="full",
+    sample_fraction=0.1,
+):
     """Validate files
 
     Args:
         file_dict (dict): dictionary of file information
         data_home (str): path where the data lives
         verbose (bool): if True, show progress
+        workers (int): number of files validated concurrently
+        manifest (dict or None): checksum manifest, see load_manifest. If
+            given, files with an unchanged stat signature are not hashed, and
+            the manifest is updated in place.
+        mode (str): "full" hashes every file, "quick" only checks that files
+            exist and have the size stored in the index, and "sample" hashes a
+            random fraction of the files and checks the size of the others
+        sample_fraction (float): fraction of the files hashed in "sample" mode
 
     Returns:
         * dict - missing files
         * dict - files with invalid checksums
 
     """
-    missing = {}
-    invalid = {}
-    for file_id, file in tqdm.tqdm(file_dict.items(), disable=not verbose):
+    paths = []
+    for file_id, file in file_dict.items():
         for tracks in file.keys():
             # multitrack case
             if tracks == "tracks":
@@ -90,87 +379,142 @@ def validate_files(file_dict, data_home, verbose):
                 filepath = file[tracks][0]
                 checksum = file[tracks][1]
                 if filepath is not None:
-                    local_path = os.path.join(data_home, filepath)
-                    exists, valid = validate(local_path, checksum)
-                    if not exists:
-                        if file_id not in missing.keys():
-                            missing[file_id] = []
-                        missing[file_id].append(local_path)
-                    elif not valid:
-                        if file_id not in invalid.keys():
-                            invalid[file_id] = []
-                        invalid[file_id].append(local_path)
-
-    return missing, invalid
-
-
-def validate_metadata(file_dict, data_home, verbose):
+                    paths.append(
+                        (
+                            file_id,
+                            filepath,
+                            os.path.join(data_home, filepath),
+                            checksum,
+                            file_size(file[tracks]),
+                        )
+                    )
+
+    return _validate_paths(paths, verbose, workers, manifest, mode, sample_fraction)
+
+
+def validate_metadata(
+    file_dict,
+    data_home,
+    verbose,
+    workers=1,
+    manifest=None,
+    mode="full",
+    sample_fraction=0.1,
+):
     """Validate files
 
     Args:
         file_dict (dict): dictionary of file information
         data_home (str): path where the data lives
         verbose (bool): if True, show progress
+        workers (int): number of files validated concurrently
+        manifest (dict or None): checksum manifest, see load_manifest. If
+            given, files with an unchanged stat signature are not hashed, and
+            the manifest is updated in place.
+        mode (str): "full" hashes every file, "quick" only checks that files
+            exist and have the size stored in the index, and "sample" hashes a
+            random fraction of the files and checks the size of the others
+        sample_fraction (float): fraction of the files hashed in "sample" mode
 
     Returns:
         * dict - missing files
         * dict - files with invalid checksums
 
     """
-    missing = {}
-    invalid = {}
-    for file_id, file in tqdm.tqdm(file_dict.items(), disable=not verbose):
+    paths = []
+    for file_id, file in file_dict.items():
         filepath = file[0]
         checksum = file[1]
         if filepath is not None:
-            local_path = os.path.join(data_home, filepath)
-            exists, valid = validate(local_path, checksum)
-            if not exists:
-                if file_id not in missing.keys():
-                    missing[file_id] = []
-                missing[file_id].append(local_path)
-            elif not valid:
-                if file_id not in invalid.keys():
-                    invalid[file_id] = []
-                invalid[file_id].append(local_path)
-
-    return missing, invalid
-
-
-def validate_index(dataset_index, data_home, verbose=True):
+            paths.append(
+                (
+                    file_id,
+                    filepath,
+                    os.path.join(data_home, filepath),
+                    checksum,
+                    file_size(file),
+                )
+            )
+
+    return _validate_paths(paths, verbose, workers, manifest, mode, sample_fraction)
+
+
+def validate_index(
+    dataset_index,
+    data_home,
+    verbose=True,
+    workers=1,
+    manifest=None,
+    mode="full",
+    sample_fraction=0.1,
+):
     """Validate files in a dataset's index
 
     Args:
         dataset_index (list): dataset indices
         data_home (str): Local home path that the dataset is being stored
         verbose (bool): if true, prints validation status while running
+        workers (int): number of files validated concurrently
+        manifest (dict or None): checksum manifest, see load_manifest
+        mode (str): "full" hashes every file, "quick" only checks that files
+            exist and have the size stored in the index, and "sample" hashes a
+            random fraction of the files and checks the size of the others
+        sample_fraction (float): fraction of the files hashed in "sample" mode
+
+    Raises:
+        ValueError: If mode is "quick" or "sample" and data_home is not local
 
     Returns:
         * dict - file paths that are in the index but missing locally
         * dict - file paths with differing checksums
 
     """
+    # file sizes are read with os.stat, which only works for local files
+    if mode != "full" and not is_local(data_home):
+        raise ValueError(
+            "{} validation needs a local data_home, got {}. Use mode='full' "
+            "for remote data.".format(mode, data_home)
+        )
+
     missing_files = {}
     invalid_checksums = {}
 
     # check index
     if "metadata" in dataset_index and dataset_index["metadata"] is not None:
         missing_metadata, invalid_metadata = validate_metadata(
-            dataset_index["metadata"], data_home, verbose
+            dataset_index["metadata"],
+            data_home,
+            verbose,
+            workers=workers,
+            manifest=manifest,
+            mode=mode,
+            sample_fraction=sample_fraction,
         )
         missing_files["metadata"] = missing_metadata
         invalid_checksums["metadata"] = invalid_metadata
 
     if "tracks" in dataset_index and dataset_index["tracks"] is not None:
         missing_tracks, invalid_tracks = validate_files(
-            dataset_index["tracks"], data_home, verbose
+            dataset_index["tracks"],
+            data_home,
+            verbose,
+            workers=workers,
+            manifest=manifest,
+            mode=mode,
+            sample_fraction=sample_fraction,
         )
         missing_files["tracks"] = missing_tracks
         invalid_checksums["tracks"] = invalid_tracks
 
     if "multitracks" in dataset_index and dataset_index["multitracks"] is not None:
         missing_multitracks, invalid_multitracks = validate_files(
-            dataset_index["multitracks"], data_home, verbose
+            dataset_index["multitracks"],
+            data_home,
+            verbose,
+            workers=workers,
+            manifest=manifest,
+            mode=mode,
+            sample_fraction=sample_fraction,
         )
         missing_files["multitracks"] = missing_multitracks
         invalid_checksums["multitracks"] = invalid_multitracks
@@ -178,7 +522,15 @@ def validate_index(dataset_index, data_home, verbose=True):
     return missing_files, invalid_checksums
 
 
-def validator(dataset_index, data_home, verbose=True):
+def validator(
+    dataset_index,
+    data_home,
+    verbose=True,
+    workers=1,
+    manifest=None,
+    mode="full",
+    sample_fraction=0.1,
+):
     """Checks the existence and validity of files stored locally with
     respect to the paths and file checksums stored in the reference index.
     Logs invalid checksums and missing files.
@@ -188,6 +540,12 @@ def validator(dataset_index, data_home, verbose=True):
         data_home (str): Local home path that the dataset is being stored
         verbose (bool): if True (default), prints missing and invalid files
             to stdout. Otherwise, this function is equivalent to validate_index.
+        workers (int): number of files validated concurrently
+        manifest (dict or None): checksum manifest, see load_manifest
+        mode (str): "full" hashes every file, "quick" only checks that files
+            exist and have the size stored in the index, and "sample" hashes a
+            random fraction of the files and checks the size of the others
+        sample_fraction (float): fraction of the files hashed in "sample" mode
 
     Returns:
         missing_files (list): List of file paths that are in the dataset index
@@ -197,7 +555,15 @@ def validator(dataset_index, data_home, verbose=True):
             checksum.
 
     """
-    missing_files, invalid_checksums = validate_index(dataset_index, data_home, verbose)
+    missing_files, invalid_checksums = validate_index(
+        dataset_index,
+        data_home,
+        verbose,
+        workers=workers,
+        manifest=manifest,
+        mode=mode,
+        sample_fraction=sample_fraction,
+    )
 
     # print path of any missing files
     has_any_missing_file = False
@@ -0,0 +1,84 @@
+"""Compare decoding audio with librosa.load and with io.load_audio.
+
+Writes a synthetic stereo recording in each format, then times (best of
+--repeat) decoding it with ``librosa.load(mono=False, sr=None)`` and with
+``io.load_audio`` into float32 and int16 buffers, and reports the size of the
+decoded signal.
+
+Usage:
+    python scripts/benchmarks/benchmark_audio_decode.py --minutes 5 \
+        --formats wav flac ogg mp3
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import librosa
+import numpy as np
+import soundfile as sf
+
+from mirdata import io
+
+SAMPLE_RATE = 44100
+
+
+def make_recording(path, minutes):
+    n_samples = int(minutes * 60 * SAMPLE_RATE)
+    with sf.SoundFile(path, "w", samplerate=SAMPLE_RATE, channels=2) as fhandle:
+        # write in one-second blocks: large blocks crash some libsndfile
+        # versions when encoding ogg
+        for start in range(0, n_samples, SAMPLE_RATE):
+            block = min(SAMPLE_RATE, n_samples - start)
+            fhandle.write(np.random.uniform(-0.5, 0.5, size=(block, 2)))
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=5)
+    parser.add_argument("--formats", nargs="+", default=["wav", "flac", "ogg", "mp3"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        for audio_format in args.formats:
+            path = os.path.join(tmp_dir, "recording." + audio_format)
+            make_recording(path, args.minutes)
+            print(
+                "{}: {} minutes, {:.0f} MB".format(
+                    audio_format, args.minutes, os.path.getsize(path) / 1e6
+                )
+            )
+            runs = [
+                (
+                    "librosa.load",
+                    lambda: librosa.load(path, sr=None, mono=False),
+                ),
+                ("io float32", lambda: io.load_audio(path, dtype="float32")),
+                ("io int16", lambda: io.load_audio(path, dtype="int16")),
+            ]
+            for name, function in runs:
+                seconds, (audio, _) = best_time(function, args.repeat)
+                print(
+                    "  {:>14}: {:.4f} s, {:.0f} MB".format(
+                        name, seconds, audio.nbytes / 1e6
+                    )
+                )
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare decoding a whole long recording with decoding a short segment of it.
+
+Writes a synthetic stereo recording in each format, then times (best of
+--repeat) loading it fully and loading a --segment-seconds crop from its
+middle, with ``io.load_audio_segment`` and with a dataset loader's
+``load_audio(offset=, duration=)``.
+
+Usage:
+    python scripts/benchmarks/benchmark_audio_segment.py --minutes 20 \
+        --segment-seconds 5 --formats wav flac
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import soundfile as sf
+
+from mirdata import io
+from mirdata.datasets import maestro
+
+SAMPLE_RATE = 44100
+
+
+def make_recording(path, minutes):
+    n_samples = int(minutes * 60 * SAMPLE_RATE)
+    with sf.SoundFile(path, "w", samplerate=SAMPLE_RATE, channels=2) as fhandle:
+        # write in one-minute blocks to keep memory low
+        for start in range(0, n_samples, 60 * SAMPLE_RATE):
+            block = min(60 * SAMPLE_RATE, n_samples - start)
+            fhandle.write(np.random.uniform(-0.5, 0.5, size=(block, 2)))
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=20)
+    parser.add_argument("--segment-seconds", type=float, default=5)
+    parser.add_argument("--formats", nargs="+", default=["wav", "flac"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    offset = args.minutes * 30
+    duration = args.segment_seconds
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        for audio_format in args.formats:
+            path = os.path.join(tmp_dir, "recording." + audio_format)
+            make_recording(path, args.minutes)
+            print(
+                "{}: {} minutes, {:.0f} MB".format(
+                    audio_format, args.minutes, os.path.getsize(path) / 1e6
+                )
+            )
+            runs = [
+                ("io full", lambda: io.load_audio_segment(path)),
+                (
+                    "io segment",
+                    lambda: io.load_audio_segment(
+                        path, offset=offset, duration=duration
+                    ),
+                ),
+                ("maestro full", lambda: maestro.load_audio(path)),
+                (
+                    "maestro segment",
+                    lambda: maestro.load_audio(path, offset=offset, duration=duration),
+                ),
+            ]
+            for name, function in runs:
+                print(
+                    "  {:>16}: {:.4f} s".format(name, best_time(function, args.repeat))
+                )
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Compare cold-start time and memory of JSON and compact indexes.
+
+Each measurement runs in a fresh interpreter, which loads the index, lists the
+track ids and looks up a single track, like a worker process calling
+``mirdata.initialize`` would.
+
+Usage:
+    python scripts/benchmarks/benchmark_compact_index.py --n-tracks 400000
+    python scripts/benchmarks/benchmark_compact_index.py --index path/to/index.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from mirdata import compact_index
+
+WORKER = """
+import json, sys, time
+from mirdata import compact_index
+
+
+def rss_mb():
+    with open("/proc/self/status") as fhandle:
+        for line in fhandle:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024.0
+    return float("nan")
+
+
+path, fmt = sys.argv[1], sys.argv[2]
+rss_before = rss_mb()
+start = time.perf_counter()
+if fmt == "json":
+    with open(path, encoding="utf-8") as fhandle:
+        index = json.load(fhandle)
+else:
+    index = compact_index.CompactIndex(path)
+loaded = time.perf_counter()
+track_ids = list(index["tracks"].keys())
+listed = time.perf_counter()
+index["tracks"][track_ids[len(track_ids) // 2]]
+end = time.perf_counter()
+rss_after = rss_mb()
+print(json.dumps({
+    "load": loaded - start,
+    "track_ids": listed - loaded,
+    "lookup": end - listed,
+    "rss_mb": rss_after - rss_before,
+}))
+"""
+
+
+def make_synthetic_index(path, n_tracks):
+    """Write an acousticbrainz_genre-like index with n_tracks tracks"""
+    tracks = {}
+    for i in range(n_tracks):
+        mbid = hashlib.md5(str(i).encode()).hexdigest()
+        track_id = "tagtraum#train#{}#{}#rock#pop".format(mbid, i)
+        tracks[track_id] = {
+            "data": [
+                "acousticbrainz-mediaeval-train/{}/{}.json".format(mbid[:2], mbid),
+                hashlib.md5(mbid.encode()).hexdigest(),
+            ]
+        }
+    with open(path, "w") as fhandle:
+        json.dump({"version": "synthetic", "tracks": tracks}, fhandle)
+
+
+def measure(path, fmt, repeats):
+    results = []
+    for _ in range(repeats):
+        output = subprocess.check_output([sys.executable, "-c", WORKER, path, fmt])
+        results.append(json.loads(output))
+    return {k: min(r[k] for r in results) for k in results[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--index", type=str, default=None, help="JSON index to use")
+    parser.add_argument("--n-tracks", type=int, default=200000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if args.index is None:
+            json_path = os.path.join(tmpdir, "synthetic_index.json")
+            make_synthetic_index(json_path, args.n_tracks)
+        else:
+            json_path = args.index
+        compact = compact_index.convert(
+            json_path, os.path.join(tmpdir, "index" + compact_index.COMPACT_INDEX_EXTENSION)
+        )
+
+        print(
+            "json: {:.1f} MB, compact: {:.1f} MB".format(
+                os.path.getsize(json_path) / 1e6, os.path.getsize(compact) / 1e6
+            )
+        )
+        print(
+            "{:>8} {:>10} {:>12} {:>10} {:>10}".format(
+                "format", "load (s)", "track_ids (s)", "lookup (s)", "RSS (MB)"
+            )
+        )
+        for fmt, path in [("json", json_path), ("compact", compact)]:
+            r = measure(path, fmt, args.repeats)
+            print(
+                "{:>8} {:>10.4f} {:>12.4f} {:>10.6f} {:>10.1f}".format(
+                    fmt, r["load"], r["track_ids"], r["lookup"], r["rss_mb"]
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
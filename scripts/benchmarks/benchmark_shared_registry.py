@@ -0,0 +1,51 @@
+"""Time initializing the same dataset N times with and without the shared registry.
+
+Each initialization lists the track ids and loads the metadata of one track, as
+a request handler in a multi-tenant service would.
+
+Usage:
+    python scripts/benchmarks/benchmark_shared_registry.py --dataset ikala \
+        --data-home tests/resources/mir_datasets/ikala --version test -n 100
+"""
+
+import argparse
+import time
+
+import mirdata
+from mirdata import core
+
+
+def initialize_n_times(dataset_name, data_home, version, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        dataset = mirdata.initialize(dataset_name, data_home=data_home, version=version)
+        track = dataset.track(dataset.track_ids[0])
+        try:
+            track._metadata()
+        except (AttributeError, FileNotFoundError):
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", type=str, default="ikala")
+    parser.add_argument("--data-home", type=str, default=None)
+    parser.add_argument("--version", type=str, default="default")
+    parser.add_argument("-n", type=int, default=100)
+    args = parser.parse_args()
+
+    maxsize = core.shared_registry.maxsize
+    for label, size in [("without registry", 0), ("with registry", maxsize)]:
+        core.shared_registry.clear()
+        core.shared_registry.maxsize = size
+        elapsed = initialize_n_times(args.dataset, args.data_home, args.version, args.n)
+        print(
+            "{:>17}: {:.3f} s total, {:.2f} ms per initialize".format(
+                label, elapsed, 1000 * elapsed / args.n
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare peak memory of zip extraction: in-memory reads vs streamed members.
+
+Builds a synthetic archive with a few large members, then extracts it in a
+fresh subprocess per method and reports wall time and peak RSS (VmHWM).
+
+Usage:
+    python scripts/benchmarks/benchmark_unzip.py --member-mb 512 --members 2 \
+        --workers 1 4
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+
+EXTRACT = """
+import os, sys, time, zipfile
+from mirdata import download_utils
+
+method, zip_path, out_dir, workers = sys.argv[1:5]
+start = time.perf_counter()
+with zipfile.ZipFile(zip_path) as zfile:
+    if method == "read":
+        # the previous implementation: each member is read fully into memory
+        for m in zfile.infolist():
+            data = zfile.read(m)
+            path = os.path.join(out_dir, m.filename)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as fhandle:
+                fhandle.write(data)
+    else:
+        download_utils.extractall_unicode(zfile, out_dir, workers=int(workers))
+elapsed = time.perf_counter() - start
+with open("/proc/self/status") as fhandle:
+    peak = [l for l in fhandle if l.startswith("VmHWM")][0].split()[1]
+print(elapsed, int(peak) / 1024)
+"""
+
+
+def make_archive(path, n_members, member_mb):
+    chunk = os.urandom(1024 * 1024)
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zfile:
+        for i in range(n_members):
+            with zfile.open("data/member_{}.bin".format(i), "w") as fhandle:
+                for _ in range(member_mb):
+                    fhandle.write(chunk)
+
+
+def run(method, zip_path, workers):
+    out_dir = tempfile.mkdtemp()
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", EXTRACT, method, zip_path, out_dir, str(workers)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    finally:
+        shutil.rmtree(out_dir)
+    elapsed, peak_mb = result.stdout.split()
+    return float(elapsed), float(peak_mb)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=2)
+    parser.add_argument("--member-mb", type=int, default=256)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        zip_path = os.path.join(tmp_dir, "synthetic.zip")
+        make_archive(zip_path, args.members, args.member_mb)
+        print(
+            "{} members of {} MB ({:.0f} MB archive)".format(
+                args.members, args.member_mb, os.path.getsize(zip_path) / 1e6
+            )
+        )
+        runs = [("read", 1)] + [("stream", w) for w in args.workers]
+        for method, workers in runs:
+            elapsed, peak_mb = run(method, zip_path, workers)
+            print(
+                "{:>6} (workers={}): {:.2f} s, peak RSS {:.0f} MB".format(
+                    method, workers, elapsed, peak_mb
+                )
+            )
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
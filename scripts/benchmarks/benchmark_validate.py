@@ -0,0 +1,60 @@
+"""Measure checksum validation throughput (MB/s) against the number of workers.
+
+Validates a downloaded dataset once per worker count. The first pass warms the
+page cache, so run it on the target filesystem with a dataset larger than RAM
+(or drop caches between runs) to measure cold reads.
+
+Usage:
+    python scripts/benchmarks/benchmark_validate.py --dataset maestro \
+        --data-home /data/maestro --workers 1 2 4 8 16
+"""
+
+import argparse
+import os
+import time
+
+import mirdata
+
+
+def index_size(dataset):
+    total = 0
+    for group in ["tracks", "multitracks"]:
+        for files in (dataset._index.get(group) or {}).values():
+            for key, value in files.items():
+                if key != "tracks" and value[0] is not None:
+                    path = os.path.join(dataset.data_home, value[0])
+                    if os.path.exists(path):
+                        total += os.path.getsize(path)
+    for value in (dataset._index.get("metadata") or {}).values():
+        path = os.path.join(dataset.data_home, value[0])
+        if value[0] is not None and os.path.exists(path):
+            total += os.path.getsize(path)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", type=str, required=True)
+    parser.add_argument("--data-home", type=str, default=None)
+    parser.add_argument("--version", type=str, default="default")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    dataset = mirdata.initialize(
+        args.dataset, data_home=args.data_home, version=args.version
+    )
+    size_mb = index_size(dataset) / 1e6
+    print("{}: {:.1f} MB".format(args.dataset, size_mb))
+    for workers in args.workers:
+        start = time.perf_counter()
+        dataset.validate(verbose=False, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(
+            "{:>3} workers: {:.2f} s, {:.1f} MB/s".format(
+                workers, elapsed, size_mb / elapsed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
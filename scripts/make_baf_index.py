@@ -4,6 +4,7 @@ import glob
 import json
 import os
 from pathlib import Path
+from mirdata.validate import add_file_sizes
 
 
 BAF_INDEX_PATH = "../mirdata/datasets/indexes/baf_index_1.0.json"
@@ -56,7 +57,7 @@ def make_baf_index(data_path: str) -> None:
     }
     baf_index = {"version": "1.0", "tracks": tracks, "metadata": metadata}
     with open(BAF_INDEX_PATH, "w") as fhandle:
-        json.dump(baf_index, fhandle, indent=2)
+        json.dump(add_file_sizes(baf_index, data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -2,7 +2,7 @@ import argparse
 import hashlib
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 beatport_key_INDEX_PATH = '../mirdata/datasets/indexes/beatport_key_index.json'
@@ -34,7 +34,7 @@ def make_beatport_key_index(data_path):
                 'key': (chord_path.replace(data_path + '/', ''), md5(chord_path)),
             }
     with open(beatport_key_INDEX_PATH, 'w') as fhandle:
-        json.dump(beatport_key_index, fhandle, indent=2)
+        json.dump(add_file_sizes(beatport_key_index, data_path), fhandle, indent=2)
 
 
 def main(args):
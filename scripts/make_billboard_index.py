@@ -3,7 +3,7 @@ import hashlib
 import json
 import os
 import csv
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 INDEX_PATH = "../mirdata/datasets/indexes/billboard_index.json"
@@ -105,7 +105,7 @@ def make_index(data_path):
                     }
 
     with open(INDEX_PATH, "w") as fhandle:
-        json.dump(index, fhandle, indent=2)
+        json.dump(add_file_sizes(index, data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -2,7 +2,7 @@ import argparse
 import hashlib
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 BRID_RHYTHM_INDEX_PATH = "../mirdata/datasets/indexes/brid_full_index_1.0.json"
 
@@ -56,7 +56,7 @@ def make_brid_rhythm_index(dataset_data_path):
 
     # Write to index file
     with open(BRID_RHYTHM_INDEX_PATH, "w") as fhandle:
-        json.dump(cmr_index, fhandle, indent=2)
+        json.dump(add_file_sizes(cmr_index, dataset_data_path), fhandle, indent=2)
 
 def main(args):
     print("Creating index...")
@@ -2,7 +2,7 @@ import argparse
 import json
 import os
 import sys
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 def make_cipi_indexes(args):
@@ -39,7 +39,7 @@ def make_cipi_indexes(args):
 
     # save json ../mirdata/datasets/indexes/cipi_index.json
     with open(f"../mirdata/datasets/indexes/cipi_index_{version}.json", "w") as fhandle:
-        json.dump(cipi_index, fhandle, indent=4, ensure_ascii=False)
+        json.dump(add_file_sizes(cipi_index, args.path), fhandle, indent=4, ensure_ascii=False)
 
 
 def main(args):
@@ -0,0 +1,42 @@
+import argparse
+import glob
+import os
+
+from mirdata import compact_index
+
+
+def make_compact_indexes(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            index_paths = sorted(glob.glob(os.path.join(path, "*.json")))
+        else:
+            index_paths = [path]
+
+        for index_path in index_paths:
+            output_path = compact_index.convert(index_path)
+            print(
+                "{} ({:.1f} MB) -> {} ({:.1f} MB)".format(
+                    index_path,
+                    os.path.getsize(index_path) / 1e6,
+                    output_path,
+                    os.path.getsize(output_path) / 1e6,
+                )
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert JSON indexes to compact memory-mapped indexes."
+    )
+    parser.add_argument(
+        "paths",
+        type=str,
+        nargs="+",
+        help="JSON index files, or folders of JSON index files (e.g. mirdata/datasets/indexes).",
+    )
+    args = parser.parse_args()
+    make_compact_indexes([os.path.expanduser(p) for p in args.paths])
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ import hashlib
 import json
 import os
 import glob
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 CARNATIC_RHYTHM_INDEX_PATH = "../mirdata/datasets/indexes/compmusic_carnatic_rhythm_full_index.json"
@@ -39,7 +39,7 @@ def make_compmusic_carnatic_rhythm_index(dataset_data_path, version="full_datase
         }
 
     with open(CARNATIC_RHYTHM_INDEX_PATH, 'w') as fhandle:
-        json.dump(cmr_index, fhandle, indent=2)
+        json.dump(add_file_sizes(cmr_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
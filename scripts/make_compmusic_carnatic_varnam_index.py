@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata.validate import add_file_sizes
 
 COMPMUSIC_VARNAM_INDEX_PATH = './mirdata/datasets/indexes/compmusic_carnatic_varnam_index_1.1.json'
 
@@ -83,7 +84,7 @@ def make_compmusic_varnam_index(dataset_data_path):
     ]
 
     with open(COMPMUSIC_VARNAM_INDEX_PATH, 'w') as fhandle:
-        json.dump(dataset_index, fhandle, indent=2)
+        json.dump(add_file_sizes(dataset_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
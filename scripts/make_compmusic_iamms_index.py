@@ -2,7 +2,7 @@ import argparse
 import hashlib
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 INDEX_PATH = '../mirdata/datasets/indexes/iam_melodic_similarity_index.json'
 DATASET = 'MelodicSimilarityDataset'
@@ -96,7 +96,7 @@ def make_index(dataset_data_path):
                     idx = idx + 1
 
     with open(INDEX_PATH, 'w') as fhandle:
-        json.dump(dataset_index, fhandle, indent=2)
+        json.dump(add_file_sizes(dataset_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -3,7 +3,7 @@ import hashlib
 import json
 import glob
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 COMPMUSIC_TONIC_INDEX_PATH = "../mirdata/datasets/indexes/compmusic_indian_tonic_1.0.json"
@@ -65,7 +65,7 @@ def make_compmusic_indian_tonic(dataset_data_path):
     ]
 
     with open(COMPMUSIC_TONIC_INDEX_PATH, "w") as fhandle:
-        json.dump(tonic_index, fhandle, indent=2)
+        json.dump(add_file_sizes(tonic_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
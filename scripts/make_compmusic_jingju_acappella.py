@@ -2,7 +2,7 @@ import argparse
 import json
 import os
 
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 JINJGU_ACAPPELLA_INDEX_PATH = (
@@ -105,7 +105,7 @@ def make_jingju_acappella_index(dataset_data_path):
                 )
 
     with open(JINJGU_ACAPPELLA_INDEX_PATH, "w") as fhandle:
-        json.dump(jingju_index, fhandle, indent=2)
+        json.dump(add_file_sizes(jingju_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -2,7 +2,7 @@ import argparse
 import hashlib
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 OTMM_MAKAM_INDEX_PATH = os.path.normpath(
@@ -54,7 +54,7 @@ def make_otmm_makam_index(dataset_data_path):
     }
 
     with open(OTMM_MAKAM_INDEX_PATH, 'w') as fhandle:
-        json.dump(otmm_index, fhandle, indent=2)
+        json.dump(add_file_sizes(otmm_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -3,7 +3,7 @@ import hashlib
 import json
 import os
 import glob
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 RAGA_DATASET_INDEX_PATH = "../mirdata/datasets/indexes/compmusic_raga_index_1.0.json"
@@ -142,7 +142,7 @@ def make_compmusic_raga_index(dataset_data_path):
                                     )
 
     with open(RAGA_DATASET_INDEX_PATH, "w") as fhandle:
-        json.dump(raga_index, fhandle, indent=2)
+        json.dump(add_file_sizes(raga_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
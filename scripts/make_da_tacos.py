@@ -5,6 +5,7 @@ import json
 import os
 import itertools
 import re
+from mirdata.validate import add_file_sizes
 
 
 DA_TACOS_INDEX_PATH = '../mirdata/datasets/indexes/da_tacos_index_1.1_crema.json'
@@ -78,7 +79,7 @@ def make_da_tacos_index(data_path, only_crema=False):
         'metadata': metadata
     }
     with open(DA_TACOS_INDEX_PATH, 'w') as fhandle:
-        json.dump(da_tacos_index, fhandle, indent=2)
+        json.dump(add_file_sizes(da_tacos_index, data_path), fhandle, indent=2)
 
 
 def main(args):
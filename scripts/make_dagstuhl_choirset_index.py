@@ -1,6 +1,6 @@
 import argparse
 import glob
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 import json
 import os
 
@@ -242,7 +242,7 @@ def make_dataset_index(data_path):
         )
 
     with open(DATASET_INDEX_PATH, "w") as fhandle:
-        json.dump(index, fhandle, indent=2)
+        json.dump(add_file_sizes(index, data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -0,0 +1,69 @@
+"""Generate mirdata/datasets/registry.json from the dataset loaders.
+
+Run this whenever a loader's INDEXES or REMOTES change. Remote sizes are kept
+from the existing registry while a remote's url and checksum are unchanged, and
+can be (re)fetched with HEAD requests using --fetch-sizes.
+"""
+
+import argparse
+import os
+import urllib.request
+
+from mirdata import registry
+
+
+def fetch_size(url):
+    request = urllib.request.Request(url, method="HEAD")
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            length = response.headers.get("Content-Length")
+    except Exception as exc:
+        print("Could not fetch the size of {}: {}".format(url, exc))
+        return None
+    return int(length) if length is not None else None
+
+
+def make_registry(registry_path, fetch_sizes):
+    new_registry = registry.build_registry()
+    old_registry = (
+        registry.load_registry(registry_path) if os.path.exists(registry_path) else {}
+    )
+
+    for name, info in new_registry.items():
+        old_remotes = (old_registry.get(name) or {}).get("remotes") or {}
+        for key, remote in (info["remotes"] or {}).items():
+            old_remote = old_remotes.get(key)
+            if (
+                old_remote is not None
+                and old_remote["url"] == remote["url"]
+                and old_remote["checksum"] == remote["checksum"]
+            ):
+                remote["size"] = old_remote["size"]
+            if fetch_sizes and remote["size"] is None:
+                remote["size"] = fetch_size(remote["url"])
+
+    registry.write_registry(new_registry, registry_path)
+    print("Wrote {} datasets to {}".format(len(new_registry), registry_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate the static dataset registry."
+    )
+    parser.add_argument(
+        "--registry-path",
+        type=str,
+        default=registry.REGISTRY_PATH,
+        help="Path to write the registry to.",
+    )
+    parser.add_argument(
+        "--fetch-sizes",
+        action="store_true",
+        help="Fetch unknown remote sizes with HEAD requests.",
+    )
+    args = parser.parse_args()
+    make_registry(args.registry_path, args.fetch_sizes)
+
+
+if __name__ == "__main__":
+    main()
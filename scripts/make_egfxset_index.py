@@ -3,7 +3,7 @@ import csv
 import json
 import os
 import pandas as pd
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 EGFXSET_INDEX_PATH = "mirdata/datasets/indexes/egfxset_index_{}.json"
 
@@ -38,7 +38,7 @@ def make_egfxset_index(egfxset_data_path: str, version: str) -> None:
     }
 
     with open(EGFXSET_INDEX_PATH.format(version), "w") as fhandle:
-        json.dump(egfxset_index, fhandle, indent=2)
+        json.dump(add_file_sizes(egfxset_index, egfxset_data_path), fhandle, indent=2)
 
 
 def main(args):
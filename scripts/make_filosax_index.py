@@ -2,7 +2,7 @@ import argparse
 import json
 import os
 from pathlib import Path
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 BACKING_FOLDER = "Backing"
 SAX_FOLDER = "Participant "
@@ -22,7 +22,7 @@ def save_json(file_name, save_file, version_num):
     #save_path = Path(FILOSAX_INDEX_PATH) / ("%s_%s.json" % (file_name, version_num))
     save_path = Path(filosax_path) / ("%s_%s.json" % (file_name, version_num))
     with open(save_path, "w") as fhandle:
-        json.dump(save_file, fhandle, indent=2)
+        json.dump(add_file_sizes(save_file, filosax_path), fhandle, indent=2)
 
 def get_backing_files(track_id, filosax_path, include_checksum=True):
     backing_path = Path(filosax_path) / BACKING_FOLDER / track_id
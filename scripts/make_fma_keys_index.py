@@ -3,7 +3,7 @@ import glob
 import json
 import os
 import csv
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 FMA_KEYS_INDEX_PATH = "mirdata/datasets/indexes/fma_keys_index_1.0.json"
 
@@ -36,7 +36,7 @@ def make_fma_keys_index(fma_keys_data_path):
     }
 
     with open(FMA_KEYS_INDEX_PATH, "w") as fhandle:
-        json.dump(fma_keys_index, fhandle, indent=2)
+        json.dump(add_file_sizes(fma_keys_index, fma_keys_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -3,7 +3,7 @@ import json
 import glob
 import os
 
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 FOUR_WAY_TABLA_INDEX_PATH = (
@@ -34,7 +34,7 @@ def make_four_way_tabla_index(dataset_data_path):
                     md5(os.path.join(dataset_data_path, subset, "onsets", stroke, index + ".onsets")))
 
     with open(FOUR_WAY_TABLA_INDEX_PATH, "w") as fhandle:
-        json.dump(tabla_index, fhandle, indent=2)
+        json.dump(add_file_sizes(tabla_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -1,7 +1,7 @@
 import argparse
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 ONE_SHOT_DATASET_PATH = "../mirdata/datasets/indexes/freesound_one_shot_percussive_sounds_index.json"
@@ -36,7 +36,7 @@ def make_one_shot_index(dataset_data_path):
     }
 
     with open(ONE_SHOT_DATASET_PATH, "w") as fhandle:
-        json.dump(dataset_index, fhandle, indent=2)
+        json.dump(add_file_sizes(dataset_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -3,6 +3,7 @@ import hashlib
 import json
 import csv
 import os
+from mirdata.validate import add_file_sizes
 
 GOOD_SOUND_INDEX_PATH = '../mirdata/datasets/indexes/good_sounds_index.json'
 
@@ -74,7 +75,7 @@ def make_good_sounds_index(data_path):
         }
     }
     with open(GOOD_SOUND_INDEX_PATH, 'w') as fhandle:
-        json.dump(good_sounds_index, fhandle, indent=2)
+        json.dump(add_file_sizes(good_sounds_index, data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -2,7 +2,7 @@ import os
 import json
 import argparse
 
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 GTZAN_GENRE_INDEX_PATH = "../mirdata/datasets/indexes/gtzan_genre_index_1.0.json"
@@ -41,7 +41,7 @@ def make_gtzan_genre_index(data_path):
                                       "tempo": [tempo_path, tempo_checksum]}
 
     with open(GTZAN_GENRE_INDEX_PATH, "w") as f:
-        json.dump(index, f, indent=2)
+        json.dump(add_file_sizes(index, data_path), f, indent=2)
 
 
 def iter_paths(data_path):
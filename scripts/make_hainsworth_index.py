@@ -3,7 +3,7 @@ import hashlib
 import json
 import os
 import glob
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 HAINSWORTH_RHYTHM_INDEX_PATH = "../mirdata/datasets/indexes/hainsworth_full_index_1.0.json"
 
@@ -35,7 +35,7 @@ def make_hainsworth_rhythm_index(dataset_data_path):
                 }
 
     with open(HAINSWORTH_RHYTHM_INDEX_PATH, "w") as fhandle:
-        json.dump(cmr_index, fhandle, indent=2)
+        json.dump(add_file_sizes(cmr_index, dataset_data_path), fhandle, indent=2)
 
 def main(args):
     print("creating index...")
@@ -2,6 +2,7 @@ import argparse
 import hashlib
 import json
 import os
+from mirdata.validate import add_file_sizes
 
 
 haydn_quartets_INDEX_PATH = '../mirdata/datasets/indexes/haydn_op20_index.json'
@@ -40,7 +41,7 @@ def make_haydn_op20_index(data_path):
         "tracks": haydn_op20_tracks
     }
     with open(haydn_quartets_INDEX_PATH, 'w') as fhandle:
-        json.dump(haydn_op20_index, fhandle, indent=2)
+        json.dump(add_file_sizes(haydn_op20_index, data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -1,7 +1,7 @@
 import argparse
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 IDMT_SMT_AUDIO_EFFECTS_INDEX_PATH = (
     "../mirdata/datasets/indexes/idmt_smt_audio_effects_index.json"
@@ -41,7 +41,7 @@ def make_isafx_index(idmt_smt_audio_effects_data_path):
         print("Index file already exists. Overwriting...")
 
     with open(IDMT_SMT_AUDIO_EFFECTS_INDEX_PATH, "w") as fhandle:
-        json.dump(idmt_smt_audio_effects_index, fhandle, indent=2)
+        json.dump(add_file_sizes(idmt_smt_audio_effects_index, idmt_smt_audio_effects_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -2,7 +2,7 @@ import argparse
 import glob
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 IKALA_INDEX_PATH = "mirdata/datasets/indexes/ikala_index_{}.json"
 
@@ -53,7 +53,7 @@ def make_ikala_index(ikala_data_path, version):
     }
 
     with open(IKALA_INDEX_PATH.format(version), "w") as fhandle:
-        json.dump(ikala_index, fhandle, indent=2)
+        json.dump(add_file_sizes(ikala_index, ikala_data_path), fhandle, indent=2)
 
 
 def main(args):
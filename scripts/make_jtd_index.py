@@ -1,7 +1,7 @@
 import argparse
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 from tqdm import tqdm
 
 STEMS = ["piano", "bass", "drums"]    # every recording has annotations for these instruments
@@ -86,7 +86,7 @@ def make_jtd_index(dataset_data_path: str):
     # Combine everything together in dataset index
     dataset_index = {"version": 2.0, "tracks": index_tracks, "multitracks": index_multitracks}
     with open(DATASET_INDEX_PATH, "w") as fhandle:
-        json.dump(dataset_index, fhandle, indent=2)
+        json.dump(add_file_sizes(dataset_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -2,7 +2,7 @@ import argparse
 import json
 import os
 import glob
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 MDB_STEM_SYNTH_PATH = "mirdata/datasets/indexes/mdb_stem_synth_index_{}.json"
 
@@ -42,7 +42,7 @@ def make_mdb_stem_synth_index(mdb_stem_synth_data_path: str, version: str) -> No
     }
 
     with open(MDB_STEM_SYNTH_PATH.format(version), "w") as fhandle:
-        json.dump(mdb_stem_synth_index, fhandle, indent=2)
+        json.dump(add_file_sizes(mdb_stem_synth_index, mdb_stem_synth_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -3,7 +3,7 @@ import hashlib
 import json
 import os
 
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 MEDLEYDB_PITCH_INDEX_PATH = "mirdata/datasets/indexes/medleydb_pitch_index_{}.json"
 
@@ -55,7 +55,7 @@ def make_medleydb_pitch_index(data_path, version):
     }
 
     with open(MEDLEYDB_PITCH_INDEX_PATH.format(version), "w") as fhandle:
-        json.dump(pitch_index, fhandle, indent=2)
+        json.dump(add_file_sizes(pitch_index, data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -4,7 +4,7 @@ import glob
 import hashlib
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 mtg_jamendo_autotagging_moodtheme_INDEX_PATH = '../mirdata/datasets/indexes/mtg_jamendo_autotagging_moodtheme_index_1.0.json'
@@ -28,7 +28,7 @@ def make_mtg_jamendo_autotagging_moodtheme_index(data_path):
             'audio': (audio_path.replace(data_path + '/', ''), md5(audio_path)),
         }
     with open(mtg_jamendo_autotagging_moodtheme_INDEX_PATH, 'w') as fhandle:
-        json.dump(mtg_jamendo_autotagging_moodtheme_index, fhandle, indent=2)
+        json.dump(add_file_sizes(mtg_jamendo_autotagging_moodtheme_index, data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -16,6 +16,7 @@ import glob
 import hashlib
 import json
 import os
+from mirdata.validate import add_file_sizes
 
 
 def md5(file_path):
@@ -202,7 +203,7 @@ def make_multivox_index(data_path):
     # Save index
     os.makedirs(os.path.dirname(DATASET_INDEX_PATH), exist_ok=True)
     with open(DATASET_INDEX_PATH, "w") as fhandle:
-        json.dump(index, fhandle, indent=2)
+        json.dump(add_file_sizes(index, data_path), fhandle, indent=2)
 
     print(f"Index created successfully at {DATASET_INDEX_PATH}")
     print(f"Total tracks indexed: {len(index['tracks'])}")
@@ -6,7 +6,7 @@ from tqdm import tqdm
 import json
 import os
 from pathlib import Path
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 DATASET_INDEX_PATH = "../mirdata/datasets/indexes/openmic2018_index.json"
 
@@ -60,7 +60,7 @@ def make_dataset_index(dataset_data_path):
     dataset_index.update({"tracks": index_tracks})
 
     with open(DATASET_INDEX_PATH, "w") as fhandle:
-        json.dump(dataset_index, fhandle, indent=2)
+        json.dump(add_file_sizes(dataset_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -4,7 +4,7 @@ import hashlib
 import json
 import os
 import string
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 DATASET_INDEX_PATH = '../mirdata/datasets/indexes/phenicx_anechoic_index.json'
 
@@ -120,7 +120,7 @@ def make_dataset_index(data_path):
             )
 
     with open(DATASET_INDEX_PATH, 'w') as fhandle:
-        json.dump(index, fhandle, indent=2)
+        json.dump(add_file_sizes(index, data_path), fhandle, indent=2)
 
 
 def main(args):
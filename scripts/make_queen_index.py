@@ -2,7 +2,7 @@ import argparse
 import hashlib
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 QUEEN_INDEX_PATH = '../mirdata/datasets/indexes/queen_index.json'
@@ -72,7 +72,7 @@ def make_queen_index(data_path):
         'metadata': None
     }
     with open(QUEEN_INDEX_PATH, 'w') as fhandle:
-        json.dump(queen_index, fhandle, indent=2)
+        json.dump(add_file_sizes(queen_index, data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -2,7 +2,7 @@ import argparse
 import hashlib
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 SARAGA_HINDUSTANI_INDEX_PATH = '../mirdata/datasets/indexes/saraga_hindustani_index.json'
@@ -81,7 +81,7 @@ def make_saraga_hindustani_index(dataset_data_path):
                     idx = idx + 1
 
     with open(SARAGA_HINDUSTANI_INDEX_PATH, 'w') as fhandle:
-        json.dump(saraga_index, fhandle, indent=2)
+        json.dump(add_file_sizes(saraga_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
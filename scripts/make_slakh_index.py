@@ -5,7 +5,7 @@ import os
 
 import yaml
 
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 DATASET_INDEX_PATH = "mirdata/datasets/indexes/slakh_index_{}.json"
 
@@ -86,7 +86,7 @@ def make_dataset_index(dataset_data_path, version):
 
     os.chdir(curr_dir)
     with open(dataset_index_path, "w") as fhandle:
-        json.dump(dataset_index, fhandle, indent=2)
+        json.dump(add_file_sizes(dataset_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
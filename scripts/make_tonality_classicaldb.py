@@ -2,7 +2,7 @@ import argparse
 import hashlib
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 classicalDB_INDEX_PATH = '../mirdata/datasets/indexes/tonality_classicaldb_index.json'
@@ -33,7 +33,7 @@ def make_classicalDB_index(data_path):
                 'HPCP': (HPCP_path.replace(data_path + '/', ''), md5(HPCP_path))
             }
     with open(classicalDB_INDEX_PATH, 'w') as fhandle:
-        json.dump(classicalDB_index, fhandle, indent=2)
+        json.dump(add_file_sizes(classicalDB_index, data_path), fhandle, indent=2)
 
 
 def main(args):
@@ -1,7 +1,7 @@
 import argparse
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 
 TONAS_INDEX_PATH = "../mirdata/datasets/indexes/tonas_index.json"
@@ -42,7 +42,7 @@ def make_tonas_index(dataset_data_path):
     }
 
     with open(TONAS_INDEX_PATH, "w") as fhandle:
-        json.dump(tonas_index, fhandle, indent=2)
+        json.dump(add_file_sizes(tonas_index, dataset_data_path), fhandle, indent=2)
 
 
 def main(args):
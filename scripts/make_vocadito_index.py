@@ -2,7 +2,7 @@ import argparse
 import csv
 import json
 import os
-from mirdata.validate import md5
+from mirdata.validate import add_file_sizes, md5
 
 VOCADITO_INDEX_PATH = "mirdata/datasets/indexes/vocadito_index_{}.json"
 
@@ -57,7 +57,7 @@ def make_vocadito_index(vocadito_data_path: str, version: str) -> None:
     }
 
     with open(VOCADITO_INDEX_PATH.format(version), "w") as fhandle:
-        json.dump(vocadito_index, fhandle, indent=2)
+        json.dump(add_file_sizes(vocadito_index, vocadito_data_path), fhandle, indent=2)
 
 
 def main(args):
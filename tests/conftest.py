@@ -19,6 +19,12 @@ def pytest_addoption(parser):
     parser.addoption(
         "--report-file", type=str, default="", help="dataset to test locally"
     )
+    parser.addoption(
+        "--import-times",
+        action="store_true",
+        default=False,
+        help="check the time taken to import the dataset modules",
+    )
 
 
 @pytest.fixture(scope="session")
@@ -33,6 +39,12 @@ def skip_remote(request):
         pytest.skip()
 
 
+@pytest.fixture(scope="session")
+def check_import_times(request):
+    if not request.config.getoption("--import-times"):
+        pytest.skip("import times are only checked with --import-times")
+
+
 @pytest.fixture(scope="session")
 def test_dataset(request):
     return request.config.getoption("--dataset")
@@ -140,3 +140,38 @@ def test_download(httpserver):
 
     if os.path.exists(data_home):
         shutil.rmtree(data_home)
+
+
+def test_download_options(httpserver):
+    data_home = "tests/resources/mir_datasets/idmt_smt_audio_effects_download"
+    if os.path.exists(data_home):
+        shutil.rmtree(data_home)
+
+    httpserver.serve_content(
+        open("tests/resources/download/IDMT-SMT-AUDIO-EFFECTS.zip", "rb").read()
+    )
+    dataset = idmt_smt_audio_effects.Dataset(data_home, version="test")
+    dataset.remotes = {
+        "full_dataset": download_utils.RemoteFileMetadata(
+            filename="IDMT-SMT-AUDIO-EFFECTS.zip",
+            url=httpserver.url,
+            checksum=("462b32e4834749204347014c819b3a7c"),
+        )
+    }
+    readme_path = os.path.join(data_home, "Gitarre monophon", "ReadMe.txt")
+
+    # only the indexed files and the XML metadata are extracted
+    dataset.download(
+        max_workers=2, stream=True, track_ids=["G73-45200-3341-33944"], cleanup=True
+    )
+    assert os.path.isdir(data_home)
+    assert not os.path.exists(readme_path)
+    shutil.rmtree(data_home)
+
+    dataset.download(max_workers=2, indexed_only=True)
+    assert not os.path.exists(readme_path)
+    shutil.rmtree(data_home)
+
+    dataset.download(max_workers=2)
+    assert os.path.exists(readme_path)
+    shutil.rmtree(data_home)
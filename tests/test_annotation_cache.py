@@ -0,0 +1,216 @@
+import os
+from io import StringIO
+
+import numpy as np
+import pytest
+
+import mirdata
+from mirdata import annotation_cache, annotations, io
+from mirdata.datasets import beatles
+
+BEATS_PATH = (
+    "tests/resources/mir_datasets/beatles/annotations/beat/The Beatles/"
+    + "01_-_Please_Please_Me/11_-_Do_You_Want_To_Know_A_Secret.txt"
+)
+MIDI_PATH = "tests/resources/mir_datasets/slakh/babyslakh_16k/Track00001/MIDI/S08.mid"
+
+
+@pytest.fixture
+def cache(tmpdir):
+    cache = annotation_cache.enable(str(tmpdir.join("cache")))
+    yield cache
+    annotation_cache.disable()
+
+
+def _assert_same(annotation, other):
+    assert type(annotation) is type(other)
+    assert annotation.__dict__.keys() == other.__dict__.keys()
+    for name, value in annotation.__dict__.items():
+        if isinstance(value, np.ndarray):
+            assert np.array_equal(value, other.__dict__[name])
+        else:
+            assert value == other.__dict__[name]
+
+
+ANNOTATIONS = [
+    annotations.BeatData(
+        np.array([0.1, 0.5, 1.0]), "s", np.array([1, 2, 3]), "bar_index"
+    ),
+    annotations.ChordData(
+        np.array([[0.0, 1.0], [1.0, 2.0]]), "s", ["A:maj", "N"], "harte"
+    ),
+    annotations.EventData(np.array([[0.0, 1.0]]), "s", ["clap"], "open"),
+    annotations.F0Data(
+        np.array([0.0, 0.1, 0.2]),
+        "s",
+        np.array([0.0, 220.0, 221.0]),
+        "hz",
+        np.array([0.0, 1.0, 1.0]),
+        "binary",
+        np.array([0.1, 0.9, 0.8]),
+        "likelihood",
+    ),
+    annotations.F0Data(
+        np.array([0.0, 0.1]),
+        "s",
+        np.array(["A4", "B4"], dtype=object),
+        "note_name",
+        np.array([1.0, 1.0]),
+        "binary",
+    ),
+    annotations.KeyData(np.array([[0.0, 2.0]]), "s", ["G#:minor"], "key_mode"),
+    annotations.LyricData(np.array([[0.0, 2.0]]), "s", ["la la"], "words"),
+    annotations.MultiF0Data(
+        np.array([0.0, 0.1, 0.2]),
+        "s",
+        [[], [220.0, 330.0], [110.0]],
+        "hz",
+        [[], [0.5, 0.5], [1.0]],
+        "likelihood",
+    ),
+    annotations.NoteData(
+        np.array([[0.0, 1.0], [0.5, 2.0]]), "s", np.array([60.0, 62.0]), "midi"
+    ),
+    annotations.SectionData(np.array([[0.0, 10.0]]), "s", ["verse"], "open"),
+    annotations.TempoData(
+        np.array([[0.0, 10.0]]),
+        "s",
+        np.array([120.0]),
+        "bpm",
+        np.array([1.0]),
+        "likelihood",
+    ),
+]
+
+
+@pytest.mark.parametrize("annotation", ANNOTATIONS)
+def test_write_read_annotation(tmpdir, annotation):
+    entry_path = str(tmpdir.join("ab", "entry.npz"))
+    annotation_cache.write_annotation(entry_path, annotation)
+    _assert_same(annotation_cache.read_annotation(entry_path), annotation)
+
+
+def test_write_read_list_fields(tmpdir):
+    # lists of lists which are not all floats keep their types
+    annotation = annotations.MultiF0Data(
+        np.array([0.0, 0.1]), "s", [[], [220.0, 330.0]], "hz"
+    )
+    annotation.confidence_list = [[], [1, 0]]
+    annotation.labels = [["a"], ["b", "c"]]
+    entry_path = str(tmpdir.join("ab", "entry.npz"))
+    annotation_cache.write_annotation(entry_path, annotation)
+    cached = annotation_cache.read_annotation(entry_path)
+    _assert_same(cached, annotation)
+    assert isinstance(cached.confidence_list[1][0], int)
+    assert isinstance(cached.labels[1][0], str)
+    assert isinstance(cached.frequency_list[1][0], float)
+
+
+def test_cached_loader(cache, mocker):
+    beats = beatles.load_beats(BEATS_PATH)
+    assert cache.misses == 1 and cache.hits == 0
+
+    # a hit neither parses nor validates the annotation again
+    validate_times = mocker.spy(annotations, "validate_times")
+    cached_beats = beatles.load_beats(BEATS_PATH)
+    assert cache.hits == 1
+    assert validate_times.call_count == 0
+    _assert_same(cached_beats, beats)
+
+    # another process (or cache instance) reads the same entries
+    other = annotation_cache.enable(cache.root)
+    _assert_same(beatles.load_beats(BEATS_PATH), beats)
+    assert other.hits == 1
+
+    # file handles and disabled caches bypass the cache
+    with open(BEATS_PATH) as fhandle:
+        beatles.load_beats(StringIO(fhandle.read()))
+    annotation_cache.disable()
+    beatles.load_beats(BEATS_PATH)
+    assert other.hits == 1 and other.misses == 0
+
+    annotation_cache.enable(cache.root).clear()
+    assert not any(files for _, _, files in os.walk(cache.root))
+
+
+def test_cache_key(cache, tmpdir):
+    path = str(tmpdir.join("beats.txt"))
+    with open(BEATS_PATH) as fhandle:
+        content = fhandle.read()
+    with open(path, "w") as fhandle:
+        fhandle.write(content)
+
+    key = cache.key(beatles.load_beats, path, (), {})
+    assert cache.key(beatles.load_beats, path, (), {}) == key
+    assert cache.key(beatles.load_beats, BEATS_PATH, (), {}) == key
+    assert cache.key(beatles.load_sections, path, (), {}) != key
+    assert cache.key(beatles.load_beats, path, (1,), {}) != key
+    assert cache.key(beatles.load_beats, path, (object(),), {}) is None
+
+    # editing the file changes the key
+    with open(path, "w") as fhandle:
+        fhandle.write(content[:-20])
+    os.utime(path, ns=(0, 0))
+    assert cache.key(beatles.load_beats, path, (), {}) != key
+
+
+def test_cache_key_helpers(cache, mocker):
+    key = cache.key(beatles.load_beats, BEATS_PATH, (), {})
+
+    # editing the annotations or io modules, or the loader's module, changes
+    # the key
+    file_checksum = annotation_cache.validate.file_checksum
+    for module in [annotations, io, beatles]:
+        mocker.patch.object(
+            annotation_cache.validate,
+            "file_checksum",
+            side_effect=lambda path: (
+                "edited" if path == module.__file__ else file_checksum(path)
+            ),
+        )
+        assert cache.key(beatles.load_beats, BEATS_PATH, (), {}) != key
+
+
+@io.coerce_to_string_io
+def _load_text(fhandle):
+    return fhandle.read()
+
+
+@io.coerce_to_string_io
+def _load_beats(fhandle):
+    return beatles.load_beats(StringIO(fhandle.read()))
+
+
+def test_loader_without_return_type(cache, mocker):
+    # loaders without a return type hint are not hashed unless they return an
+    # annotation
+    checksum = mocker.spy(cache, "checksum")
+    _load_text(BEATS_PATH)
+    _load_text(BEATS_PATH)
+    assert checksum.call_count == 0
+    assert cache.misses == 0
+
+    beats = _load_beats(BEATS_PATH)
+    assert cache.misses == 1
+    _assert_same(_load_beats(BEATS_PATH), beats)
+    assert cache.hits == 1
+
+
+def test_cached_midi(cache):
+    notes = io.load_notes_from_midi(MIDI_PATH)
+    multif0 = io.load_multif0_from_midi(MIDI_PATH)
+    assert cache.misses == 2
+    _assert_same(io.load_notes_from_midi(MIDI_PATH), notes)
+    _assert_same(io.load_multif0_from_midi(MIDI_PATH), multif0)
+    assert cache.hits == 2
+    io.load_notes_from_midi(MIDI_PATH, skip_drums=False)
+    assert cache.misses == 3
+
+
+def test_cached_track(cache):
+    data_home = "tests/resources/mir_datasets/beatles"
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+    beats = dataset.track("0111").beats
+    cached_beats = dataset.track("0111").beats
+    assert cache.hits == 1
+    _assert_same(cached_beats, beats)
@@ -0,0 +1,211 @@
+import io
+import os
+import tarfile
+import zipfile
+
+import numpy as np
+import pytest
+
+import mirdata
+from mirdata import archive, validate
+from mirdata.lazy import open
+
+BEATLES_HOME = os.path.join("tests", "resources", "mir_datasets", "beatles")
+TRACK_ID = "0111"
+
+
+def _dataset_files(data_home):
+    files = []
+    for root, _, fnames in os.walk(data_home):
+        for fname in fnames:
+            path = os.path.join(root, fname)
+            files.append((path, os.path.relpath(path, data_home)))
+    return files
+
+
+def _make_archive(tmpdir, extension, compression=zipfile.ZIP_STORED):
+    archive_path = str(tmpdir.join("beatles" + extension))
+    if extension == ".zip":
+        with zipfile.ZipFile(archive_path, "w", compression=compression) as zfile:
+            for path, name in _dataset_files(BEATLES_HOME):
+                zfile.write(path, name)
+    else:
+        with tarfile.open(archive_path, "w") as tfile:
+            for path, name in _dataset_files(BEATLES_HOME):
+                tfile.add(path, "./" + name)
+    return archive_path
+
+
+def test_split_path(tmpdir):
+    archive_path = _make_archive(tmpdir, ".zip")
+    assert archive.split_path(os.path.join(archive_path, "audio", "a.wav")) == (
+        archive_path,
+        "audio/a.wav",
+    )
+    assert archive.split_path(archive_path) is None
+    assert archive.split_path(os.path.join(BEATLES_HOME, "audio")) is None
+    # a folder named like an archive is not an archive
+    os.makedirs(str(tmpdir.join("folder.zip")))
+    assert archive.split_path(str(tmpdir.join("folder.zip", "a.wav"))) is None
+    assert archive.split_path(None) is None
+
+
+@pytest.mark.parametrize(
+    "extension,compression",
+    [
+        (".zip", zipfile.ZIP_STORED),
+        (".zip", zipfile.ZIP_DEFLATED),
+        (".zip", zipfile.ZIP_BZIP2),
+        (".tar", None),
+    ],
+)
+def test_open_member(tmpdir, extension, compression):
+    archive_path = _make_archive(tmpdir, extension, compression)
+    for path, name in _dataset_files(BEATLES_HOME):
+        with open(path, "rb", compression="disable") as fhandle:
+            expected = fhandle.read()
+        member_path = os.path.join(archive_path, name)
+        with open(member_path, "rb", compression="disable") as fhandle:
+            assert fhandle.read() == expected
+            fhandle.seek(len(expected) // 2)
+            assert fhandle.read() == expected[len(expected) // 2 :]
+        assert archive.member_size(member_path) == len(expected)
+
+    with pytest.raises(FileNotFoundError):
+        open(os.path.join(archive_path, "missing.txt"))
+    with pytest.raises(ValueError):
+        open(os.path.join(archive_path, name), "w")
+
+
+def test_deflated_member_streaming(tmpdir, mocker):
+    archive_path = _make_archive(tmpdir, ".zip", zipfile.ZIP_DEFLATED)
+    path, name = max(_dataset_files(BEATLES_HOME), key=lambda f: os.path.getsize(f[0]))
+    with open(path, "rb", compression="disable") as fhandle:
+        expected = fhandle.read()
+
+    # deflated members are not decompressed in one piece
+    mocker.patch.object(archive.zlib, "decompress", side_effect=AssertionError)
+    mocker.patch.object(archive, "DEFLATE_CHUNK_SIZE", 1024)
+    with open(os.path.join(archive_path, name), "rb") as fhandle:
+        assert fhandle.read(100) == expected[:100]
+        fhandle.seek(len(expected) - 100)
+        assert fhandle.read() == expected[-100:]
+        fhandle.seek(10)
+        assert fhandle.read(100) == expected[10:110]
+
+
+def test_open_archives_are_bounded(tmpdir, mocker):
+    mocker.patch.object(archive, "MAX_OPEN_ARCHIVES", 2)
+    mocker.patch.object(archive, "_archives", archive.collections.OrderedDict())
+    close = mocker.spy(archive.Archive, "close")
+    paths = []
+    for i in range(3):
+        paths.append(str(tmpdir.join("data{}.zip".format(i))))
+        with zipfile.ZipFile(paths[-1], "w", compression=zipfile.ZIP_BZIP2) as zfile:
+            zfile.writestr("a.txt", b"abc")
+
+    first = archive.get_archive(paths[0])
+    with first.open("a.txt", "rb") as fhandle:
+        archive.get_archive(paths[1])
+        assert archive.get_archive(paths[0]) is first
+        archive.get_archive(paths[2])
+        assert close.call_count == 1
+        assert [key[0] for key in archive._archives] == [paths[0], paths[2]]
+        # members opened before the archive was closed can still be read
+        assert fhandle.read() == b"abc"
+    assert archive.get_archive(paths[1]) is not None
+    assert close.call_count == 2
+
+
+def test_open_member_text_and_gz(tmpdir):
+    archive_path = str(tmpdir.join("data.zip"))
+    text = "ünïcode\nlines\n"
+    with zipfile.ZipFile(archive_path, "w") as zfile:
+        zfile.writestr("a.txt", text.encode("utf-8"))
+        zfile.writestr("b.txt.gz", _gzip(text.encode("utf-8")))
+
+    with open(os.path.join(archive_path, "a.txt"), encoding="utf-8") as fhandle:
+        assert fhandle.readlines() == ["ünïcode\n", "lines\n"]
+    with open(os.path.join(archive_path, "b.txt.gz"), encoding="utf-8") as fhandle:
+        assert fhandle.read() == text
+
+
+def _gzip(data):
+    import gzip
+
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb") as fhandle:
+        fhandle.write(data)
+    return buffer.getvalue()
+
+
+def test_member_table(tmpdir, mocker):
+    archive_path = _make_archive(tmpdir, ".zip")
+    build = mocker.spy(archive, "build_member_table")
+    members = archive.load_member_table(archive_path)
+    assert build.call_count == 1
+    assert os.path.exists(archive_path + archive.MEMBER_TABLE_SUFFIX)
+
+    # the stored table is reused while the archive is unchanged
+    assert archive.load_member_table(archive_path) == members
+    assert build.call_count == 1
+
+    os.utime(archive_path, ns=(0, 0))
+    assert archive.load_member_table(archive_path) == members
+    assert build.call_count == 2
+
+
+def test_compressed_tar(tmpdir):
+    tar_path = str(tmpdir.join("data.tar"))
+    with tarfile.open(tar_path, "w:gz") as tfile:
+        tfile.add(os.path.join(BEATLES_HOME, "audio"), "audio")
+    with pytest.raises(ValueError):
+        archive.load_member_table(tar_path)
+
+
+@pytest.mark.parametrize("extension", [".zip", ".tar"])
+def test_dataset_in_archive(tmpdir, extension):
+    archive_path = _make_archive(tmpdir, extension, zipfile.ZIP_DEFLATED)
+    expected = mirdata.initialize(
+        "beatles", data_home=BEATLES_HOME, version="test"
+    ).track(TRACK_ID)
+    track = mirdata.initialize("beatles", data_home=archive_path, version="test").track(
+        TRACK_ID
+    )
+
+    assert track.get_path("audio") == os.path.join(
+        archive_path, expected._track_paths["audio"][0]
+    )
+    assert np.allclose(track.beats.times, expected.beats.times)
+    assert track.chords.labels == expected.chords.labels
+    assert track.key.keys == expected.key.keys
+    assert track.sections.labels == expected.sections.labels
+    audio, sr = track.audio
+    expected_audio, expected_sr = expected.audio
+    assert sr == expected_sr
+    assert np.allclose(audio, expected_audio)
+
+    # audio paths inside the archive are decoded from the member
+    path_audio, path_sr = mirdata.io.load_audio(track.get_path("audio"), mono=True)
+    assert path_sr == expected_sr
+    assert np.allclose(path_audio, expected_audio)
+    info = mirdata.io.read_audio_info(track.get_path("audio"))
+    assert info["sr"] == expected_sr and info["frames"] == expected_audio.shape[-1]
+
+    # files are validated against the archive's members, without a manifest
+    dataset = mirdata.initialize("beatles", data_home=archive_path, version="test")
+    index = {"tracks": {TRACK_ID: dataset._index["tracks"][TRACK_ID]}}
+    audio_entry = index["tracks"][TRACK_ID]["audio"]
+    size = os.path.getsize(os.path.join(BEATLES_HOME, audio_entry[0]))
+    index["tracks"][TRACK_ID] = {"audio": [audio_entry[0], audio_entry[1], size]}
+    missing, invalid = validate.validate_index(
+        index, archive_path, verbose=False, mode="quick"
+    )
+    assert missing["tracks"] == {} and invalid["tracks"] == {}
+    missing, _ = dataset.validate(verbose=False)
+    expected_missing, _ = mirdata.initialize(
+        "beatles", data_home=BEATLES_HOME, version="test"
+    ).validate(verbose=False)
+    assert missing["tracks"].keys() == expected_missing["tracks"].keys()
+    assert TRACK_ID not in missing["tracks"]
+    assert not os.path.exists(os.path.join(archive_path, validate.MANIFEST_FILENAME))
@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+
+import pytest
+
+import mirdata
+from mirdata import compact_index
+
+
+def _load_json(path):
+    with open(path, encoding="utf-8") as fhandle:
+        return json.load(fhandle)
+
+
+@pytest.mark.parametrize(
+    "index_name",
+    [
+        "beatles_index_1.2_sample.json",
+        "slakh_index_baby_sample.json",
+        "good_sounds_index_1.0_sample.json",
+        "test_index_valid.json",
+    ],
+)
+def test_convert_roundtrip(tmpdir, index_name):
+    json_path = os.path.join("tests", "indexes", index_name)
+    expected = _load_json(json_path)
+    output_path = compact_index.convert(
+        json_path, str(tmpdir.join("index" + compact_index.COMPACT_INDEX_EXTENSION))
+    )
+    index = compact_index.CompactIndex(output_path)
+
+    assert set(index.keys()) == {k for k, v in expected.items() if v is not None} | (
+        {"version"}
+    )
+    assert index["version"] == expected["version"]
+    for group in ["tracks", "multitracks"]:
+        if group not in expected:
+            assert group not in index
+            continue
+        assert list(index[group].keys()) == list(expected[group].keys())
+        assert len(index[group]) == len(expected[group])
+        assert dict(index[group].items()) == expected[group]
+        for item_id, files in expected[group].items():
+            assert item_id in index[group]
+            assert index[group][item_id] == files
+        assert "not-an-id" not in index[group]
+        assert 1 not in index[group]
+        with pytest.raises(KeyError):
+            index[group]["not-an-id"]
+    if expected.get("metadata") is not None:
+        assert index["metadata"] == expected["metadata"]
+    if "exclude" in expected:
+        assert index["exclude"] == expected["exclude"]
+
+
+def test_sizes_roundtrip(tmpdir):
+    index = {
+        "version": "1",
+        "tracks": {
+            "a": {"audio": ["a.wav", "x", 12], "notes": ["a.txt", "y"]},
+            "b": {"audio": ["b.wav", "z", 0], "notes": [None, None, None]},
+        },
+    }
+    output_path = str(tmpdir.join("sizes.mirdx"))
+    compact_index.write(index, output_path)
+    compact = compact_index.CompactIndex(output_path)
+    assert compact["tracks"]["a"] == index["tracks"]["a"]
+    assert compact["tracks"]["b"] == {
+        "audio": ["b.wav", "z", 0],
+        "notes": [None, None],
+    }
+
+
+def test_compact_path():
+    assert compact_index.compact_path("a/b/c_index_1.0.json") == "a/b/c_index_1.0.mirdx"
+
+
+def test_invalid_files(tmpdir):
+    bad_entry = {"version": "1", "tracks": {"a": {"audio": ["a.wav", "x", 12, 0]}}}
+    with pytest.raises(ValueError):
+        compact_index.write(bad_entry, str(tmpdir.join("bad.mirdx")))
+
+    not_compact = str(tmpdir.join("not_compact.mirdx"))
+    with open(not_compact, "wb") as fhandle:
+        fhandle.write(b"{}" * 10)
+    with pytest.raises(ValueError):
+        compact_index.CompactIndex(not_compact)
+
+
+def test_dataset_uses_compact_index(tmpdir):
+    dataset = mirdata.initialize("slakh", version="test")
+    json_path = str(tmpdir.join(os.path.basename(dataset.index_path)))
+    shutil.copy(dataset.index_path, json_path)
+    dataset.index_path = json_path
+    expected = _load_json(json_path)
+
+    # without a compact index the json index is used
+    assert isinstance(dataset._index, dict)
+
+    # with an up to date compact index, it is preferred
+    compact_index.convert(json_path)
+    dataset = mirdata.initialize("slakh", version="test")
+    dataset.index_path = json_path
+    assert isinstance(dataset._index, compact_index.CompactIndex)
+    assert dataset.track_ids == list(expected["tracks"].keys())
+    assert dataset.mtrack_ids == list(expected["multitracks"].keys())
+    track_id = dataset.track_ids[0]
+    track = dataset.track(track_id)
+    assert track._track_paths == expected["tracks"][track_id]
+    mtrack = dataset.multitrack(dataset.mtrack_ids[0])
+    assert mtrack.track_ids == expected["multitracks"][dataset.mtrack_ids[0]]["tracks"]
+    assert set(mtrack.tracks.keys()) == set(mtrack.track_ids)
+    with pytest.raises(ValueError):
+        dataset.track("not-a-track")
+
+    # a compact index older than the json index is ignored
+    os.utime(json_path, (0, os.path.getmtime(json_path) + 10))
+    dataset = mirdata.initialize("slakh", version="test")
+    dataset.index_path = json_path
+    assert isinstance(dataset._index, dict)
@@ -1,9 +1,13 @@
+import concurrent.futures
+import copy
+import pickle
 import pytest
 import os
+import shutil
 import numpy as np
 
 import mirdata
-from mirdata import core
+from mirdata import core, io
 from tests.test_utils import DEFAULT_DATA_HOME
 
 
@@ -767,3 +771,352 @@ def test_dataset_splits():
 
     splits = test_dataset.get_mtrack_splits()
     assert set(splits.keys()) == set(["train", "validation", "test", "omitted"])
+
+
+def test_shared_registry(mocker):
+    registry = core.SharedRegistry(maxsize=2)
+    load = mocker.Mock(side_effect=lambda: {"a": 1})
+
+    assert registry.get(("index", "x.json", 1, None), load) == {"a": 1}
+    assert registry.get(("index", "x.json", 1, None), load) == {"a": 1}
+    assert load.call_count == 1
+
+    # a different mtime is a different entry
+    registry.get(("index", "x.json", 2, None), load)
+    assert load.call_count == 2
+    assert len(registry) == 2
+
+    # least recently used entries are evicted
+    registry.get(("metadata", "x.json", 2, "home"), load)
+    assert len(registry) == 2
+    registry.get(("index", "x.json", 1, None), load)
+    assert load.call_count == 4
+
+    registry.invalidate(data_home="home")
+    assert len(registry) == 1
+    registry.invalidate(index_path="y.json")
+    assert len(registry) == 1
+    registry.clear()
+    assert len(registry) == 0
+
+    # failed loads are not stored
+    with pytest.raises(IOError):
+        registry.get(("index", "z.json", 1, None), mocker.Mock(side_effect=IOError))
+    assert len(registry) == 0
+
+    # maxsize 0 disables sharing
+    registry.maxsize = 0
+    registry.get(("index", "x.json", 1, None), load)
+    assert len(registry) == 0
+
+
+def test_dataset_shared_registry():
+    core.shared_registry.clear()
+    dataset1 = mirdata.initialize("beatles", version="test")
+    dataset2 = mirdata.initialize("beatles", version="test")
+    assert dataset1 is not dataset2
+    assert dataset1._index is dataset2._index
+
+    dataset3 = mirdata.initialize("beatles", data_home="other", version="test")
+    assert dataset3._index is dataset1._index
+
+    core.shared_registry.invalidate(index_path=dataset1.index_path)
+    dataset4 = mirdata.initialize("beatles", version="test")
+    assert dataset4._index is not dataset1._index
+    assert dataset4._index == dataset1._index
+
+    # metadata is shared per data_home
+    data_home = "tests/resources/mir_datasets/ikala"
+    dataset5 = mirdata.initialize("ikala", data_home=data_home, version="test")
+    dataset6 = mirdata.initialize("ikala", data_home=data_home, version="test")
+    track = dataset5.track(dataset5.track_ids[0])
+    assert track._metadata() is dataset6._get_metadata()
+    assert dataset6._metadata is dataset5._get_metadata()
+
+
+def test_shared_registry_read_only():
+    core.shared_registry.clear()
+    dataset1 = mirdata.initialize("beatles", version="test")
+    dataset2 = mirdata.initialize("beatles", version="test")
+    track_ids = list(dataset2.track_ids)
+
+    # the shared index can't be modified through one instance
+    with pytest.raises(TypeError):
+        dataset1._index["tracks"].pop(track_ids[0])
+    with pytest.raises(TypeError):
+        dataset1._index["tracks"][track_ids[0]]["audio"] = ["a.wav", "1234"]
+    assert list(mirdata.initialize("beatles", version="test").track_ids) == track_ids
+
+    # copies can be modified, without changing the shared index
+    index = copy.deepcopy(dataset1._index)
+    index["tracks"].pop(track_ids[0])
+    assert type(index["tracks"]) is dict
+    assert track_ids[0] in dataset2._index["tracks"]
+    assert pickle.loads(pickle.dumps(dataset1._index)) == dataset1._index
+
+    data_home = "tests/resources/mir_datasets/ikala"
+    dataset3 = mirdata.initialize("ikala", data_home=data_home, version="test")
+    metadata = dataset3._get_metadata()
+    with pytest.raises(TypeError):
+        metadata[next(iter(metadata))] = None
+
+
+def test_track_collection(mocker):
+    dataset = mirdata.initialize("beatles", version="test")
+    track_init = mocker.spy(dataset._track_class, "__init__")
+    tracks = dataset.load_tracks()
+    assert isinstance(tracks, core.TrackCollection)
+    assert track_init.call_count == 0
+
+    track_ids = dataset.track_ids
+    assert len(tracks) == len(track_ids)
+    assert list(tracks) == track_ids
+    assert track_ids[0] in tracks
+    assert "not_a_track" not in tracks
+    with pytest.raises(KeyError):
+        tracks["not_a_track"]
+    assert tracks.get("not_a_track") is None
+
+    track = tracks[track_ids[0]]
+    assert isinstance(track, core.Track)
+    assert track.track_id == track_ids[0]
+    assert tracks[track_ids[0]] is track
+    assert track_init.call_count == 1
+
+    subset = tracks[1:]
+    assert list(subset) == track_ids[1:]
+    assert track_ids[0] not in subset
+    selected = tracks.select([track_ids[1], track_ids[0]])
+    assert list(selected) == [track_ids[1], track_ids[0]]
+    with pytest.raises(KeyError):
+        tracks.select(["not_a_track"])
+    filtered = tracks.filter(lambda track_id: track_id == track_ids[1])
+    assert list(filtered.keys()) == [track_ids[1]]
+    assert track_init.call_count == 1
+
+    # dictionary usage still works, creating tracks as they are accessed
+    assert [t.track_id for t in tracks.values()] == track_ids
+    assert {k: v.track_id for k, v in tracks.items()} == {t: t for t in track_ids}
+    assert tracks.copy().keys() == set(track_ids)
+
+    dataset = mirdata.initialize("slakh", version="test")
+    mtracks = dataset.load_multitracks()
+    mtrack_id = dataset.mtrack_ids[0]
+    assert mtracks[mtrack_id].mtrack_id == mtrack_id
+
+
+def _n_beats(track):
+    return len(track.beats.times)
+
+
+def test_pickle():
+    data_home = "tests/resources/mir_datasets/beatles"
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+    dataset._index  # loaded, but not pickled
+    dataset_copy = pickle.loads(pickle.dumps(dataset))
+    assert type(dataset_copy) is type(dataset)
+    assert dataset_copy.data_home == data_home
+    assert dataset_copy.version == dataset.version
+    assert len(pickle.dumps(dataset)) < 1000
+
+    track = dataset.track("0111")
+    track.beats  # cached, but not pickled
+    assert len(pickle.dumps(track)) < 1000
+    track_copy = pickle.loads(pickle.dumps(track))
+    assert track_copy.track_id == "0111"
+    assert np.allclose(track_copy.beats.times, track.beats.times)
+
+    slakh = mirdata.initialize("slakh", version="test")
+    mtrack = slakh.multitrack(slakh.mtrack_ids[0])
+    mtrack_copy = pickle.loads(pickle.dumps(mtrack))
+    assert mtrack_copy.mtrack_id == mtrack.mtrack_id
+    assert mtrack_copy.track_ids == mtrack.track_ids
+
+    # datasets built without a loader module are pickled with their attributes
+    custom = core.Dataset(
+        data_home="a",
+        name="beatles",
+        indexes={"default": "1", "1": core.Index("beatles_index_1.2_sample.json")},
+    )
+    custom._index
+    custom_copy = pickle.loads(pickle.dumps(custom))
+    assert "_index" not in custom_copy.__dict__
+    assert custom_copy.track_ids == custom.track_ids
+
+
+def test_process_pool():
+    data_home = "tests/resources/mir_datasets/beatles"
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+    tracks = dataset.load_tracks().select(["0111", "0111"])
+    expected = [_n_beats(track) for track in tracks.values()]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(_n_beats, tracks.values())) == expected
+
+
+@pytest.mark.parametrize(
+    "workers,backend", [(1, "thread"), (2, "thread"), (2, "process")]
+)
+def test_preload(workers, backend):
+    data_home = "tests/resources/mir_datasets/beatles"
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+    tracks, failures, timings = dataset.preload(
+        properties=["beats", "chords", "audio"],
+        workers=workers,
+        backend=backend,
+        verbose=False,
+    )
+    assert isinstance(tracks, core.TrackCollection)
+    assert list(tracks) == dataset.track_ids
+    track = tracks["0111"]
+    assert "beats" in track.__dict__
+    assert "chords" in track.__dict__
+    assert np.allclose(track.beats.times, dataset.track("0111").beats.times)
+    # this track's files are not in the test resources
+    assert set(failures) == {"10212"}
+    assert set(timings) == {"beats", "chords", "audio"}
+    assert all(t >= 0 for t in timings.values())
+
+
+def test_preload_failures():
+    dataset = mirdata.initialize("beatles", version="test")
+    tracks, failures, _ = dataset.preload(
+        track_ids=["0111"], properties=["beats"], verbose=False
+    )
+    # the test index points to files which are not in the default data_home
+    assert list(tracks) == ["0111"]
+    assert set(failures) == {"0111"}
+    assert set(failures["0111"]) == {"beats"}
+    assert "beats" not in tracks["0111"].__dict__
+
+    # all cached properties by default
+    _, _, timings = dataset.preload(track_ids=["0111"], verbose=False)
+    assert set(timings) == {"beats", "chords", "key", "sections"}
+
+    with pytest.raises(ValueError):
+        dataset.preload(properties=["not_a_property"])
+    with pytest.raises(ValueError):
+        dataset.preload(backend="not_a_backend")
+    with pytest.raises(KeyError):
+        dataset.preload(track_ids=["not_a_track"])
+
+
+def test_audio_info(tmpdir, mocker):
+    data_home = str(tmpdir.join("beatles"))
+    shutil.copytree("tests/resources/mir_datasets/beatles", data_home)
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+
+    # one track of the test index has no audio file, and is left out
+    info = dataset.audio_info(workers=2, verbose=False)
+    assert info.tolist() == [("0111", 88200, 44100, 1, "WAV")]
+    assert info["frames"][0] / info["sr"][0] == 2.0
+    assert os.path.exists(os.path.join(data_home, core.AUDIO_INFO_FILENAME))
+
+    # later calls only read the headers of files which changed
+    read_audio_info = mocker.spy(io, "read_audio_info")
+    assert dataset.audio_info(verbose=False).tolist() == info.tolist()
+    assert read_audio_info.call_count == 0
+    dataset.audio_info(force=True, verbose=False)
+    assert read_audio_info.call_count == 1
+    os.utime(dataset.track("0111").audio_path, ns=(0, 0))
+    dataset.audio_info(verbose=False)
+    assert read_audio_info.call_count == 2
+
+    with pytest.raises(ValueError):
+        dataset.audio_info(key="not_a_key")
+
+
+def test_audio_cache():
+    cache = core.AudioCache(max_bytes=100)
+    assert cache.get("a", lambda: (np.zeros(5), 1)) is not None
+    assert cache.stats()["misses"] == 1
+    audio, _ = cache.get("a", lambda: None)
+    assert cache.hits == 1
+    assert not audio.flags.writeable
+
+    # least recently used entries are evicted to stay within the budget
+    cache.get("b", lambda: (np.zeros(5), 1))
+    cache.get("a", lambda: None)
+    cache.get("c", lambda: (np.zeros(5), 1))
+    assert cache.evictions == 1
+    assert cache.nbytes == 80
+    assert cache.get("b", lambda: None) is None
+
+    # audio larger than the budget is not stored
+    big = np.zeros(20)
+    assert cache.get("d", lambda: (big, 1))[0] is big
+    assert big.flags.writeable
+    assert len(cache) == 2
+
+    cache.resize(40)
+    assert len(cache) == 1 and cache.nbytes == 40
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+    # a budget of 0 disables the cache
+    cache.resize(0)
+    assert cache.get("a", lambda: "decoded") == "decoded"
+    assert len(cache) == 0
+
+
+def test_audio_property(mocker):
+    data_home = "tests/resources/mir_datasets/beatles"
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+    assert isinstance(type(dataset.track("0111")).audio, core.audio_property)
+    assert isinstance(type(dataset.track("0111")).audio, property)
+
+    # no key is computed while the cache is disabled
+    load_audio = mocker.spy(mirdata.datasets.beatles, "load_audio")
+    audio_key = mocker.spy(core, "_audio_key")
+    dataset.track("0111").audio
+    dataset.track("0111").audio
+    assert load_audio.call_count == 2
+    assert audio_key.call_count == 0
+
+    core.audio_cache.resize(10 * 1024**2)
+    try:
+        audio, sr = dataset.track("0111").audio
+        cached_audio, cached_sr = dataset.track("0111").audio
+        assert load_audio.call_count == 3
+        assert cached_audio is audio and cached_sr == sr
+        assert core.audio_cache.hits == 1
+
+        # other data_homes are cached separately
+        other = mirdata.initialize("beatles", data_home="other", version="test")
+        with pytest.raises(FileNotFoundError):
+            other.track("0111").audio
+    finally:
+        core.audio_cache.resize(0)
+        core.audio_cache.clear()
+
+
+def test_load_audio_segment():
+    data_home = "tests/resources/mir_datasets/beatles"
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+    track = dataset.track("0111")
+    audio, sr = track.audio
+    segment, segment_sr = track.load_audio_segment("audio", offset=1.0, duration=0.5)
+    assert segment_sr == sr
+    assert np.allclose(segment, audio[int(sr) : int(sr) + int(0.5 * sr)])
+    segment_int16, _ = track.load_audio_segment(
+        "audio", offset=1.0, duration=0.5, dtype="int16"
+    )
+    assert segment_int16.dtype == np.int16
+
+    index = {"tracks": {"a": {"audio": (None, None)}}}
+    track = core.Track("a", data_home, "test", index, lambda: None)
+    assert track.load_audio_segment("audio", offset=1.0) is None
+
+
+def test_load_audio_memmap():
+    data_home = "tests/resources/mir_datasets/beatles"
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+    track = dataset.track("0111")
+    audio, sr = track.audio
+    mapped, mapped_sr = track.load_audio_memmap("audio", offset=1.0, duration=0.5)
+    assert mapped_sr == sr
+    assert isinstance(mapped, np.memmap) and mapped.dtype == np.int16
+    assert np.allclose(mapped / 32768.0, audio[int(sr) : int(sr) + int(0.5 * sr)])
+
+    index = {"tracks": {"a": {"audio": (None, None)}}}
+    track = core.Track("a", data_home, "test", index, lambda: None)
+    assert track.load_audio_memmap("audio") is None
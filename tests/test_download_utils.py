@@ -1,13 +1,18 @@
 from logging import fatal
+import io
+import json
 import os
 from pathlib import Path
 import shutil
+import tarfile
 import zipfile
 import re
+import threading
 
 from mirdata import download_utils, core
 
 import pytest
+from pytest_localserver.http import WSGIServer
 
 
 @pytest.fixture
@@ -56,12 +61,16 @@ def test_downloader(mocker, mock_path):
 
     # Zip only
     download_utils.downloader("a", index=index, remotes={"b": zip_remote})
-    mock_zip.assert_called_once_with(zip_remote, "a", False, False, False)
+    mock_zip.assert_called_once_with(
+        zip_remote, "a", False, False, False, member_filter=None, workers=1
+    )
     mocker.resetall()
 
     # tar only
     download_utils.downloader("a", index=index, remotes={"b": tar_remote})
-    mock_tar.assert_called_once_with(tar_remote, "a", False, False, False)
+    mock_tar.assert_called_once_with(
+        tar_remote, "a", False, False, False, member_filter=None
+    )
     mocker.resetall()
 
     # file only
@@ -73,15 +82,21 @@ def test_downloader(mocker, mock_path):
     download_utils.downloader(
         "a", index=index, remotes={"b": zip_remote, "c": tar_remote}
     )
-    mock_zip.assert_called_once_with(zip_remote, "a", False, False, False)
-    mock_tar.assert_called_once_with(tar_remote, "a", False, False, False)
+    mock_zip.assert_called_once_with(
+        zip_remote, "a", False, False, False, member_filter=None, workers=1
+    )
+    mock_tar.assert_called_once_with(
+        tar_remote, "a", False, False, False, member_filter=None
+    )
     mocker.resetall()
 
     # zip and file
     download_utils.downloader(
         "a", index=index, remotes={"b": zip_remote, "c": file_remote}
     )
-    mock_zip.assert_called_once_with(zip_remote, "a", False, False, False)
+    mock_zip.assert_called_once_with(
+        zip_remote, "a", False, False, False, member_filter=None, workers=1
+    )
     mock_download_from_remote.assert_called_once_with(file_remote, "a", False, False)
     mocker.resetall()
 
@@ -89,7 +104,9 @@ def test_downloader(mocker, mock_path):
     download_utils.downloader(
         "a", index=index, remotes={"b": tar_remote, "c": file_remote}
     )
-    mock_tar.assert_called_once_with(tar_remote, "a", False, False, False)
+    mock_tar.assert_called_once_with(
+        tar_remote, "a", False, False, False, member_filter=None
+    )
     mock_download_from_remote.assert_called_once_with(file_remote, "a", False, False)
     mocker.resetall()
 
@@ -97,9 +114,13 @@ def test_downloader(mocker, mock_path):
     download_utils.downloader(
         "a", index=index, remotes={"b": zip_remote, "c": tar_remote, "d": file_remote}
     )
-    mock_zip.assert_called_once_with(zip_remote, "a", False, False, False)
+    mock_zip.assert_called_once_with(
+        zip_remote, "a", False, False, False, member_filter=None, workers=1
+    )
     mock_download_from_remote.assert_called_once_with(file_remote, "a", False, False)
-    mock_tar.assert_called_once_with(tar_remote, "a", False, False, False)
+    mock_tar.assert_called_once_with(
+        tar_remote, "a", False, False, False, member_filter=None
+    )
     mocker.resetall()
 
     # test partial download
@@ -109,7 +130,9 @@ def test_downloader(mocker, mock_path):
         remotes={"b": zip_remote, "c": tar_remote, "d": file_remote},
         partial_download=["b", "d"],
     )
-    mock_zip.assert_called_once_with(zip_remote, "a", False, False, False)
+    mock_zip.assert_called_once_with(
+        zip_remote, "a", False, False, False, member_filter=None, workers=1
+    )
     mock_download_from_remote.assert_called_once_with(file_remote, "a", False, False)
     mocker.resetall()
 
@@ -183,7 +206,9 @@ def test_download_index_cases(mocker, mock_path):
         remotes={"b": zip_remote, "d": file_remote},
         partial_download=None,
     )
-    mock_zip.assert_called_once_with(zip_remote, "a", False, False, False)
+    mock_zip.assert_called_once_with(
+        zip_remote, "a", False, False, False, member_filter=None, workers=1
+    )
     mock_download_from_remote.assert_not_called()
     mocker.resetall()
 
@@ -212,7 +237,9 @@ def test_download_index_cases(mocker, mock_path):
     download_utils.downloader(
         "a", index=remote_index, remotes={"b": zip_remote}, partial_download=None
     )
-    mock_zip.assert_called_once_with(zip_remote, "a", False, False, False)
+    mock_zip.assert_called_once_with(
+        zip_remote, "a", False, False, False, member_filter=None, workers=1
+    )
     mock_download_from_remote.assert_called_once_with(
         remote_index.remote, "a", False, False
     )
@@ -420,6 +447,7 @@ def test_download_from_remote(httpserver, tmpdir):
     download_path = download_utils.download_from_remote(
         TEST_REMOTE, str(tmpdir), False, False
     )
+    assert download_path == os.path.join(str(tmpdir), "remote.wav")
 
 
 def test_download_from_remote_destdir(httpserver, tmpdir):
@@ -469,7 +497,9 @@ def test_download_zip_file(mocker, mock_download_from_remote, mock_unzip):
     download_utils.download_zip_file("a", "b", False, False, False)
 
     mock_download_from_remote.assert_called_once_with("a", "b", False, False)
-    mock_unzip.assert_called_once_with("foo", cleanup=False)
+    mock_unzip.assert_called_once_with(
+        "foo", cleanup=False, workers=1, member_filter=None
+    )
     _clean("a")
 
 
@@ -480,7 +510,9 @@ def test_download_zip_file_ignorechecksum(
     download_utils.download_zip_file("a", "b", False, False, True)
 
     mock_download_from_remote.assert_called_once_with("a", "b", False, True)
-    mock_unzip.assert_called_once_with("foo", cleanup=False)
+    mock_unzip.assert_called_once_with(
+        "foo", cleanup=False, workers=1, member_filter=None
+    )
     _clean("a")
 
 
@@ -489,7 +521,7 @@ def test_download_tar_file(mocker, mock_download_from_remote, mock_untar):
     download_utils.download_tar_file("a", "b", False, False, False)
 
     mock_download_from_remote.assert_called_once_with("a", "b", False, False)
-    mock_untar.assert_called_once_with("foo", cleanup=False)
+    mock_untar.assert_called_once_with("foo", cleanup=False, member_filter=None)
     _clean("a")
 
 
@@ -500,7 +532,7 @@ def test_download_tar_file_ignorechecksum(
     download_utils.download_tar_file("a", "b", False, False, True)
 
     mock_download_from_remote.assert_called_once_with("a", "b", False, True)
-    mock_untar.assert_called_once_with("foo", cleanup=False)
+    mock_untar.assert_called_once_with("foo", cleanup=False, member_filter=None)
     _clean("a")
 
 
@@ -592,3 +624,562 @@ def test_zipped_index_exception_handling(mocker, tmpdir):
 
     # Should not raise exception, just log warning
     download_utils.downloader(str(tmpdir), index=index, remotes={"index": index_remote})
+
+
+class FileServer(WSGIServer):
+    """Threaded local HTTP server serving the bytes in `files` by path.
+
+    Range requests are supported if `ranges` is True, and unsatisfiable ranges
+    are answered with the file's size if `range_size_on_416` is True. If
+    `wrong_ranges` is True, range requests are answered from half the
+    requested offset. If `drop_after` is set, the next response is cut after that many
+    bytes.
+
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.on_request = None
+        self.ranges = True
+        self.range_size_on_416 = True
+        self.wrong_ranges = False
+        self.drop_after = None
+        self.requests = []
+        super().__init__(application=self._app, threaded=True)
+
+    def _app(self, environ, start_response):
+        self.requests.append(environ.get("HTTP_RANGE"))
+        if self.on_request is not None:
+            self.on_request(environ)
+        path = environ["PATH_INFO"]
+        if path not in self.files:
+            start_response("404 Not Found", [("Content-Length", "0")])
+            return [b""]
+        data = self.files[path]
+
+        byte_range = environ.get("HTTP_RANGE")
+        if self.ranges and byte_range is not None:
+            start = int(byte_range[len("bytes=") :].split("-")[0])
+            if self.wrong_ranges:
+                start //= 2
+            if start >= len(data):
+                headers = [("Content-Length", "0")]
+                if self.range_size_on_416:
+                    headers.append(("Content-Range", "bytes */{}".format(len(data))))
+                start_response("416 Range Not Satisfiable", headers)
+                return [b""]
+            headers = [
+                ("Content-Length", str(len(data) - start)),
+                (
+                    "Content-Range",
+                    "bytes {}-{}/{}".format(start, len(data) - 1, len(data)),
+                ),
+            ]
+            start_response("206 Partial Content", headers)
+            data = data[start:]
+        else:
+            start_response("200 OK", [("Content-Length", str(len(data)))])
+
+        if self.drop_after is not None:
+            drop_after, self.drop_after = self.drop_after, None
+            return self._drop(data, drop_after)
+        return [data]
+
+    @staticmethod
+    def _drop(data, drop_after):
+        yield data[:drop_after]
+        raise ConnectionAbortedError("dropping the connection")
+
+
+@pytest.fixture
+def file_server():
+    server = FileServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_downloader_concurrent(file_server, tmpdir):
+    index = core.Index("asdf.json")
+    remotes = {}
+    for name in ["remote.zip", "remote.tar.gz", "remote.wav"]:
+        with open(os.path.join("tests/resources", name), "rb") as fhandle:
+            file_server.files["/" + name] = fhandle.read()
+    remotes["zip"] = download_utils.RemoteFileMetadata(
+        filename="remote.zip",
+        url=file_server.url + "/remote.zip",
+        checksum="7a31ccfa28bfa3fb112d16c96e9d9a89",
+        destination_dir="zip",
+    )
+    remotes["tar"] = download_utils.RemoteFileMetadata(
+        filename="remote.tar.gz",
+        url=file_server.url + "/remote.tar.gz",
+        checksum="9042f5eebdcd0b94aa7a3c9bf12dc51d",
+        destination_dir="tar",
+    )
+    remotes["wav"] = download_utils.RemoteFileMetadata(
+        filename="remote.wav",
+        url=file_server.url + "/remote.wav",
+        checksum="3f77d0d69dc41b3696f074ad6bf2852f",
+    )
+
+    # every request waits for the others: this only passes if all three
+    # downloads are in flight at the same time
+    barrier = threading.Barrier(3, timeout=10)
+    file_server.on_request = lambda environ: barrier.wait()
+
+    save_dir = str(tmpdir)
+    download_utils.downloader(
+        save_dir, index=index, remotes=dict(remotes), max_workers=3, cleanup=True
+    )
+    assert os.path.exists(os.path.join(save_dir, "zip", "remote.wav"))
+    assert not os.path.exists(os.path.join(save_dir, "zip", "remote.zip"))
+    assert os.path.exists(os.path.join(save_dir, "tar", "remote.wav"))
+    assert not os.path.exists(os.path.join(save_dir, "tar", "remote.tar.gz"))
+    assert os.path.exists(os.path.join(save_dir, "remote.wav"))
+
+    # errors are raised in the calling thread
+    file_server.on_request = None
+    remotes["wav"].checksum = "wrongchecksum"
+    with pytest.raises(IOError):
+        download_utils.downloader(
+            str(tmpdir.join("error")),
+            index=index,
+            remotes=dict(remotes),
+            max_workers=2,
+        )
+
+
+def test_downloader_concurrent_progress_bars(file_server, tmpdir, mocker):
+    with open("tests/resources/remote.wav", "rb") as fhandle:
+        data = fhandle.read()
+    remotes = {}
+    for i in range(4):
+        file_server.files["/{}.wav".format(i)] = data
+        remotes[str(i)] = download_utils.RemoteFileMetadata(
+            filename="{}.wav".format(i),
+            url="{}/{}.wav".format(file_server.url, i),
+            checksum="3f77d0d69dc41b3696f074ad6bf2852f",
+        )
+
+    bars = []
+
+    class RecordingProgressBar(download_utils.DownloadProgressBar):
+        def __init__(self, *args, **kwargs):
+            bars.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+    mocker.patch.object(download_utils, "DownloadProgressBar", RecordingProgressBar)
+    barrier = threading.Barrier(2, timeout=10)
+    file_server.on_request = lambda environ: barrier.wait()
+    download_utils.downloader(
+        str(tmpdir), index=core.Index("asdf.json"), remotes=remotes, max_workers=2
+    )
+
+    # concurrent bars stay on their worker's line, and are removed when done
+    assert len(bars) == 4
+    assert sorted(bar["position"] for bar in bars) == [0, 0, 1, 1]
+    assert not any(bar["leave"] for bar in bars)
+
+    file_server.on_request = None
+    download_utils.download_from_remote(
+        remotes["0"], str(tmpdir.join("serial")), False, False
+    )
+    assert bars[-1]["position"] is None and bars[-1]["leave"]
+
+
+@pytest.mark.parametrize("n_remotes", [1, 2])
+def test_downloader_unzip_workers(tmpdir, mocker, n_remotes):
+    mocker.patch.object(
+        download_utils, "download_from_remote", return_value="remote.zip"
+    )
+    mock_unzip = mocker.patch.object(download_utils, "unzip")
+    remotes = {
+        str(i): download_utils.RemoteFileMetadata(
+            filename="remote.zip", url="a", checksum="b"
+        )
+        for i in range(n_remotes)
+    }
+    download_utils.downloader(
+        str(tmpdir), index=core.Index("asdf.json"), remotes=remotes, max_workers=3
+    )
+    assert mock_unzip.call_count == n_remotes
+    assert all(call.kwargs["workers"] == 3 for call in mock_unzip.call_args_list)
+
+
+def test_dataset_download_max_workers(mocker):
+    mock_downloader = mocker.patch.object(download_utils, "downloader")
+    dataset = core.Dataset(
+        data_home="a", name="beatles", indexes={"default": "1", "1": core.Index("a")}
+    )
+    dataset.download(max_workers=4)
+    assert mock_downloader.call_args.kwargs["max_workers"] == 4
+
+
+def _wav_remote(file_server):
+    with open("tests/resources/remote.wav", "rb") as fhandle:
+        file_server.files["/remote.wav"] = fhandle.read()
+    return download_utils.RemoteFileMetadata(
+        filename="remote.wav",
+        url=file_server.url + "/remote.wav",
+        checksum="3f77d0d69dc41b3696f074ad6bf2852f",
+    )
+
+
+def test_download_from_remote_resume(file_server, tmpdir):
+    remote = _wav_remote(file_server)
+    save_dir = str(tmpdir)
+    download_path = os.path.join(save_dir, "remote.wav")
+    part_path = download_path + download_utils.PART_SUFFIX
+
+    # an interrupted download leaves a partial file, and no final file
+    file_server.drop_after = 40
+    with pytest.raises(Exception):
+        download_utils.download_from_remote(remote, save_dir, False, False)
+    assert os.path.getsize(part_path) == 40
+    assert not os.path.exists(download_path)
+
+    # the next attempt only requests the missing bytes
+    assert download_path == download_utils.download_from_remote(
+        remote, save_dir, False, False
+    )
+    assert file_server.requests[-1] == "bytes=40-"
+    assert not os.path.exists(part_path)
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == file_server.files["/remote.wav"]
+
+
+def test_download_from_remote_no_ranges(file_server, tmpdir):
+    remote = _wav_remote(file_server)
+    save_dir = str(tmpdir)
+    download_path = os.path.join(save_dir, "remote.wav")
+    part_path = download_path + download_utils.PART_SUFFIX
+
+    # servers without range support send the whole file again
+    file_server.ranges = False
+    with open(part_path, "wb") as fhandle:
+        fhandle.write(b"garbage")
+    download_utils.download_from_remote(remote, save_dir, False, False)
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == file_server.files["/remote.wav"]
+
+    # partial files longer than the remote file are discarded
+    os.remove(download_path)
+    file_server.ranges = True
+    with open(part_path, "wb") as fhandle:
+        fhandle.write(b"0" * 1000)
+    download_utils.download_from_remote(remote, save_dir, False, False)
+    assert file_server.requests[-2:] == ["bytes=1000-", None]
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == file_server.files["/remote.wav"]
+
+
+def test_download_from_remote_wrong_range(file_server, tmpdir):
+    remote = _wav_remote(file_server)
+    save_dir = str(tmpdir)
+    download_path = os.path.join(save_dir, "remote.wav")
+    part_path = download_path + download_utils.PART_SUFFIX
+
+    # a partial response for another range is not appended to the partial
+    # file: the file is requested again, without a range
+    file_server.wrong_ranges = True
+    with open(part_path, "wb") as fhandle:
+        fhandle.write(file_server.files["/remote.wav"][:40])
+    download_utils.download_from_remote(remote, save_dir, False, False)
+    assert file_server.requests[-2:] == ["bytes=40-", None]
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == file_server.files["/remote.wav"]
+
+
+def test_download_from_remote_complete_part_file(file_server, tmpdir):
+    remote = _wav_remote(file_server)
+    save_dir = str(tmpdir)
+    download_path = os.path.join(save_dir, "remote.wav")
+    part_path = download_path + download_utils.PART_SUFFIX
+
+    # a partial file interrupted after its last byte is promoted, not
+    # downloaded again, whether the 416 response gives the size or not
+    for range_size_on_416 in [True, False]:
+        file_server.range_size_on_416 = range_size_on_416
+        with open(part_path, "wb") as fhandle:
+            fhandle.write(file_server.files["/remote.wav"])
+        download_utils.download_from_remote(remote, save_dir, False, False)
+        assert file_server.requests[-1] == "bytes={}-".format(
+            len(file_server.files["/remote.wav"])
+        )
+        with open(download_path, "rb") as fhandle:
+            assert fhandle.read() == file_server.files["/remote.wav"]
+        os.remove(download_path)
+
+
+def test_download_from_remote_checksum_before_promote(file_server, tmpdir):
+    remote = _wav_remote(file_server)
+    remote.checksum = "wrongchecksum"
+    save_dir = str(tmpdir)
+    download_path = os.path.join(save_dir, "remote.wav")
+
+    # invalid downloads are neither promoted nor kept for resuming
+    with pytest.raises(IOError):
+        download_utils.download_from_remote(remote, save_dir, False, False)
+    assert not os.path.exists(download_path)
+    assert os.listdir(save_dir) == []
+
+    with pytest.warns(UserWarning):
+        download_utils.download_from_remote(remote, save_dir, False, True)
+    assert os.path.exists(download_path)
+    assert os.listdir(save_dir) == ["remote.wav"]
+
+
+def test_download_from_remote_hashes_while_downloading(file_server, tmpdir, mocker):
+    remote = _wav_remote(file_server)
+    md5 = mocker.spy(download_utils, "md5")
+    download_utils.download_from_remote(remote, str(tmpdir), False, False)
+    assert md5.call_count == 0
+
+    # a resumed download's checksum covers the bytes downloaded before
+    part_path = os.path.join(str(tmpdir), "resumed.wav" + download_utils.PART_SUFFIX)
+    with open(part_path, "wb") as fhandle:
+        fhandle.write(file_server.files["/remote.wav"][:40])
+    checksum = download_utils.download_to_part_file(remote.url, part_path)
+    assert checksum == remote.checksum
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_extractall_unicode_streams(tmpdir, mocker, workers):
+    zip_path = str(tmpdir.join("archive.zip"))
+    members = {
+        "archive/a.wav": os.urandom(3 * download_utils.EXTRACT_CHUNK_SIZE + 17),
+        "archive/sub/b.txt": b"b" * 100,
+        "archive/sub/c.gz": b"not actually gzipped",
+        "archive/empty.txt": b"",
+    }
+    with zipfile.ZipFile(zip_path, "w") as zfile:
+        zfile.writestr("archive/sub/", b"")
+        for name, data in members.items():
+            zfile.writestr(name, data)
+
+    read = mocker.spy(zipfile.ZipFile, "read")
+    out_dir = str(tmpdir.join("out"))
+    with zipfile.ZipFile(zip_path, "r") as zfile:
+        download_utils.extractall_unicode(zfile, out_dir, workers=workers)
+
+    # members are streamed, never read into memory as a whole
+    assert read.call_count == 0
+    for name, data in members.items():
+        with open(os.path.join(out_dir, name), "rb") as fhandle:
+            assert fhandle.read() == data
+
+
+def test_stream_tar_file(file_server, tmpdir, mocker):
+    with open("tests/resources/remote.tar.gz", "rb") as fhandle:
+        file_server.files["/remote.tar.gz"] = fhandle.read()
+    remote = download_utils.RemoteFileMetadata(
+        filename="remote.tar.gz",
+        url=file_server.url + "/remote.tar.gz",
+        checksum="9042f5eebdcd0b94aa7a3c9bf12dc51d",
+        destination_dir="tar",
+    )
+    md5 = mocker.spy(download_utils, "md5")
+
+    save_dir = str(tmpdir.join("ok"))
+    download_dir = download_utils.stream_tar_file(remote, save_dir, False)
+    assert download_dir == os.path.join(save_dir, "tar")
+    assert os.listdir(download_dir) == ["remote.wav"]
+    # the checksum is computed while extracting, the archive is never stored
+    assert md5.call_count == 0
+
+    # an invalid checksum leaves nothing behind
+    remote.checksum = "wrongchecksum"
+    save_dir = str(tmpdir.join("invalid"))
+    with pytest.raises(IOError):
+        download_utils.stream_tar_file(remote, save_dir, False)
+    assert os.listdir(os.path.join(save_dir, "tar")) == []
+
+    # unless invalid checksums are allowed
+    download_utils.stream_tar_file(remote, save_dir, True)
+    assert os.listdir(os.path.join(save_dir, "tar")) == ["remote.wav"]
+
+    # a dropped connection leaves nothing behind
+    file_server.drop_after = 100
+    save_dir = str(tmpdir.join("dropped"))
+    with pytest.raises(Exception):
+        download_utils.stream_tar_file(remote, save_dir, True)
+    assert os.listdir(os.path.join(save_dir, "tar")) == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_downloader_stream(file_server, tmpdir, mocker, max_workers):
+    for name in ["remote.tar.gz", "remote.zip"]:
+        with open(os.path.join("tests/resources", name), "rb") as fhandle:
+            file_server.files["/" + name] = fhandle.read()
+    remotes = {
+        "tar": download_utils.RemoteFileMetadata(
+            filename="remote.tar.gz",
+            url=file_server.url + "/remote.tar.gz",
+            checksum="9042f5eebdcd0b94aa7a3c9bf12dc51d",
+            destination_dir="tar",
+        ),
+        "zip": download_utils.RemoteFileMetadata(
+            filename="remote.zip",
+            url=file_server.url + "/remote.zip",
+            checksum="7a31ccfa28bfa3fb112d16c96e9d9a89",
+            destination_dir="zip",
+        ),
+    }
+    download_tar_file = mocker.spy(download_utils, "download_tar_file")
+    save_dir = str(tmpdir)
+    download_utils.downloader(
+        save_dir,
+        index=core.Index("asdf.json"),
+        remotes=remotes,
+        max_workers=max_workers,
+        cleanup=True,
+        stream=True,
+    )
+    assert download_tar_file.call_count == 0
+    assert os.listdir(os.path.join(save_dir, "tar")) == ["remote.wav"]
+    # zip archives can't be streamed and are downloaded as usual
+    assert os.listdir(os.path.join(save_dir, "zip")) == ["remote.wav"]
+
+
+def test_index_file_paths():
+    index = {
+        "version": "1.0",
+        "metadata": {"meta": ["meta/data.csv", "abc"], "none": [None, None]},
+        "tracks": {
+            "t1": {"audio": ["audio/t1.wav", "abc", 10], "notes": [None, None]},
+            "t2": {"audio": ["audio/t2.wav", "abc"]},
+            "t3": {"audio": ["./audio/t3.wav", "abc"]},
+        },
+        "multitracks": {
+            "m1": {"tracks": ["t1", "t2"], "mix": ["mix/m1.wav", "abc"]},
+        },
+    }
+    assert download_utils.index_file_paths(index) == {
+        "meta/data.csv",
+        "audio/t1.wav",
+        "audio/t2.wav",
+        "audio/t3.wav",
+        "mix/m1.wav",
+    }
+    assert download_utils.index_file_paths(index, ["t3"]) == {
+        "meta/data.csv",
+        "audio/t3.wav",
+    }
+    assert download_utils.index_file_paths(index, ["m1"]) == {
+        "meta/data.csv",
+        "audio/t1.wav",
+        "audio/t2.wav",
+        "mix/m1.wav",
+    }
+    with pytest.raises(ValueError):
+        download_utils.index_file_paths(index, ["t1", "nope"])
+
+
+def test_member_filter():
+    extract_paths = {"data/audio/a.wav", "data/meta.csv"}
+    remote = download_utils.RemoteFileMetadata(
+        filename="a.zip",
+        url="a",
+        checksum="b",
+        destination_dir="data",
+        unpack_directories=["archive-1.0"],
+    )
+    assert download_utils._member_filter("index", remote, extract_paths) is None
+    assert download_utils._member_filter("all", remote, None) is None
+
+    keep = download_utils._member_filter("all", remote, extract_paths)
+    assert keep("archive-1.0/audio/a.wav")
+    assert keep("archive-1.0/meta.csv")
+    assert keep("audio/a.wav")
+    # parent directories of needed files are kept
+    assert keep("archive-1.0/")
+    assert keep("archive-1.0/audio/")
+    assert not keep("archive-1.0/audio/b.wav")
+    assert not keep("archive-1.0/other/")
+    assert not keep("archive-1.0.wav")
+
+    remote.destination_dir = None
+    remote.unpack_directories = None
+    keep = download_utils._member_filter("all", remote, extract_paths)
+    assert keep("data/audio/a.wav")
+    assert not keep("audio/a.wav")
+
+
+@pytest.mark.parametrize("extension", [".zip", ".tar.gz"])
+def test_unpack_filtered(tmpdir, extension):
+    archive_path = str(tmpdir.join("archive" + extension))
+    members = ["archive/audio/a.wav", "archive/audio/b.wav", "archive/c.txt"]
+    if extension == ".zip":
+        with zipfile.ZipFile(archive_path, "w") as zfile:
+            for name in members:
+                zfile.writestr(name, name)
+    else:
+        with tarfile.open(archive_path, "w:gz") as tfile:
+            for name in members:
+                info = tarfile.TarInfo(name)
+                info.size = len(name)
+                tfile.addfile(info, io.BytesIO(name.encode()))
+
+    def keep(name):
+        return name in ["archive/audio/a.wav", "archive/c.txt"]
+
+    if extension == ".zip":
+        download_utils.unzip(archive_path, cleanup=False, member_filter=keep)
+    else:
+        download_utils.untar(archive_path, cleanup=False, member_filter=keep)
+    assert os.path.exists(str(tmpdir.join("archive", "audio", "a.wav")))
+    assert os.path.exists(str(tmpdir.join("archive", "c.txt")))
+    assert not os.path.exists(str(tmpdir.join("archive", "audio", "b.wav")))
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_dataset_download_track_ids(file_server, tmpdir, stream):
+    tar_path = str(tmpdir.join("remote.tar.gz"))
+    with tarfile.open(tar_path, "w:gz") as tfile:
+        for name in ["data-1.0/t1.wav", "data-1.0/t2.wav", "data-1.0/meta.csv"]:
+            info = tarfile.TarInfo(name)
+            info.size = len(name)
+            tfile.addfile(info, io.BytesIO(name.encode()))
+    with open(tar_path, "rb") as fhandle:
+        file_server.files["/remote.tar.gz"] = fhandle.read()
+
+    index_path = str(tmpdir.join("index.json"))
+    with open(index_path, "w") as fhandle:
+        json.dump(
+            {
+                "version": "1.0",
+                "metadata": {"meta": ["audio/meta.csv", "abc"]},
+                "tracks": {
+                    "t1": {"audio": ["audio/t1.wav", "abc"]},
+                    "t2": {"audio": ["audio/t2.wav", "abc"]},
+                },
+            },
+            fhandle,
+        )
+
+    data_home = str(tmpdir.join("data_home"))
+    dataset = core.Dataset(
+        data_home=data_home,
+        name="test_dataset",
+        indexes={"default": "1.0", "1.0": core.Index("index.json")},
+        remotes={
+            "all": download_utils.RemoteFileMetadata(
+                filename="remote.tar.gz",
+                url=file_server.url + "/remote.tar.gz",
+                checksum=download_utils.md5(tar_path),
+                destination_dir="audio",
+                unpack_directories=["data-1.0"],
+            )
+        },
+    )
+    dataset.index_path = index_path
+
+    dataset.download(track_ids=["t2"], stream=stream, cleanup=True)
+    assert sorted(os.listdir(os.path.join(data_home, "audio"))) == [
+        "meta.csv",
+        "t2.wav",
+    ]
+
+    with pytest.raises(ValueError):
+        dataset.download(track_ids=["t3"])
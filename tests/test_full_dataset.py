@@ -3,6 +3,7 @@ This test takes a long time, but it makes sure that the datset can be locally do
 validated successfully, and loaded.
 """
 
+from collections.abc import Mapping
 import os
 import pytest
 import tqdm
@@ -60,7 +61,7 @@ def test_load_tracks(skip_remote, dataset):
     # run load
     all_data = dataset.load_tracks()
 
-    assert isinstance(all_data, dict)
+    assert isinstance(all_data, Mapping)
 
     track_ids = dataset.track_ids
     assert set(track_ids) == set(all_data.keys())
@@ -87,7 +88,7 @@ def test_load_mtracks(skip_remote, dataset):
     # run load
     all_data = dataset.load_multitracks()
 
-    assert isinstance(all_data, dict)
+    assert isinstance(all_data, Mapping)
 
     mtrack_ids = dataset.mtrack_ids
     assert set(mtrack_ids) == set(all_data.keys())
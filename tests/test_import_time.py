@@ -0,0 +1,129 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import mirdata
+
+# dependencies which must only be imported when a loader needs them
+HEAVY_MODULES = [
+    "librosa",
+    "scipy",
+    "soundfile",
+    "jams",
+    "pretty_midi",
+    "music21",
+    "moviepy",
+    "h5py",
+    "pandas",
+    "yaml",
+    "smart_open",
+    "DALI",
+    "openpyxl",
+]
+
+# generous budgets (in seconds), only checked with --import-times since wall
+# clock times are unreliable on shared machines
+MODULE_BUDGET = 0.5
+TOTAL_BUDGET = 2.0
+
+# __import__ (unlike importlib.import_module) is reported by -X importtime
+IMPORT_ALL = """
+import json, sys
+for name in {datasets}:
+    __import__("mirdata.datasets." + name)
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _import_datasets(datasets):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            IMPORT_ALL.format(datasets=datasets),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # lines look like "import time:      self [us] | cumulative | imported package"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, package = line[len("import time:") :].split("|")
+        cumulative[package.strip()] = int(cumulative_us) / 1e6
+
+    return json.loads(result.stdout), cumulative
+
+
+# run in a new interpreter: other tests import the heavy modules
+INITIALIZE_ALL = """
+import json, sys
+import mirdata
+for name in mirdata.DATASETS:
+    mirdata.initialize(name, version="test")
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _imported_heavy_modules(modules):
+    return [m for m in HEAVY_MODULES if any(k.split(".")[0] == m for k in modules)]
+
+
+def test_dataset_imports_are_lazy():
+    modules, _ = _import_datasets(mirdata.DATASETS)
+    imported_heavy = _imported_heavy_modules(modules)
+    assert imported_heavy == [], "importing mirdata.datasets imported {}".format(
+        imported_heavy
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", INITIALIZE_ALL],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_heavy = _imported_heavy_modules(json.loads(result.stdout))
+    assert imported_heavy == [], "initializing the datasets imported {}".format(
+        imported_heavy
+    )
+
+
+def test_dataset_import_times(check_import_times):
+    _, cumulative = _import_datasets(mirdata.DATASETS)
+    for name in mirdata.DATASETS:
+        module = "mirdata.datasets.{}".format(name)
+        assert cumulative[module] < MODULE_BUDGET, "importing {} took {:.2f}s".format(
+            module, cumulative[module]
+        )
+    assert (
+        cumulative["mirdata"]
+        + sum(
+            cumulative["mirdata.datasets.{}".format(name)] for name in mirdata.DATASETS
+        )
+        < TOTAL_BUDGET
+    )
+
+
+def test_lazy_import():
+    from mirdata import lazy
+
+    module = lazy.lazy_import("json")
+    assert isinstance(module, lazy.LazyModule)
+    assert module.dumps({"a": 1}) == json.dumps({"a": 1})
+    assert "dumps" in module.__dict__
+
+    missing = lazy.lazy_import("not_a_real_module", extra="not_an_extra")
+    assert repr(missing) == "<lazy module 'not_a_real_module'>"
+    try:
+        missing.anything
+    except ImportError:
+        pass
+    else:
+        assert False, "ImportError was not raised"
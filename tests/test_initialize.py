@@ -1,7 +1,11 @@
+import copy
+import subprocess
+import sys
+
 import pytest
 
-from mirdata import core
-from mirdata import initialize, list_datasets
+from mirdata import core, registry
+from mirdata import get_dataset_info, initialize, list_datasets
 
 
 def test_list_datasets():
@@ -19,3 +23,45 @@ def test_initialize():
 
     with pytest.raises(ValueError):
         initialize("asdfasdfasdfa")
+
+
+def test_registry_is_up_to_date():
+    # if this fails, run scripts/make_dataset_registry.py
+    stored = copy.deepcopy(registry.load_registry())
+    built = registry.build_registry()
+    assert list(stored.keys()) == sorted(registry.dataset_module_names())
+    for info in list(stored.values()) + list(built.values()):
+        for remote in (info["remotes"] or {}).values():
+            remote.pop("size")
+    assert stored == built
+
+
+def test_listing_imports_no_loader():
+    code = (
+        "import sys, mirdata\n"
+        "mirdata.list_datasets()\n"
+        "[mirdata.list_dataset_versions(d) for d in mirdata.DATASETS]\n"
+        "[mirdata.get_dataset_info(d) for d in mirdata.DATASETS]\n"
+        "print([m for m in sys.modules if m.startswith('mirdata.datasets.')])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_get_dataset_info():
+    info = get_dataset_info("orchset")
+    assert info["default_version"] == "1.0"
+    assert info["indexes"]["default"] == "1.0"
+    assert info["indexes"]["1.0"]["filename"] == "orchset_index_1.0.json"
+    assert set(info["remotes"].keys()) == {"all"}
+    assert info["remotes"]["all"]["url"].startswith("https://")
+    assert get_dataset_info("cipi")["remotes"] is None
+
+    # callers get a copy of the registry entry
+    info["default_version"] = "not-a-version"
+    assert get_dataset_info("orchset")["default_version"] == "1.0"
+
+    with pytest.raises(ValueError):
+        get_dataset_info("asdfasdfasdfa")
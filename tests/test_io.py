@@ -129,3 +129,145 @@ def test_invalid_coerce_to_bytes_io():
 
     with pytest.raises(ValueError):
         func(123)
+
+
+def test_load_audio(tmpdir, mocker):
+    import librosa
+    import soundfile
+
+    audio_file = str(tmpdir.join("stereo.flac"))
+    signal = np.random.RandomState(0).uniform(-0.5, 0.5, size=(4410, 2))
+    soundfile.write(audio_file, signal, 22050, subtype="PCM_16")
+
+    for kwargs in [
+        {"mono": False},
+        {"mono": True},
+        {"mono": False, "offset": 0.05, "duration": 0.1},
+        {"sr": 8000, "mono": True},
+    ]:
+        expected, expected_sr = librosa.load(audio_file, **kwargs)
+        audio, sr = io.load_audio(audio_file, **kwargs)
+        assert sr == expected_sr
+        assert audio.dtype == np.float32
+        assert np.allclose(audio, expected, atol=1e-6)
+
+    # channels are a view of the decoded (n_samples, n_channels) buffer
+    audio, _ = io.load_audio(audio_file)
+    assert audio.shape == (2, 4410)
+    assert audio.base is not None and audio.base.shape == (4410, 2)
+
+    audio_int16, _ = io.load_audio(audio_file, dtype="int16")
+    assert audio_int16.dtype == np.int16
+    assert np.array_equal(audio_int16, soundfile.read(audio_file, dtype="int16")[0].T)
+    mono_int16, _ = io.load_audio(audio_file, mono=True, dtype="int16")
+    assert mono_int16.dtype == np.int16 and mono_int16.shape == (4410,)
+    resampled, sr = io.load_audio(audio_file, sr=8000, dtype="int16")
+    assert resampled.dtype == np.int16 and sr == 8000
+
+    with pytest.raises(ValueError):
+        io.load_audio(audio_file, dtype="uint8")
+    with pytest.raises(ValueError):
+        io.load_audio(audio_file, offset=-0.1)
+    with pytest.raises(ValueError):
+        io.load_audio(audio_file, duration=-0.1)
+
+    # formats libsndfile can't read are decoded by librosa
+    mocker.patch.object(io, "_read_soundfile", side_effect=soundfile.LibsndfileError(1))
+    with open(audio_file, "rb") as fhandle:
+        fallback, _ = io.load_audio(fhandle, dtype="int16")
+    assert fallback.dtype == np.int16
+    assert np.array_equal(fallback, audio_int16)
+
+
+def test_read_wav_header(tmpdir):
+    import soundfile
+
+    signal = np.random.RandomState(0).uniform(-0.5, 0.5, size=(1000, 3))
+    for audio_format, subtype, dtype in [
+        ("WAV", "PCM_16", "<i2"),
+        ("WAV", "PCM_U8", "u1"),
+        ("WAV", "FLOAT", "<f4"),
+        ("WAVEX", "PCM_32", "<i4"),
+        ("WAVEX", "DOUBLE", "<f8"),
+    ]:
+        path = str(tmpdir.join("{}_{}.wav".format(audio_format, subtype)))
+        soundfile.write(path, signal, 16000, format=audio_format, subtype=subtype)
+        header = io.read_wav_header(path)
+        assert header["sr"] == 16000
+        assert header["channels"] == 3
+        assert header["frames"] == 1000
+        assert header["dtype"] == np.dtype(dtype)
+
+    for audio_format, subtype in [("WAV", "PCM_24"), ("FLAC", "PCM_16")]:
+        path = str(tmpdir.join("unmappable.{}".format(audio_format)))
+        soundfile.write(path, signal, 16000, format=audio_format, subtype=subtype)
+        assert io.read_wav_header(path) is None
+
+
+def test_load_audio_memmap(tmpdir):
+    import soundfile
+
+    path = str(tmpdir.join("stereo.wav"))
+    signal = np.random.RandomState(0).uniform(-0.5, 0.5, size=(4410, 2))
+    soundfile.write(path, signal, 22050, subtype="PCM_16")
+    expected = soundfile.read(path, dtype="int16")[0].T
+
+    audio, sr = io.load_audio_memmap(path)
+    assert sr == 22050
+    assert isinstance(audio, np.memmap)
+    assert audio.dtype == np.int16 and not audio.flags.writeable
+    assert np.array_equal(audio, expected)
+
+    segment, _ = io.load_audio_memmap(path, offset=0.05, duration=0.1)
+    assert isinstance(segment, np.memmap)
+    start = int(0.05 * sr)
+    assert np.array_equal(segment, expected[:, start : start + int(0.1 * sr)])
+    empty, _ = io.load_audio_memmap(path, offset=10.0)
+    assert empty.shape == (2, 0)
+    with pytest.raises(ValueError):
+        io.load_audio_memmap(path, offset=-0.05)
+    with pytest.raises(ValueError):
+        io.load_audio_memmap(path, duration=-0.1)
+
+    # compressed files are decoded
+    flac_path = str(tmpdir.join("stereo.flac"))
+    soundfile.write(flac_path, signal, 22050, subtype="PCM_16")
+    decoded, _ = io.load_audio_memmap(flac_path, offset=0.05, duration=0.1)
+    assert not isinstance(decoded, np.memmap)
+    assert decoded.dtype == np.float32
+    # libsndfile rounds float samples differently when writing flac
+    assert np.allclose(decoded * 32768, segment, atol=1)
+
+
+def test_load_audio_segment():
+    audio_file = "tests/resources/mir_datasets/beatles/audio/01_-_Please_Please_Me/11_-_Do_You_Want_To_Know_A_Secret.wav"
+    full, sr = io.load_audio_segment(audio_file)
+    segment, segment_sr = io.load_audio_segment(audio_file, offset=0.5, duration=0.25)
+    assert segment_sr == sr
+    start = int(0.5 * sr)
+    assert segment.shape[-1] == int(0.25 * sr)
+    assert np.allclose(segment, full[..., start : start + segment.shape[-1]])
+
+    # until the end of the file
+    tail, _ = io.load_audio_segment(audio_file, offset=1.0)
+    assert tail.shape[-1] == full.shape[-1] - int(1.0 * sr)
+
+    mono, mono_sr = io.load_audio_segment(
+        audio_file, offset=0.5, duration=0.25, sr=8000, mono=True
+    )
+    assert mono_sr == 8000
+    assert mono.ndim == 1
+    assert abs(len(mono) - 0.25 * 8000) <= 1
+
+    with open(audio_file, "rb") as fhandle:
+        from_handle, _ = io.load_audio_segment(
+            BytesIO(fhandle.read()), offset=0.5, duration=0.25
+        )
+    assert np.allclose(from_handle, segment)
+    assert io.load_audio_segment(None) is None
+
+    segment_int16, _ = io.load_audio_segment(
+        audio_file, offset=0.5, duration=0.25, dtype="int16"
+    )
+    assert segment_int16.dtype == np.int16
+    assert np.allclose(segment_int16 / 32768.0, segment)
@@ -1,4 +1,5 @@
 import importlib
+from collections.abc import Mapping
 import inspect
 import io
 import os
@@ -106,17 +107,18 @@ def test_smart_open():
         # if open is called, make sure smart open is imported
         not_overwritten_message = (
             f"{dataset_name} uses open, but does not overwrite it with smart_open. "
-            + "Add the line `from smart_open import open` to the top of the module."
+            + "Add the line `from mirdata.lazy import open` to the top of the module."
         )
         overwritten_wrong_message = (
             f"{dataset_name} overwrites open using something other than smart_open. "
-            + "Add the line `from smart_open import open` to the top of the module."
+            + "Add the line `from mirdata.lazy import open` to the top of the module."
         )
         if "open(" in code_lines:
             assert hasattr(dataset_module, "open"), not_overwritten_message
-            assert (
-                dataset_module.open.__module__ == "smart_open.smart_open_lib"
-            ), overwritten_wrong_message
+            assert dataset_module.open.__module__ in [
+                "mirdata.lazy",
+                "smart_open.smart_open_lib",
+            ], overwritten_wrong_message
 
 
 def test_cite_and_license():
@@ -254,8 +256,8 @@ def test_load_and_trackids():
                 assert False, "{}: {}".format(dataset_name, sys.exc_info()[0])
 
             assert isinstance(
-                dataset_data, dict
-            ), "{}.load should return a dictionary".format(dataset_name)
+                dataset_data, Mapping
+            ), "{}.load should return a mapping".format(dataset_name)
             assert len(dataset_data.keys()) == trackid_len, (
                 "the dictionary returned {}.load() does not have the same number of elements as"
                 " {}.track_ids()".format(dataset_name, dataset_name)
@@ -422,6 +424,27 @@ def test_load_methods():
                     load_method("a/fake/filepath")
 
 
+def test_load_audio_segments():
+    for dataset_name in DATASETS:
+        dataset_module = importlib.import_module(f"mirdata.datasets.{dataset_name}")
+        for method_name in dir(dataset_module):
+            load_method = getattr(dataset_module, method_name)
+            if not (
+                method_name.startswith("load_")
+                and "audio" in method_name
+                and inspect.isfunction(load_method)
+                and load_method.__module__ == dataset_module.__name__
+                and "io.load_audio(" in inspect.getsource(load_method)
+            ):
+                continue
+            parameters = inspect.signature(load_method).parameters
+            assert (
+                "offset" in parameters and "duration" in parameters
+            ), "mirdata.datasets.{}.{} should take offset and duration".format(
+                dataset_name, method_name
+            )
+
+
 CUSTOM_TEST_MTRACKS = {}
 
 
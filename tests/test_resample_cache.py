@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+import pytest
+import soundfile
+
+import mirdata
+from mirdata import io, resample_cache
+
+
+@pytest.fixture
+def cache(tmpdir):
+    cache = resample_cache.enable(str(tmpdir.join("cache")))
+    yield cache
+    resample_cache.disable()
+
+
+@pytest.fixture
+def audio_file(tmpdir):
+    path = str(tmpdir.join("stereo.wav"))
+    signal = np.random.RandomState(0).uniform(-0.5, 0.5, size=(4410, 2))
+    soundfile.write(path, signal, 22050)
+    return path
+
+
+def test_cached_resample(cache, audio_file, mocker):
+    audio, sr = io.load_audio(audio_file, sr=8000, mono=True)
+    assert cache.misses == 1 and cache.hits == 0
+
+    # a hit neither decodes nor resamples the audio again
+    read_soundfile = mocker.spy(io, "_read_soundfile")
+    cached_audio, cached_sr = io.load_audio(audio_file, sr=8000, mono=True)
+    assert cache.hits == 1
+    assert read_soundfile.call_count == 0
+    assert cached_sr == sr
+    assert np.array_equal(cached_audio, audio)
+
+    # open files, other dtypes and other processes use the same entry
+    with open(audio_file, "rb") as fhandle:
+        io.load_audio(fhandle, sr=8000, mono=True)
+    cached_int16, _ = io.load_audio(audio_file, sr=8000, mono=True, dtype="int16")
+    assert cached_int16.dtype == np.int16
+    other = resample_cache.enable(cache.root)
+    assert np.array_equal(io.load_audio(audio_file, sr=8000, mono=True)[0], audio)
+    assert other.hits == 1 and cache.hits == 3
+
+    # other sample rates and channels are separate entries
+    stereo, _ = io.load_audio(audio_file, sr=8000, mono=False)
+    assert stereo.shape[0] == 2
+    assert other.misses == 1
+
+    # segments and audio which is not resampled are neither looked up nor
+    # stored, and files at the target sample rate are not hashed
+    checksum = mocker.spy(resample_cache, "file_checksum")
+    io.load_audio(audio_file, sr=8000, mono=True, offset=0.1)
+    io.load_audio(audio_file, sr=22050, mono=True)
+    io.load_audio(audio_file, mono=True)
+    assert other.hits == 1 and other.misses == 1
+    assert checksum.call_count == 0
+
+    # misses are counted when they are looked up
+    mocker.patch.object(other, "write")
+    io.load_audio(audio_file, sr=16000, mono=True)
+    assert other.misses == 2
+
+    other.clear()
+    assert not any(files for _, _, files in os.walk(other.root))
+
+
+def test_cache_key(cache, audio_file):
+    key = cache.key(audio_file, 8000, True)
+    assert cache.key(audio_file, 8000.0, True) == key
+    assert cache.key(audio_file, 16000, True) != key
+    assert cache.key(audio_file, 8000, False) != key
+
+    # editing the file changes the key
+    soundfile.write(audio_file, np.zeros((100, 2)), 22050)
+    os.utime(audio_file, ns=(0, 0))
+    assert cache.key(audio_file, 8000, True) != key
+
+
+def test_cached_track(cache):
+    data_home = "tests/resources/mir_datasets/cante100"
+    dataset = mirdata.initialize("cante100", data_home=data_home, version="test")
+    audio, sr = dataset.track("008").audio
+    cached_audio, cached_sr = dataset.track("008").audio
+    assert cache.misses == 1 and cache.hits == 1
+    assert sr == cached_sr == 22050
+    assert np.array_equal(cached_audio, audio)
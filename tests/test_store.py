@@ -0,0 +1,137 @@
+import json
+import os
+
+import pytest
+
+from mirdata import core, download_utils, store, validate
+
+FILES = {"audio/a.wav": b"aaaa", "audio/b.wav": b"bbbbbb", "meta.csv": b"id\n"}
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as fhandle:
+        fhandle.write(data)
+
+
+def _checksum(path):
+    return validate.md5(path)
+
+
+@pytest.mark.parametrize("link", ["hardlink", "symlink"])
+def test_content_store(tmpdir, link):
+    content_store = store.ContentStore(str(tmpdir.join("store")), link=link)
+    data_home = str(tmpdir.join("data_home"))
+    path = os.path.join(data_home, "a.wav")
+    _write(path, b"aaaa")
+    checksum = _checksum(path)
+
+    assert not content_store.has(checksum)
+    assert not content_store.add(path, "wrongchecksum")
+    assert content_store.add(path, checksum)
+    assert content_store.has(checksum)
+    assert content_store.is_linked(path, checksum)
+    assert os.path.samefile(path, content_store.blob_path(checksum))
+    assert os.path.islink(path) == (link == "symlink")
+    with open(path, "rb") as fhandle:
+        assert fhandle.read() == b"aaaa"
+
+    # identical files are stored once
+    other_path = os.path.join(data_home, "copy", "a.wav")
+    _write(other_path, b"aaaa")
+    assert content_store.add(other_path, checksum)
+    assert os.path.samefile(other_path, path)
+
+    # the manifest of verified blobs persists
+    content_store.save()
+    reloaded = store.ContentStore(content_store.root, link=link)
+    assert reloaded.is_linked(path, checksum)
+
+    # a modified blob is not trusted, and removed if it is corrupted
+    with open(content_store.blob_path(checksum), "wb") as fhandle:
+        fhandle.write(b"corrupted")
+    assert not reloaded.is_linked(path, checksum)
+    assert not reloaded.has(checksum)
+    assert not os.path.exists(content_store.blob_path(checksum))
+
+    with pytest.raises(ValueError):
+        store.ContentStore(content_store.root, link="copy")
+
+
+def _make_dataset(tmpdir, data_home):
+    sources = str(tmpdir.join("sources"))
+    index = {"version": "1.0", "metadata": {}, "tracks": {}}
+    for name, data in FILES.items():
+        _write(os.path.join(sources, name), data)
+    checksums = {name: _checksum(os.path.join(sources, name)) for name in FILES}
+    index["metadata"]["meta"] = ["meta.csv", checksums["meta.csv"]]
+    for track_id in ["a", "b"]:
+        name = "audio/{}.wav".format(track_id)
+        index["tracks"][track_id] = {"audio": [name, checksums[name]]}
+    index_path = str(tmpdir.join("index.json"))
+    with open(index_path, "w") as fhandle:
+        json.dump(index, fhandle)
+
+    dataset = core.Dataset(
+        data_home=data_home,
+        name="test_dataset",
+        indexes={"default": "1.0", "1.0": core.Index("index.json")},
+        remotes={
+            "all": download_utils.RemoteFileMetadata(
+                filename="all.zip", url="a", checksum="b"
+            )
+        },
+    )
+    dataset.index_path = index_path
+    return dataset, sources
+
+
+def test_dataset_download_with_store(tmpdir, mocker):
+    store_root = str(tmpdir.join("store"))
+    extracted = []
+
+    def fake_downloader(save_dir, extract_paths=None, **kwargs):
+        extracted.append(extract_paths)
+        for name in extract_paths:
+            with open(os.path.join(sources, name), "rb") as fhandle:
+                _write(os.path.join(save_dir, name), fhandle.read())
+
+    downloader = mocker.patch.object(
+        download_utils, "downloader", side_effect=fake_downloader
+    )
+
+    # the first download extracts every file, and adds them to the store
+    data_home_1 = str(tmpdir.join("data_home_1"))
+    dataset_1, sources = _make_dataset(tmpdir, data_home_1)
+    dataset_1.download(store=store_root)
+    assert extracted == [set(FILES)]
+
+    # the second download links every file from the store
+    data_home_2 = str(tmpdir.join("data_home_2"))
+    dataset_2, _ = _make_dataset(tmpdir, data_home_2)
+    dataset_2.download(store=store_root)
+    assert downloader.call_count == 1
+    for name in FILES:
+        assert os.path.samefile(
+            os.path.join(data_home_1, name), os.path.join(data_home_2, name)
+        )
+
+    # files missing from the store are the only ones extracted
+    os.remove(
+        store.ContentStore(store_root).blob_path(
+            _checksum(os.path.join(sources, "audio/b.wav"))
+        )
+    )
+    data_home_3 = str(tmpdir.join("data_home_3"))
+    dataset_3, _ = _make_dataset(tmpdir, data_home_3)
+    dataset_3.download(store=store_root, track_ids=["b"])
+    assert extracted[-1] == {"audio/b.wav"}
+    assert not os.path.exists(os.path.join(data_home_3, "audio", "a.wav"))
+
+    # validate trusts files linked to verified blobs
+    md5 = mocker.spy(validate, "md5")
+    missing, invalid = dataset_2.validate(verbose=False, store=store_root)
+    assert missing["tracks"] == {} and invalid["tracks"] == {}
+    assert md5.call_count == 1  # audio/b.wav, whose blob was replaced
+    dataset_2.validate(verbose=False, store=store_root, force=True)
+    assert md5.call_count == 1 + len(FILES)
@@ -1,6 +1,8 @@
+import copy
 import itertools
 import json
 import os
+import shutil
 import types
 
 import mirdata
@@ -129,13 +131,14 @@ def test_md5(mocker):
         ),
     ],
 )
-def test_validate_index(test_index, expected_missing, expected_inv_checksum):
+@pytest.mark.parametrize("workers", [1, 4])
+def test_validate_index(test_index, expected_missing, expected_inv_checksum, workers):
     index_path = os.path.join(os.path.normpath("tests/indexes"), test_index)
     with open(index_path, "r") as index_file:
         test_index = json.load(index_file)
 
     missing_files, invalid_checksums = validate.validate_index(
-        test_index, os.path.normpath("tests/resources/")
+        test_index, os.path.normpath("tests/resources/"), workers=workers
     )
 
     assert expected_missing == missing_files
@@ -174,4 +177,137 @@ def test_validator(mocker, mock_validate_index, missing_files, invalid_checksums
     m, c = validate.validator("foo", "bar", False)
     assert m == missing_files
     assert c == invalid_checksums
-    mock_validate_index.assert_called_once_with("foo", "bar", False)
+    mock_validate_index.assert_called_once_with(
+        "foo", "bar", False, workers=1, manifest=None, mode="full", sample_fraction=0.1
+    )
+
+
+def test_validate_workers():
+    # validating with several workers gives the same output, in the same order
+    dataset = mirdata.initialize(
+        "beatles", data_home="tests/resources/mir_datasets/beatles", version="test"
+    )
+    expected_missing, expected_invalid = dataset.validate(verbose=False)
+    missing, invalid = dataset.validate(verbose=False, workers=4)
+    assert missing == expected_missing
+    assert invalid == expected_invalid
+    for group in expected_missing:
+        assert list(missing[group].keys()) == list(expected_missing[group].keys())
+
+
+def _valid_beatles(tmpdir):
+    # the beatles test index has missing files and stale checksums: keep the
+    # files which exist, with their actual checksums
+    data_home = str(tmpdir.join("beatles"))
+    shutil.copytree("tests/resources/mir_datasets/beatles", data_home)
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+    dataset.validate(verbose=False)
+    assert not os.path.exists(os.path.join(data_home, validate.MANIFEST_FILENAME))
+    index = copy.deepcopy(dict(dataset._index))
+    for files in index["tracks"].values():
+        for key, (path, _) in list(files.items()):
+            local_path = os.path.join(data_home, path or "")
+            if path is not None and os.path.exists(local_path):
+                files[key] = [path, validate.md5(local_path)]
+            else:
+                del files[key]
+    dataset._index = index
+    return dataset, data_home
+
+
+def test_validate_manifest(tmpdir, mocker):
+    dataset, data_home = _valid_beatles(tmpdir)
+    expected = dataset.validate(verbose=False, force=True)
+    assert os.path.exists(os.path.join(data_home, validate.MANIFEST_FILENAME))
+    n_files = len(validate.load_manifest(data_home))
+    assert n_files > 0
+
+    # unchanged files are not hashed again
+    md5 = mocker.spy(validate, "md5")
+    assert dataset.validate(verbose=False) == expected
+    assert md5.call_count == 0
+
+    # modified files are, and a failed validation doesn't update the manifest
+    track = dataset.track(dataset.track_ids[0])
+    manifest_path = os.path.join(data_home, validate.MANIFEST_FILENAME)
+    with open(manifest_path) as fhandle:
+        manifest = fhandle.read()
+    with open(track.beats_path, "ab") as fhandle:
+        fhandle.write(b"0")
+    _, invalid = dataset.validate(verbose=False)
+    assert invalid["tracks"] == {track.track_id: [track.beats_path]}
+    assert md5.call_count == 1
+    with open(manifest_path) as fhandle:
+        assert fhandle.read() == manifest
+
+    # force hashes everything
+    md5.reset_mock()
+    dataset.validate(verbose=False, force=True)
+    assert md5.call_count == n_files
+
+
+def test_validate_modes(tmpdir, mocker):
+    data_home = str(tmpdir.join("beatles"))
+    shutil.copytree("tests/resources/mir_datasets/beatles", data_home)
+    dataset = mirdata.initialize("beatles", data_home=data_home, version="test")
+    index = validate.add_file_sizes(copy.deepcopy(dataset._index), data_home)
+    track = dataset.track(dataset.track_ids[0])
+    entry = index["tracks"][track.track_id]["beat"]
+    assert entry[2] == os.path.getsize(track.beats_path)
+
+    md5 = mocker.spy(validate, "md5")
+    missing, invalid = validate.validator(index, data_home, False, mode="quick")
+    assert md5.call_count == 0
+    assert missing == dataset.validate(verbose=False)[0]
+    assert invalid == {"tracks": {}}
+
+    # a file with the wrong size is reported, without being read
+    with open(track.beats_path, "ab") as fhandle:
+        fhandle.write(b"0")
+    md5.reset_mock()
+    missing, invalid = validate.validator(index, data_home, False, mode="quick")
+    assert md5.call_count == 0
+    assert invalid == {"tracks": {track.track_id: [track.beats_path]}}
+
+    n_files = sum(
+        entry[0] is not None and os.path.exists(os.path.join(data_home, entry[0]))
+        for files in index["tracks"].values()
+        for entry in files.values()
+    )
+    md5.reset_mock()
+    validate.validator(index, data_home, False, mode="sample", sample_fraction=0.5)
+    assert 0 < md5.call_count < n_files
+
+    with pytest.raises(ValueError):
+        dataset.validate(verbose=False, mode="not-a-mode")
+
+
+def test_add_file_sizes_missing(tmpdir, caplog):
+    with open(str(tmpdir.join("a.txt")), "w") as fhandle:
+        fhandle.write("abc")
+    index = {
+        "metadata": {"meta": [None, None]},
+        "tracks": {"a": {"text": ["a.txt", "1234"], "audio": ["a.wav", "5678"]}},
+    }
+    index = validate.add_file_sizes(index, str(tmpdir))
+    assert index["tracks"]["a"] == {
+        "text": ["a.txt", "1234", 3],
+        "audio": ["a.wav", "5678"],
+    }
+    assert "1 indexed files are missing" in caplog.text
+    assert "a.wav" in caplog.text
+
+
+def test_validate_modes_remote(mocker):
+    index = {"tracks": {"a": {"audio": ["a.wav", "1234", 10]}}}
+    stat = mocker.spy(validate.os, "stat")
+    for mode in ["quick", "sample"]:
+        with pytest.raises(ValueError, match="local data_home"):
+            validate.validator(index, "s3://bucket/dataset", False, mode=mode)
+    assert stat.call_count == 0
+
+    # full validation reads remote files through smart_open
+    mocker.patch.object(validate, "md5", return_value="1234")
+    mocker.patch.object(validate, "open", mocker.mock_open())
+    missing, invalid = validate.validator(index, "s3://bucket/dataset", False)
+    assert missing == {"tracks": {}} and invalid == {"tracks": {}}